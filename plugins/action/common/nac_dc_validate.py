@@ -29,7 +29,7 @@ from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleError
 
 try:
-    from nac_yaml.yaml import load_yaml_files
+    import nac_yaml.yaml  # noqa: F401
 except ImportError as imp_yaml_exc:
     NAC_YAML_IMPORT_ERROR = imp_yaml_exc
 else:
@@ -44,7 +44,10 @@ else:
     NAC_VALIDATE_IMPORT_ERROR = None
 
 import os
+import tempfile
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import data_model_key_check
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.model_loader import ModelLoader
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.validate_rules import RuleEngine
 
 display = Display()
 
@@ -65,6 +68,7 @@ class ActionModule(ActionBase):
         schema = self._task.args.get('schema')
         rules = self._task.args.get('rules')
         mdata = self._task.args.get('mdata')
+        model_files_path = self._task.args.get('model_files_path')
 
         # Generate a warning if the Schema and Rules are not provided
         if 'schema' in locals() and (schema == "" or not os.path.exists(schema)):
@@ -93,7 +97,7 @@ class ActionModule(ActionBase):
         if rules and task_vars['role_path'] in rules:
             # Load in-memory data model using iac-validate
             # Perform the load in this if block to avoid loading the data model multiple times when custom enhanced rules are provided
-            results['data'] = load_yaml_files([mdata])
+            results['data'] = self._load_model(mdata, task_vars)
             data_model_loaded = results['data']
 
             # Introduce common directory to the rules list by default once vrf and network rules are updated
@@ -158,21 +162,40 @@ class ActionModule(ActionBase):
             # Else block to pickup custom enhanced rules provided by the user
             rules_list.append(f'{rules}')
 
+        if not rules_list:
+            return results
+
+        # Load the schema once for syntax validation and for the rules that receive it.
+        # RuleEngine loads the rules of each directory, so the Validator gets an empty
+        # rules directory instead of importing the rules again (nac-validate's default
+        # rules path would resolve against the working directory).
+        with tempfile.TemporaryDirectory() as no_rules:
+            validator = nac_validate.validator.Validator(schema, no_rules)
+
+        engine = None
         syntax_validated = False
         for rules_item in rules_list:
-            validator = nac_validate.validator.Validator(schema, rules_item)
+            errors = []
             if schema and not syntax_validated and validator.schema is not None:
                 validator.validate_syntax([mdata])
+                errors.extend(validator.errors)
                 syntax_validated = True
             if rules_item:
                 if data_model_loaded is None:
-                    data_model_loaded = load_yaml_files([mdata])
+                    data_model_loaded = self._load_model(mdata, task_vars)
                     results['data'] = data_model_loaded
-                validator.data = data_model_loaded
-                validator.validate_semantics([mdata])
+                if engine is None:
+                    engine = RuleEngine(
+                        data_model_loaded,
+                        schema=validator.schema,
+                        schema_path=schema,
+                        cache_path=self._cache_path(model_files_path, mdata, data_model_loaded, task_vars),
+                        reuse=not task_vars.get('force_run_all', False),
+                        workers=task_vars.get('validate_workers', 1))
+                errors.extend(engine.validate(rules_item))
 
             msg = ""
-            for error in validator.errors:
+            for error in errors:
                 msg += error + "\n"
 
             if msg:
@@ -180,4 +203,27 @@ class ActionModule(ActionBase):
                 results['msg'] = msg
                 break
 
+        if engine is not None:
+            engine.save()
+            if engine.reused:
+                display.v(f"VALIDATE [{os.path.basename(os.path.normpath(mdata))}] Reused cached results of {len(engine.reused)} rules")
+
         return results
+
+    @staticmethod
+    def _load_model(mdata, task_vars):
+        """Load the fabric data model, reusing the files parsed by previous runs and tasks."""
+        cache_path = None
+        if task_vars.get('validate_yaml_cache', True):
+            cache_path = ModelLoader.cache_path_for(mdata)
+        return ModelLoader(cache_path).load([mdata])
+
+    @staticmethod
+    def _cache_path(model_files_path, mdata, data_model, task_vars):
+        """Rule result cache file of the fabric, or None when caching is disabled."""
+        if not model_files_path or not task_vars.get('validate_incremental', True):
+            return None
+        fabric_name = (((data_model or {}).get('vxlan') or {}).get('fabric') or {}).get('name')
+        if not isinstance(fabric_name, str) or not fabric_name:
+            fabric_name = os.path.basename(os.path.normpath(mdata))
+        return os.path.join(model_files_path, f"{fabric_name}_validate_cache.json")
@@ -25,16 +25,19 @@ from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_function
 class PreparePlugin:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'fabric'],
+            ['vxlan', 'topology'],
+            ['vxlan', 'policy', 'switches'],
+        ]
 
     def prepare(self):
         data_model = self.kwargs['results']['model_extended']
+        topology_index = self.kwargs['topology_index']
 
         # This plugin does not apply to the follwing fabric types
         if data_model['vxlan']['fabric']['type'] in ['MSD', 'MCFG']:
             return self.kwargs['results']
-        else:
-            switches = data_model['vxlan']['topology']['switches']
 
         #  Loop over all the roles in vxlan.topology.switches.role
         data_model['vxlan']['topology']['spine'] = {}
@@ -62,7 +65,7 @@ class PreparePlugin:
             data_model['vxlan']['topology'][role][name][v4_key] = v4ip
             data_model['vxlan']['topology'][role][name][v6_key] = v6ip
 
-        data_model = hostname_to_ip_mapping(data_model)
+        data_model = hostname_to_ip_mapping(data_model, topology_index)
 
         # Check for vpc_peers in the data model
         # If found, update the data model with the management IP address of the peer switches
@@ -137,18 +140,10 @@ class PreparePlugin:
             #     }
             # ]
             for vpc_peers_pair in vpc_peers_pairs:
-                if any(sw['name'] == vpc_peers_pair['peer1'] for sw in switches):
-                    found_switch = next((item for item in switches if item["name"] == vpc_peers_pair['peer1']))
-                    if found_switch.get('management').get('management_ipv4_address'):
-                        vpc_peers_pair['peer1_mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-                    elif found_switch.get('management').get('management_ipv6_address'):
-                        vpc_peers_pair['peer1_mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
-                if any(sw['name'] == vpc_peers_pair['peer2'] for sw in switches):
-                    found_switch = next((item for item in switches if item["name"] == vpc_peers_pair['peer2']))
-                    if found_switch.get('management').get('management_ipv4_address'):
-                        vpc_peers_pair['peer2_mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-                    elif found_switch.get('management').get('management_ipv6_address'):
-                        vpc_peers_pair['peer2_mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
+                for peer in ('peer1', 'peer2'):
+                    mgmt_ip_address = topology_index.mgmt_ip(vpc_peers_pair[peer])
+                    if mgmt_ip_address:
+                        vpc_peers_pair[f'{peer}_mgmt_ip_address'] = mgmt_ip_address
 
         # Check for fabric_links in the data model
         # If found, update the data model with the management IP address of the switches for templating later.
@@ -160,18 +155,10 @@ class PreparePlugin:
             # Similar before and after transformation as above with vpc_peers
             # source_device_mgmt_ip_address and dest_device_mgmt_ip_address are added to the fabric_links part of the model
             for fabric_link in fabric_links:
-                if any(sw['name'] == fabric_link['source_device'] for sw in switches):
-                    found_switch = next((item for item in switches if item["name"] == fabric_link['source_device']))
-                    if found_switch.get('management').get('management_ipv4_address'):
-                        fabric_link['source_device_mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-                    elif found_switch.get('management').get('management_ipv6_address'):
-                        fabric_link['source_device_mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
-                if any(sw['name'] == fabric_link['dest_device'] for sw in switches):
-                    found_switch = next((item for item in switches if item["name"] == fabric_link['dest_device']))
-                    if found_switch.get('management').get('management_ipv4_address'):
-                        fabric_link['dest_device_mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-                    elif found_switch.get('management').get('management_ipv6_address'):
-                        fabric_link['dest_device_mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
+                for device in ('source_device', 'dest_device'):
+                    mgmt_ip_address = topology_index.mgmt_ip(fabric_link[device])
+                    if mgmt_ip_address:
+                        fabric_link[f'{device}_mgmt_ip_address'] = mgmt_ip_address
 
         self.kwargs['results']['model_extended'] = data_model
 
@@ -25,10 +25,16 @@ from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_function
 class PreparePlugin:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'fabric'],
+            ['vxlan', 'topology', 'switches'],
+            ['vxlan', 'topology', 'tor_peers'],
+            ['vxlan', 'overlay'],
+        ]
 
     def prepare(self):
         data_model = self.kwargs['results']['model_extended']
+        topology_index = self.kwargs['topology_index']
 
         # We don't have switches for Multisite fabrics so need special handling
         if data_model['vxlan']['fabric']['type'] in ('MSD', 'MCFG'):
@@ -50,12 +56,9 @@ class PreparePlugin:
                     data_model['vxlan']['overlay']['vrf_attach_groups_dict'][grp['name']].append(switch)
                 # If the switch is in the switch list and a hostname is used, replace the hostname with the management IP
                 for switch in data_model['vxlan']['overlay']['vrf_attach_groups_dict'][grp['name']]:
-                    if any(sw['name'] == switch['hostname'] for sw in switches):
-                        found_switch = next((item for item in switches if item["name"] == switch['hostname']))
-                        if found_switch.get('management').get('management_ipv4_address'):
-                            switch['mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-                        elif found_switch.get('management').get('management_ipv6_address'):
-                            switch['mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
+                    mgmt_ip_address = topology_index.mgmt_ip(switch['hostname'])
+                    if mgmt_ip_address:
+                        switch['mgmt_ip_address'] = mgmt_ip_address
 
             # Remove vrf_attach_group from vrf if the group_name is not defined
             for vrf in data_model['vxlan']['overlay']['vrfs']:
@@ -80,23 +83,16 @@ class PreparePlugin:
                     data_model['vxlan']['overlay']['network_attach_groups_dict'][grp['name']].append(switch)
                 # If the switch is in the switch list and a hostname is used, replace the hostname with the management IP
                 for switch in data_model['vxlan']['overlay']['network_attach_groups_dict'][grp['name']]:
-                    if any(sw['name'] == switch['hostname'] for sw in switches):
-                        found_switch = next((item for item in switches if item["name"] == switch['hostname']))
-                        if found_switch.get('management').get('management_ipv4_address'):
-                            switch['mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-                        elif found_switch.get('management').get('management_ipv6_address'):
-                            switch['mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
+                    mgmt_ip_address = topology_index.mgmt_ip(switch['hostname'])
+                    if mgmt_ip_address:
+                        switch['mgmt_ip_address'] = mgmt_ip_address
 
                     # Process nested TOR entries and resolve their management IPs
                     if 'tors' in switch and switch['tors']:
                         for tor in switch['tors']:
-                            tor_hostname = tor.get('hostname')
-                            if tor_hostname and any(sw['name'] == tor_hostname for sw in switches):
-                                found_tor = next((item for item in switches if item["name"] == tor_hostname))
-                                if found_tor.get('management').get('management_ipv4_address'):
-                                    tor['mgmt_ip_address'] = found_tor['management']['management_ipv4_address']
-                                elif found_tor.get('management').get('management_ipv6_address'):
-                                    tor['mgmt_ip_address'] = found_tor['management']['management_ipv6_address']
+                            tor_mgmt_ip_address = topology_index.mgmt_ip(tor.get('hostname'))
+                            if tor_mgmt_ip_address:
+                                tor['mgmt_ip_address'] = tor_mgmt_ip_address
 
             # Remove network_attach_group from net if the group_name is not defined
             for net in data_model['vxlan']['overlay']['networks']:
@@ -21,13 +21,46 @@
 
 # Count interfaces of different types and expose in extended service model for controls within playbooks
 #
+# Also partition the interfaces of every switch, in one pass, into the render buckets of the
+# dtc/common ndfc_interfaces templates under vxlan.topology.interfaces.by_type.<bucket>.
+# Each entry points at the switch (and interface or breakout) by list position and carries the
+# management IP the templates render for the switch, so each template walks its own bucket
+# instead of every switch and interface:
+#
+#   by_type:
+#     access:
+#       - switch: 0
+#         interface: 3
+#         mgmt_ip_address: 10.1.1.11
+#     breakout:
+#       - switch: 2
+#         breakout: 0
+#         mgmt_ip_address: 10.1.1.13
+#
 import re
 
+from ansible.plugins.filter.core import to_bool
+
+# Match interface names like 'lo<ID>' or 'loopback<ID>', where <ID> is an integer
+LOOPBACK_REGEX = re.compile(r'^(lo|loopback)(\d+)$', re.IGNORECASE)
+
+# Render buckets, one per ndfc_interfaces template (vPC interfaces are grouped by prep_107)
+INTERFACE_BUCKETS = [
+    'access', 'access_po', 'dot1q', 'trunk', 'trunk_po',
+    'routed', 'routed_po', 'routed_sub', 'loopback',
+    'breakout', 'breakout_preprov',
+]
+
 
 class PreparePlugin:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'fabric'],
+            ['vxlan', 'underlay', 'general'],
+            ['vxlan', 'topology', 'switches'],
+            ['vxlan', 'topology', 'interfaces'],
+        ]
         # interface modes which are a direct match
         self.mode_direct = ['routed', 'routed_po', 'routed_sub', 'loopback', 'fabric_loopback', 'mpls_loopback']
         # interface modes which need additional validation
@@ -42,93 +75,111 @@ class PreparePlugin:
 
         data_model['vxlan']['topology']['interfaces'] = {}
         data_model['vxlan']['topology']['interfaces']['modes'] = {}
+        modes = data_model['vxlan']['topology']['interfaces']['modes']
 
-        # Initialize breakout interfaces
-        data_model['vxlan']['topology']['interfaces']['modes']['breakout'] = {}
-        data_model['vxlan']['topology']['interfaces']['modes']['breakout']['count'] = 0
+        # Initialize breakout and breakout preprovisioned interfaces
+        # and loop through interface modes and initialize with interface count 0
+        for mode in ['breakout', 'breakout_preprov'] + self.mode_direct + self.mode_indirect:
+            modes[mode] = {}
+            modes[mode]['count'] = 0
 
-        # Initialize breakout preprovisioned interfaces
-        data_model['vxlan']['topology']['interfaces']['modes']['breakout_preprov'] = {}
-        data_model['vxlan']['topology']['interfaces']['modes']['breakout_preprov']['count'] = 0
+        data_model['vxlan']['topology']['interfaces']['by_type'] = {bucket: [] for bucket in INTERFACE_BUCKETS}
+        by_type = data_model['vxlan']['topology']['interfaces']['by_type']
 
         loopback_id = []
         if data_model['vxlan'].get('underlay', {}).get('general', {}).get('manual_underlay_allocation'):
             loopback_id.append(data_model['vxlan']['underlay']['general']['underlay_routing_loopback_id'])
             loopback_id.append(data_model['vxlan']['underlay']['general']['underlay_vtep_loopback_id'])
 
-        # loop through interface modes and initialize with interface count 0
-        for mode in self.mode_direct:
-            data_model['vxlan']['topology']['interfaces']['modes'][mode] = {}
-            data_model['vxlan']['topology']['interfaces']['modes'][mode]['count'] = 0
-        for mode in self.mode_indirect:
-            data_model['vxlan']['topology']['interfaces']['modes'][mode] = {}
-            data_model['vxlan']['topology']['interfaces']['modes'][mode]['count'] = 0
+        for switch_position, switch in enumerate(data_model.get('vxlan').get('topology').get('switches')):
+            mgmt_ip = self.mgmt_ip_entry(switch)
 
-        for switch in data_model.get('vxlan').get('topology').get('switches'):
             # loop through interfaces
-            for interface in switch.get('interfaces'):
-                # loop through interface modes direct and count
-                for interface_mode in self.mode_direct:
-                    # if interface mode is a direct match, then increment the count for that mode
-                    if interface_mode == interface.get('mode'):
-                        # Add special condition to exclude fabric loopback when manual_allocation is enabled
-                        # Match interface names like 'lo<ID>' or 'loopback<ID>', where <ID> is an integer
-                        loopback_regex = re.compile(r'^(lo|loopback)(\d+)$', re.IGNORECASE)
-                        if not (
-                            interface.get('mode') == 'fabric_loopback'
-                            and (
-                                loopback_regex.match(interface.get('name'))
-                                and int(loopback_regex.match(interface.get('name')).group(2)) in loopback_id
-                            )
-                        ):
-                            data_model['vxlan']['topology']['interfaces']['modes'][interface_mode]['count'] += 1
-                            data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                # loop through interface modes indirect along with additional validation and count
-                if interface.get('mode') == 'access':
-                    # if interface name starts with 'po' and has vpc_id, then it is a vpc access interface
-                    if interface.get('name').lower().startswith('po') and interface.get('vpc_id'):
-                        data_model['vxlan']['topology']['interfaces']['modes']['access_vpc']['count'] += 1
-                        data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                    # if interface name starts with 'po', then it is a port-channel access interface
-                    elif interface.get('name').lower().startswith('po'):
-                        data_model['vxlan']['topology']['interfaces']['modes']['access_po']['count'] += 1
-                        data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                    # else it is a regular access interface
-                    else:
-                        data_model['vxlan']['topology']['interfaces']['modes']['access']['count'] += 1
-                        data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                if interface.get('mode') == 'dot1q':
-                    data_model['vxlan']['topology']['interfaces']['modes']['dot1q']['count'] += 1
-                    data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                if interface.get('mode') == 'trunk':
-                    # if interface name starts with 'po' and has vpc_id, then it is a vpc trunk interface
-                    if interface.get('name').lower().startswith('po') and interface.get('vpc_id'):
-                        data_model['vxlan']['topology']['interfaces']['modes']['trunk_vpc']['count'] += 1
-                        data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                    # if interface name starts with 'po', then it is a port-channel trunk interface
-                    elif interface.get('name').lower().startswith('po'):
-                        data_model['vxlan']['topology']['interfaces']['modes']['trunk_po']['count'] += 1
-                        data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
-                    # else it is a regular trunk interface
-                    else:
-                        data_model['vxlan']['topology']['interfaces']['modes']['trunk']['count'] += 1
-                        data_model['vxlan']['topology']['interfaces']['modes']['all']['count'] += 1
+            for interface_position, interface in enumerate(switch.get('interfaces')):
+                count_mode = self.count_mode(interface, loopback_id)
+                if count_mode:
+                    modes[count_mode]['count'] += 1
+                    modes['all']['count'] += 1
+
+                bucket = self.interface_bucket(interface)
+                if bucket:
+                    by_type[bucket].append({'switch': switch_position, 'interface': interface_position, **mgmt_ip})
 
             if switch.get('interface_breakouts'):
-                for breakout in switch.get('interface_breakouts'):
+                for breakout_position, breakout in enumerate(switch.get('interface_breakouts')):
                     if breakout.get('enable_during_bootstrap') in [False, None]:
                         if breakout.get('to'):
                             nb_int = breakout['to'] - breakout['from']
-                            data_model['vxlan']['topology']['interfaces']['modes']['breakout']['count'] += nb_int + 1
+                            modes['breakout']['count'] += nb_int + 1
                         else:
-                            data_model['vxlan']['topology']['interfaces']['modes']['breakout']['count'] += 1
+                            modes['breakout']['count'] += 1
 
                     if breakout.get('enable_during_bootstrap') is True:
                         if breakout.get('to'):
                             nb_int = breakout['to'] - breakout['from']
-                            data_model['vxlan']['topology']['interfaces']['modes']['breakout_preprov']['count'] += nb_int + 1
+                            modes['breakout_preprov']['count'] += nb_int + 1
                         else:
-                            data_model['vxlan']['topology']['interfaces']['modes']['breakout_preprov']['count'] += 1
+                            modes['breakout_preprov']['count'] += 1
+
+                    # Same tests as the breakout templates: enable_during_bootstrap | default(false)
+                    # and enable_during_bootstrap is defined and enable_during_bootstrap | bool
+                    if not breakout.get('enable_during_bootstrap', False):
+                        by_type['breakout'].append({'switch': switch_position, 'breakout': breakout_position, **mgmt_ip})
+                    if 'enable_during_bootstrap' in breakout and to_bool(breakout['enable_during_bootstrap']):
+                        by_type['breakout_preprov'].append({'switch': switch_position, 'breakout': breakout_position, **mgmt_ip})
 
         self.kwargs['results']['model_extended'] = data_model
         return self.kwargs['results']
+
+    def count_mode(self, interface, loopback_id):
+        """Interface mode counter an interface is counted in, or None."""
+        interface_mode = interface.get('mode')
+        # if interface mode is a direct match, then count it for that mode
+        if interface_mode in self.mode_direct:
+            # Add special condition to exclude fabric loopback when manual_allocation is enabled
+            if interface_mode == 'fabric_loopback':
+                loopback_match = LOOPBACK_REGEX.match(interface.get('name'))
+                if loopback_match and int(loopback_match.group(2)) in loopback_id:
+                    return None
+            return interface_mode
+        # interface modes indirect along with additional validation
+        if interface_mode in ['access', 'trunk']:
+            # if interface name starts with 'po' and has vpc_id, then it is a vpc access/trunk interface
+            if interface.get('name').lower().startswith('po') and interface.get('vpc_id'):
+                return interface_mode + '_vpc'
+            # if interface name starts with 'po', then it is a port-channel access/trunk interface
+            if interface.get('name').lower().startswith('po'):
+                return interface_mode + '_po'
+            # else it is a regular access/trunk interface
+            return interface_mode
+        if interface_mode == 'dot1q':
+            return 'dot1q'
+        return None
+
+    @staticmethod
+    def interface_bucket(interface):
+        """Render bucket of an interface, using the tests of the ndfc_interfaces templates, or None."""
+        interface_mode = interface.get('mode')
+        if interface_mode in ['routed', 'routed_po', 'routed_sub']:
+            return interface_mode
+        if interface_mode in ['loopback', 'mpls_loopback', 'fabric_loopback']:
+            return 'loopback'
+        if interface_mode in ['access', 'trunk', 'dot1q']:
+            interface_name = str(interface.get('name')).lower()
+            if interface_name.startswith('e'):
+                return interface_mode
+            # vPC port-channels are rendered from vxlan.topology.interfaces.vpc_interfaces
+            if interface_mode != 'dot1q' and interface_name.startswith('po') and 'vpc_id' not in interface:
+                return interface_mode + '_po'
+        return None
+
+    @staticmethod
+    def mgmt_ip_entry(switch):
+        """Management IP the templates render for a switch: IPv4 when defined, else IPv6 when defined."""
+        management = switch.get('management')
+        if isinstance(management, dict):
+            if 'management_ipv4_address' in management:
+                return {'mgmt_ip_address': management['management_ipv4_address']}
+            if 'management_ipv6_address' in management:
+                return {'mgmt_ip_address': management['management_ipv6_address']}
+        return {}
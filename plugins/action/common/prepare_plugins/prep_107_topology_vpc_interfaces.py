@@ -26,7 +26,9 @@
 class PreparePlugin:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'topology'],
+        ]
 
     def prepare(self):
         data_model = self.kwargs['results']['model_extended']
@@ -19,40 +19,35 @@
 #
 # SPDX-License-Identifier: MIT
 
-from jinja2 import ChainableUndefined, Environment, FileSystemLoader
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import hostname_to_ip_mapping
-from ansible_collections.ansible.utils.plugins.filter import ipaddr, ipv4, ipv6
 
 
 class PreparePlugin:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'fabric'],
+            ['vxlan', 'global'],
+            ['vxlan', 'topology', 'switches'],
+            ['vxlan', 'overlay_extensions', 'vrf_lites'],
+            ['vxlan', 'policy'],
+        ]
 
     def prepare(self):
         data_model = self.kwargs['results']['model_extended']
+        topology_index = self.kwargs['topology_index']
 
         if data_model['vxlan']['fabric']['type'] == 'ISN':
             return self.kwargs['results']
 
-        templates_path = self.kwargs['templates_path']
+        prepare_templates = self.kwargs['prepare_templates']
         default_values = self.kwargs['default_values']
 
         template_filename = "ndfc_vrf_lite.j2"
-        # pylint: enable=unreachable
-        env = Environment(
-            loader=FileSystemLoader(templates_path),
-            undefined=ChainableUndefined,
-            lstrip_blocks=True,
-            trim_blocks=True,
-        )
-
-        env.filters["ipaddr"] = ipaddr.ipaddr
-        env.filters["ipv4"] = ipv4.ipv4
-        env.filters["ipv6"] = ipv6.ipv6
-        template = env.get_template(template_filename)
         if "overlay_extensions" in data_model["vxlan"]:
             if "vrf_lites" in data_model["vxlan"]["overlay_extensions"]:
+                # Complete every switch first, then render all of them in one batch
+                vrf_lite_switches = []
                 for vrf_lite in data_model["vxlan"]["overlay_extensions"]["vrf_lites"]:
                     ospf_enabled = True if vrf_lite.get(
                         "ospf") is not None else False
@@ -240,47 +235,50 @@ class PreparePlugin:
                                         if key not in switch_bgp_af:
                                             switch_bgp_af[key] = value
 
-                        output = template.render(
-                            data_model_extended=data_model, item=vrf_lite, switch_item=switch, defaults=default_values)
+                        vrf_lite_switches.append((vrf_lite, switch, unique_name))
 
-                        new_policy = {
-                            "name": unique_name,
-                            "template_name": "switch_freeform",
-                            "template_vars": {
-                                "CONF": output
-                            }
+                outputs = prepare_templates.render_many(
+                    template_filename,
+                    [{"item": vrf_lite, "switch_item": switch} for vrf_lite, switch, unique_name in vrf_lite_switches],
+                    data_model_extended=data_model,
+                    defaults=default_values)
+
+                for (vrf_lite, switch, unique_name), output in zip(vrf_lite_switches, outputs):
+                    new_policy = {
+                        "name": unique_name,
+                        "template_name": "switch_freeform",
+                        "template_vars": {
+                            "CONF": output
                         }
+                    }
 
-                        data_model["vxlan"]["policy"]["policies"].append(new_policy)
+                    data_model["vxlan"]["policy"]["policies"].append(new_policy)
 
-                        if any(sw['name'] == switch['name'] for sw in data_model["vxlan"]["policy"]["switches"]):
-                            found_switch = next(([idx, i] for idx, i in enumerate(
-                                data_model["vxlan"]["policy"]["switches"]) if i["name"] == switch['name']))
-                            if "groups" in found_switch[1].keys():
-                                data_model["vxlan"]["policy"]["switches"][found_switch[0]]["groups"].append(
-                                    unique_name)
-                            else:
-                                data_model["vxlan"]["policy"]["switches"][found_switch[0]]["groups"] = [
-                                    unique_name]
+                    found_switch = topology_index.policy_switch(switch['name'])
+                    if found_switch is not None:
+                        if "groups" in found_switch.keys():
+                            found_switch["groups"].append(unique_name)
                         else:
-                            new_switch = {
-                                "name": switch["name"],
-                                "groups": [unique_name]
-                            }
-                            data_model["vxlan"]["policy"]["switches"].append(
-                                new_switch)
+                            found_switch["groups"] = [unique_name]
+                    else:
+                        new_switch = {
+                            "name": switch["name"],
+                            "groups": [unique_name]
+                        }
+                        data_model["vxlan"]["policy"]["switches"].append(
+                            new_switch)
 
-                        if not any(group['name'] == vrf_lite['name'] for group in data_model["vxlan"]["policy"]["groups"]):
-                            new_group = {
-                                "name": unique_name,
-                                "policies": [
-                                    {"name": unique_name},
-                                ],
-                                "priority": 500
-                            }
-                            data_model["vxlan"]["policy"]["groups"].append(new_group)
+                    if not any(group['name'] == vrf_lite['name'] for group in data_model["vxlan"]["policy"]["groups"]):
+                        new_group = {
+                            "name": unique_name,
+                            "policies": [
+                                {"name": unique_name},
+                            ],
+                            "priority": 500
+                        }
+                        data_model["vxlan"]["policy"]["groups"].append(new_group)
 
-            data_model = hostname_to_ip_mapping(data_model)
+            data_model = hostname_to_ip_mapping(data_model, topology_index)
 
         self.kwargs['results']['model_extended'] = data_model
         return self.kwargs['results']
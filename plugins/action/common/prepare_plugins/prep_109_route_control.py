@@ -20,8 +20,6 @@
 # SPDX-License-Identifier: MIT
 
 import re
-from jinja2 import ChainableUndefined, Environment, FileSystemLoader
-from ansible_collections.ansible.utils.plugins.filter import ipaddr, hwaddr
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import hostname_to_ip_mapping, data_model_key_check
 
 
@@ -31,29 +29,25 @@ class PreparePlugin:
     """
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'fabric'],
+            ['vxlan', 'global'],
+            ['vxlan', 'topology', 'switches'],
+            ['vxlan', 'overlay_extensions', 'route_control'],
+            ['vxlan', 'policy'],
+        ]
 
     def prepare(self):
         """
         function to prepare data for route_control
         """
-        templates_path = self.kwargs['templates_path']
+        prepare_templates = self.kwargs['prepare_templates']
         data_model = self.kwargs['results']['model_extended']
+        topology_index = self.kwargs['topology_index']
         default_values = self.kwargs['default_values']
 
         template_filename = "ndfc_route_control.j2"
 
-        env = Environment(
-            loader=FileSystemLoader(templates_path),
-            undefined=ChainableUndefined,
-            lstrip_blocks=True,
-            trim_blocks=True,
-        )
-
-        env.filters["ipaddr"] = ipaddr.ipaddr
-        env.filters["hwaddr"] = hwaddr.hwaddr
-        template = env.get_template(template_filename)
-
         parent_keys = ['vxlan', 'overlay_extensions', 'route_control', 'route_maps']
         dm_check = data_model_key_check(data_model, parent_keys)
 
@@ -78,6 +72,8 @@ class PreparePlugin:
         parent_keys = ['vxlan', 'overlay_extensions', 'route_control']
         dm_check = data_model_key_check(data_model, parent_keys)
         if 'route_control' in dm_check['keys_data']:
+            # Collect every switch group first, then render all of them in one batch
+            switch_groups = []
             for route_control in data_model["vxlan"]["overlay_extensions"]["route_control"]:
                 if "switches" == route_control:
                     for switch in data_model["vxlan"]["overlay_extensions"]["route_control"]["switches"]:
@@ -87,52 +83,51 @@ class PreparePlugin:
                             for group_name in data_model["vxlan"]["overlay_extensions"]["route_control"]["groups"]:
                                 if sw_group == group_name["name"]:
                                     group_policies.append(group_name)
-
-                            output = template.render(
-                                data_model_extended=data_model,
-                                item=data_model["vxlan"]["overlay_extensions"]["route_control"],
-                                switch=switch['name'],
-                                group_item=group_policies,
-                                defaults=default_values)
-
-                            new_policy = {
-                                "name": unique_name,
-                                "template_name": "switch_freeform",
-                                "template_vars": {
-                                    "CONF": output
-                                }
-                            }
-
-                            if not any(policy['name'] == unique_name for policy in data_model["vxlan"]["policy"]["policies"]):
-                                data_model["vxlan"]["policy"]["policies"].append(new_policy)
-
-                            if any(sw['name'] == switch['name'] for sw in data_model["vxlan"]["policy"]["switches"]):
-                                found_switch = next(([idx, i] for idx, i in enumerate(
-                                    data_model["vxlan"]["policy"]["switches"]) if i["name"] == switch['name']))
-                                if "groups" in found_switch[1].keys():
-                                    data_model["vxlan"]["policy"]["switches"][found_switch[0]]["groups"].append(
-                                        unique_name)
-                                else:
-                                    data_model["vxlan"]["policy"]["switches"][found_switch[0]]["groups"] = [
-                                        unique_name]
-                            else:
-                                new_switch = {
-                                    "name": switch["name"],
-                                    "groups": [unique_name]
-                                }
-                                data_model["vxlan"]["policy"]["switches"].append(new_switch)
-
-                            if not any(group['name'] == unique_name for group in data_model["vxlan"]["policy"]["groups"]):
-                                new_group = {
-                                    "name": unique_name,
-                                    "policies": [
-                                        {"name": unique_name},
-                                    ],
-                                    "priority": 500
-                                }
-                                data_model["vxlan"]["policy"]["groups"].append(new_group)
-
-            data_model = hostname_to_ip_mapping(data_model)
+                            switch_groups.append((switch, unique_name, group_policies))
+
+            outputs = prepare_templates.render_many(
+                template_filename,
+                [{"switch": switch['name'], "group_item": group_policies} for switch, unique_name, group_policies in switch_groups],
+                data_model_extended=data_model,
+                item=data_model["vxlan"]["overlay_extensions"]["route_control"],
+                defaults=default_values)
+
+            for (switch, unique_name, group_policies), output in zip(switch_groups, outputs):
+                new_policy = {
+                    "name": unique_name,
+                    "template_name": "switch_freeform",
+                    "template_vars": {
+                        "CONF": output
+                    }
+                }
+
+                if not any(policy['name'] == unique_name for policy in data_model["vxlan"]["policy"]["policies"]):
+                    data_model["vxlan"]["policy"]["policies"].append(new_policy)
+
+                found_switch = topology_index.policy_switch(switch['name'])
+                if found_switch is not None:
+                    if "groups" in found_switch.keys():
+                        found_switch["groups"].append(unique_name)
+                    else:
+                        found_switch["groups"] = [unique_name]
+                else:
+                    new_switch = {
+                        "name": switch["name"],
+                        "groups": [unique_name]
+                    }
+                    data_model["vxlan"]["policy"]["switches"].append(new_switch)
+
+                if not any(group['name'] == unique_name for group in data_model["vxlan"]["policy"]["groups"]):
+                    new_group = {
+                        "name": unique_name,
+                        "policies": [
+                            {"name": unique_name},
+                        ],
+                        "priority": 500
+                    }
+                    data_model["vxlan"]["policy"]["groups"].append(new_group)
+
+            data_model = hostname_to_ip_mapping(data_model, topology_index)
         self.kwargs['results']['model_extended'] = data_model
         return self.kwargs['results']
 
@@ -35,7 +35,9 @@ class PreparePlugin:
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = ['vxlan', 'topology', 'tor_peers']
+        self.keys = [
+            ['vxlan', 'topology'],
+        ]
 
     def _get_switch(self, name, expected_role, switches, errors):
         """
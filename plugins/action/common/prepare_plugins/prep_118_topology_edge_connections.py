@@ -22,27 +22,26 @@
 class PreparePlugin:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.keys = []
+        self.keys = [
+            ['vxlan', 'fabric'],
+            ['vxlan', 'topology', 'switches'],
+            ['vxlan', 'topology', 'edge_connections'],
+        ]
 
     def prepare(self):
         data_model = self.kwargs['results']['model_extended']
+        topology_index = self.kwargs['topology_index']
 
         # This plugin does not apply to the follwing fabric types
         if data_model['vxlan']['fabric']['type'] in ['MSD', 'MCFG']:
             return self.kwargs['results']
-        else:
-            switches = data_model['vxlan']['topology']['switches']
 
         # Ensure that edge_connection's switches are mapping to their respective
         # management IP address from topology switches
-        topology_switches = data_model['vxlan']['topology']['switches']
         for link in data_model['vxlan']['topology']['edge_connections']:
-            if any(sw['name'] == link['source_device'] for sw in topology_switches):
-                found_switch = next((item for item in topology_switches if item["name"] == link['source_device']))
-                if found_switch.get('management').get('management_ipv4_address'):
-                    link['source_device_ip'] = found_switch['management']['management_ipv4_address']
-                elif found_switch.get('management').get('management_ipv6_address'):
-                    link['source_device_ip'] = found_switch['management']['management_ipv6_address']
+            mgmt_ip_address = topology_index.mgmt_ip(link['source_device'])
+            if mgmt_ip_address:
+                link['source_device_ip'] = mgmt_ip_address
 
         self.kwargs['results']['model_extended'] = data_model
         return self.kwargs['results']
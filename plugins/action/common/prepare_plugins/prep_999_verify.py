@@ -48,16 +48,17 @@ class PreparePlugin:
         #   * List items that were present before the prepare plugins ran are still present
         fabric_type = data_model['vxlan']['fabric']['type']
         for key in model_keys[fabric_type].keys():
-            # Remove the meta_data item from model_keys entry (KEY, LIST, LIST_INDEX)
-            model_keys[fabric_type][key].pop()
-            dm_check = data_model_key_check(data_model, model_keys[fabric_type][key])
+            # Remove the meta_data item from model_keys entry (KEY, LIST, LIST_INDEX).
+            # Work on a copy: model_keys is shared by every run in this process.
+            keys = model_keys[fabric_type][key][:-1]
+            dm_check = data_model_key_check(data_model, keys)
             # Example:
             # model_keys['VXLAN_EVPN']['policy.policies'] = [root_key, 'policy', 'policies', 'LIST']
             #   * Get 2nd to last item from the python list above
             #   * model_keys[key][-2] - Gets 'policies'
-            if model_keys[fabric_type][key][-2] in dm_check['keys_not_found']:
+            if keys[-2] in dm_check['keys_not_found']:
                 self.kwargs['results']['failed'] = True
-                self.kwargs['results']['msg'] = fail_msg.format(key, model_keys[fabric_type][key])
+                self.kwargs['results']['msg'] = fail_msg.format(key, keys)
                 return self.kwargs['results']
 
         # We don't need to pass any data back in this plugin because we don't modify any data.
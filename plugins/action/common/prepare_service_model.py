@@ -26,6 +26,10 @@ __metaclass__ = type
 
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.topology_index import TopologyIndex
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.cow_model import overlay, to_plain
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.prepare_cache import PrepareCache
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.prepare_templates import PrepareTemplates
 
 import importlib
 import os
@@ -49,11 +53,18 @@ class ActionModule(ActionBase):
         hvs = self._task.args['hostvars']
         tp = self._task.args['templates_path']
         default_values = self._task.args['default_values']
+        model_files_path = self._task.args.get('model_files_path')
 
         # sm_data contains the golden untouched model data
         sm_data = self._task.args['data_model']
-        # results['model_extended'] contains the data that can be extended by the plugins
-        results['model_extended'] = copy.deepcopy(sm_data)
+        # results['model_extended'] contains the data that can be extended by the plugins.
+        # With prepare_copy_on_write it is an overlay of sm_data that copies only the
+        # parts of the model the plugins visit, instead of a deep copy of all of it.
+        copy_on_write = (task_vars or {}).get('prepare_copy_on_write', True)
+        if copy_on_write:
+            results['model_extended'] = overlay(sm_data)
+        else:
+            results['model_extended'] = copy.deepcopy(sm_data)
 
         full_plugin_path = "ansible_collections.cisco.nac_dc_vxlan.plugins.action.common.prepare_plugins"
         glob_plugin_path = os.path.dirname(__file__) + "/prepare_plugins"
@@ -68,34 +79,65 @@ class ActionModule(ActionBase):
 
         plugin_keys = list(dict_of_plugins)
         plugin_keys.sort()
+
+        # Plugins declaring their model subtrees (self.keys) are skipped when those
+        # subtrees are unchanged since the previous run; force_run_all only records.
+        prepare_cache = None
+        if model_files_path and (task_vars or {}).get('prepare_incremental', True):
+            prepare_cache = PrepareCache(
+                model_files_path,
+                default_values=default_values,
+                templates_path=tp,
+                reuse=not (task_vars or {}).get('force_run_all', False))
+
+        # Switch lookups shared by every plugin; follows in-place model updates
+        topology_index = TopologyIndex(results['model_extended'])
+        # Template environment shared by every plugin (and every run in this process)
+        prepare_templates = PrepareTemplates(tp, bytecode_cache=(task_vars or {}).get('template_bytecode_cache', True))
         for plugin_name in plugin_keys:
-            # Make sure the plugin has self.keys
-            if hasattr(dict_of_plugins[plugin_name].PreparePlugin(), 'keys'):
-                if not isinstance(dict_of_plugins[plugin_name].PreparePlugin().keys, list):
-                    results['failed'] = True
-                    results['msg'] = f"Plugin {plugin_name} must have a list of keys"
-            else:
-                results['failed'] = True
-                results['msg'] = f"Plugin {plugin_name} must have a list of keys"
-            # Call each plugin in a loop
-            results = dict_of_plugins[plugin_name].PreparePlugin(
+            topology_index.data_model = results['model_extended']
+            plugin = dict_of_plugins[plugin_name].PreparePlugin(
                 host_name=ihn,
                 hostvars=hvs,
                 default_values=default_values,
                 templates_path=tp,
-                results=results).prepare()
+                topology_index=topology_index,
+                prepare_templates=prepare_templates,
+                results=results)
+
+            # Make sure the plugin has self.keys
+            if not isinstance(getattr(plugin, 'keys', None), list):
+                results['failed'] = True
+                results['msg'] = f"Plugin {plugin_name} must have a list of keys"
+                break
+
+            if prepare_cache is not None and prepare_cache.restore(plugin_name, plugin, results['model_extended']):
+                continue
+
+            # Call each plugin in a loop
+            results = plugin.prepare()
 
             if results.get('failed'):
                 # Check each plugin for failures and break out of the loop early
                 # if a failure is encounterd.
                 break
 
+            if prepare_cache is not None:
+                prepare_cache.record(plugin_name, results['model_extended'])
+
         if results['failed']:
             # If there is a failure, remove the model data to make the failure message more readable
             results_copy = results.copy()
             for key in results_copy.keys():
                 if key.startswith('model'):
                     del results[key]
+        else:
+            if prepare_cache is not None:
+                prepare_cache.save()
+                if prepare_cache.reused:
+                    display.v(f"PREPARE reused unchanged results of {', '.join(prepare_cache.reused)}")
+            if copy_on_write:
+                results['model_extended'] = to_plain(results['model_extended'])
 
         # Add golden untouched model data to results dictionary before returning
         results['model_golden'] = sm_data
@@ -42,6 +42,40 @@ internal methods by resource name:
   - child_fabrics:    Prepare MSD child fabric associations
   - interface_all:    Aggregate all interface types into combined lists
   - check_msd_child:  Validate overlay not managed from MSD child fabric
+
+Template rendering can run in parallel (template_render_workers > 1): the
+pre-hooks of the resources rendered in parallel run first, then templates are
+rendered and parsed on a pool of forked worker processes against a snapshot
+of task_vars. Resources with pre-hooks that follow a resource with post-hooks
+are built serially so hooks keep their registry order. Outputs, diffs and
+change flags are still written in resource_types.yml order.
+
+Compiled templates are persisted by TemplateBytecodeCache
+(template_bytecode_cache, enabled by default) so repeat runs skip Jinja2
+compilation of unchanged templates.
+
+Resources that declare 'inputs' in resource_types.yml are fingerprinted
+(template_fingerprints, enabled by default): the listed data model subtrees,
+the role templates and the task_vars in FINGERPRINT_TASK_VARS are hashed, and
+when the fingerprint matches the previous run the rendered file and parsed
+data are reused instead of re-rendering.
+
+In single-pass mode (template_single_pass, enabled by default) steps 1-5 run
+in memory: the render is parsed once, compared to the previous file text with
+omit placeholders normalized, structurally diffed against the previous data
+(taken from the render cache for fingerprinted resources, otherwise parsed
+from the previous text), and written (with its .old backup) only when the
+text changed.
+
+Resources declaring a 'renderer' in resource_types.yml can be built by a
+native Python renderer (template_native_renderers, disabled by default)
+which returns the parsed template output directly; see
+plugin_utils/native_renderers.py. The output file then holds the YAML dump
+of that data and change detection compares parsed data instead of text.
+Resources a renderer does not support are rendered from their template. In
+'verify' mode templates are still used and each renderer's output is
+compared with the parsed render, warning about the first difference.
+Native renderers require single-pass mode.
 """
 
 from __future__ import absolute_import, division, print_function
@@ -49,21 +83,67 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import hashlib
+import json
+import multiprocessing
 import os
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import yaml
 
 from ansible.plugins.action import ActionBase
 from ansible.utils.display import Display
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils import native_renderers
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import (
+    NdfcModuleExecutor,
+)
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.registry_loader import (
     RegistryLoader,
 )
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.template_cache import (
+    TemplateBytecodeCache,
+    collection_version,
+)
 
 display = Display()
 
+# Omit placeholders embed a per-run random suffix; normalized before comparing
+OMIT_PLACEHOLDER_PATTERN = re.compile(r'__omit_place_holder__\S+', re.MULTILINE)
+
+# Writes the output files of natively rendered resources
+_NATIVE_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Builder whose templates are rendered by the forked render workers. Set just
+# before the pool starts so workers inherit it (and a snapshot of its
+# task_vars) instead of pickling it.
+_RENDER_BUILDER = None
+
+
+def _init_render_worker():
+    """Install the role template loader and task_vars once per render worker."""
+    templar = _RENDER_BUILDER.action_module._templar
+    templar.environment.loader = _RENDER_BUILDER._get_template_loader(templar)
+    templar.environment.bytecode_cache = _RENDER_BUILDER._get_bytecode_cache(templar)
+    templar.available_variables = _RENDER_BUILDER.task_vars
+
+
+def _render_in_worker(resource_name, template_name):
+    """
+    Render and parse one template in a worker.
+
+    Returns:
+        (resource_name, rendered, data, error) tuple.
+    """
+    try:
+        templar = _RENDER_BUILDER.action_module._templar
+        rendered = _RENDER_BUILDER._render_with(templar, template_name)
+        return resource_name, rendered, yaml.safe_load(rendered) or [], None
+    except Exception as e:
+        return resource_name, None, None, str(e)
+
 
 class ResourceDataBuilder:
     """
@@ -74,6 +154,19 @@ class ResourceDataBuilder:
     data for downstream create/remove plugins.
     """
 
+    # Task variables read by templates outside data_model_extended. Part of
+    # every input fingerprint.
+    FINGERPRINT_TASK_VARS = (
+        'defaults',
+        'nd_version',
+        'ndfc_version',
+        'runtime_msd_data_model',
+        'runtime_mcfg_data_model',
+    )
+
+    # Fingerprints, output file hashes and parsed data of the previous run
+    RENDER_CACHE_FILE = '_render_cache.json'
+
     def __init__(self, params, action_module, task_vars, tmp=None):
         self.fabric_type = params['fabric_type']
         self.fabric_name = params['fabric_name']
@@ -83,13 +176,22 @@ class ResourceDataBuilder:
         self.force_run_all = self._to_bool(params.get('force_run_all', False))
         self.check_roles = params.get('check_roles', {})
         self.resource_filter = params.get('resource_filter', None)
+        self.render_workers = max(1, int(params.get('template_render_workers', 1) or 1))
+        self.use_bytecode_cache = self._to_bool(params.get('template_bytecode_cache', True))
+        self.use_fingerprints = self._to_bool(params.get('template_fingerprints', True))
+        self.single_pass = self._to_bool(params.get('template_single_pass', True))
+        native = params.get('template_native_renderers', False)
+        self.native_verify = str(native).lower() == 'verify'
+        self.use_native_renderers = self.single_pass and (self.native_verify or self._to_bool(native))
+        self.diff_equal_items = params.get('diff_compare_equal_items', 'full')
+        self.diff_report_format = params.get('diff_compare_report_format', 'yaml')
 
         self.action_module = action_module
         self.task_vars = task_vars
         self.tmp = tmp
 
         # Load registries
-        collection_path = RegistryLoader.get_collection_path()
+        self.collection_path = collection_path = RegistryLoader.get_collection_path()
         self.resource_types = RegistryLoader.load(collection_path, 'resource_types').get('resource_types', {})
         self.fabric_types = RegistryLoader.load(collection_path, 'fabric_types').get('fabric_types', {})
 
@@ -107,6 +209,24 @@ class ResourceDataBuilder:
         self.resource_data = {}
         self.change_flags = {}
 
+        # Template rendering state
+        self._template_sources = {}
+        self._template_loader = None
+        self._bytecode_cache = None
+        self._pre_hook_results = {}
+        self._rendered = {}
+
+        # Input fingerprint state
+        self._render_cache = {}
+        self._fingerprints = {}
+        self._reusable = {}
+        self._fingerprint_base = None
+        self._slice_digests = {}
+
+        # Native renderer state
+        self._native_digest = None
+        self._native_results = {}
+
     @staticmethod
     def _to_bool(value):
         """Convert Ansible bool-like values into real booleans."""
@@ -146,19 +266,13 @@ class ResourceDataBuilder:
         os.makedirs(self.output_path, exist_ok=True)
 
         step_results = []
+        selected = self._select_resources()
+        self._find_reusable(selected)
 
-        for resource_name, rt in self.resource_types.items():
-            # When resource_filter is set (deferred build for MSD/MCFG),
-            # process only the named resources and skip fabric_types check.
-            # Otherwise, apply the standard fabric_type filter.
-            if self.resource_filter:
-                if resource_name not in self.resource_filter:
-                    continue
-            else:
-                applicable_fabrics = rt.get('fabric_types', [])
-                if self.fabric_type not in applicable_fabrics:
-                    continue
+        if self.render_workers > 1:
+            self._prerender(self._prerender_jobs(selected))
 
+        for resource_name, rt in selected:
             template = rt.get('template')
 
             # ── Non-template step: dispatch to internal method ────────
@@ -198,13 +312,8 @@ class ResourceDataBuilder:
                     }
                 continue
 
-            # ── Resolve template (apply fabric-specific override) ─────
-            template_overrides = rt.get('template_overrides', {})
-            if self.fabric_type in template_overrides:
-                template = template_overrides[self.fabric_type]
-
             # ── Standard resource build ───────────────────────────────
-            result = self._build_resource(resource_name, rt, template)
+            result = self._build_resource(resource_name, rt, self._resolve_template(rt))
             step_results.append({
                 'resource_name': resource_name,
                 'status': 'ok' if not result.get('failed') else 'failed',
@@ -232,10 +341,12 @@ class ResourceDataBuilder:
         if not self.resource_filter and self.fabric_type in ('MSD', 'MCFG'):
             self._detect_msite_overlay_changes()
 
+        self._save_render_cache()
+
         # Compute aggregate change flag
         self.change_flags['changes_detected_any'] = any(self.change_flags.values())
 
-        return {
+        result = {
             'resource_data': self.resource_data,
             'change_flags': self.change_flags,
             'namespace': self.namespace,
@@ -243,6 +354,43 @@ class ResourceDataBuilder:
             'failed': False,
             'msg': f"Common pipeline completed for {self.fabric_type} fabric '{self.fabric_name}'",
         }
+        if self._native_results:
+            result['native_renderers'] = self._native_results
+        return result
+
+    def _select_resources(self):
+        """
+        Return the (resource_name, rt) pairs to process, in registry order.
+
+        When resource_filter is set (deferred build for MSD/MCFG), only the
+        named resources are selected and the fabric_types check is skipped.
+        Otherwise, the standard fabric_type filter applies.
+        """
+        selected = []
+        for resource_name, rt in self.resource_types.items():
+            if self.resource_filter:
+                if resource_name not in self.resource_filter:
+                    continue
+            elif self.fabric_type not in rt.get('fabric_types', []):
+                continue
+            selected.append((resource_name, rt))
+        return selected
+
+    def _resolve_template(self, rt):
+        """Return the template for a resource, applying fabric-specific overrides."""
+        template_overrides = rt.get('template_overrides', {})
+        if self.fabric_type in template_overrides:
+            return template_overrides[self.fabric_type]
+        return rt.get('template')
+
+    def _native_renderer(self, rt):
+        """Return the native renderer name of a resource, or None when its template is used."""
+        renderer = rt.get('renderer')
+        if not self.use_native_renderers or renderer not in native_renderers.RENDERERS:
+            return None
+        if self.fabric_type in rt.get('template_overrides', {}):
+            return None
+        return renderer
 
     # ══════════════════════════════════════════════════════════════════════════
     # Core Build Cycle
@@ -268,20 +416,38 @@ class ResourceDataBuilder:
         output_file_path = os.path.join(self.output_path, output_file)
         old_file_path = output_file_path + '.old'
 
+        # ── Unchanged inputs: reuse previous render ──────────────────
+        if resource_name in self._reusable:
+            return self._reuse_resource(resource_name, rt, output_file_path)
+
+        if self.single_pass:
+            return self._build_resource_single_pass(resource_name, rt, template, output_file_path)
+
         # ── Step 1: Backup previous file ──────────────────────────────
         if os.path.exists(output_file_path):
             shutil.copy2(output_file_path, old_file_path)
             os.remove(output_file_path)
 
         # ── Step 2: Execute pre-hooks ─────────────────────────────────
-        pre_hook_data = {}
-        for hook in rt.get('pre_hooks', []):
-            hook_result = self._execute_hook(hook)
-            pre_hook_data[hook] = hook_result
+        # Already executed by _prerender when rendering in parallel.
+        if resource_name in self._pre_hook_results:
+            pre_hook_data = dict(self._pre_hook_results[resource_name])
+        else:
+            pre_hook_data = {}
+            for hook in rt.get('pre_hooks', []):
+                hook_result = self._execute_hook(hook)
+                pre_hook_data[hook] = hook_result
 
         # ── Step 3: Render template ───────────────────────────────────
+        prerendered = self._rendered.pop(resource_name, None)
         try:
-            self._render_template(template, output_file_path)
+            if prerendered is not None:
+                rendered, data, error = prerendered
+                if error is not None:
+                    raise RuntimeError(error)
+                self._write_rendered(rendered, output_file_path)
+            else:
+                self._render_template(template, output_file_path)
         except Exception as e:
             return {
                 'failed': True,
@@ -289,7 +455,9 @@ class ResourceDataBuilder:
             }
 
         # ── Step 4: Load rendered data ────────────────────────────────
-        data = self._load_yaml(output_file_path)
+        if prerendered is None:
+            data = self._load_yaml(output_file_path)
+        self._remember_render(resource_name, output_file_path, data)
 
         # ── Step 5: Execute post-hooks ────────────────────────────────
         for hook in rt.get('post_hooks', []):
@@ -309,7 +477,134 @@ class ResourceDataBuilder:
         if change_flag and file_changed and self.check_roles.get('save_previous', False):
             self.change_flags[change_flag] = True
 
-        # ── Store resource data ───────────────────────────────────────
+        self._store_resource(resource_name, var_name, data, diff_result, pre_hook_data)
+
+        display.v(
+            f"COMMON [{self.fabric_name}] Built {resource_name}: "
+            f"items={len(data) if isinstance(data, list) else '?'}, "
+            f"changed={file_changed}"
+        )
+
+        return {'failed': False, 'changed': file_changed}
+
+    def _build_resource_single_pass(self, resource_name, rt, template, output_file_path):
+        """
+        Build a resource from a render held in memory.
+
+        Same steps as _build_resource, except the render is parsed once and
+        compared and diffed against the previous file before anything is
+        written (see _commit_rendered). The structural diff runs before the
+        post-hooks so hooks that modify the data cannot affect it, matching
+        the file-based flow which diffs the files on disk.
+        """
+        change_flag = rt['change_flag']
+        var_name = rt.get('var_name', resource_name)
+
+        # ── Step 1: Execute pre-hooks ─────────────────────────────────
+        if resource_name in self._pre_hook_results:
+            pre_hook_data = dict(self._pre_hook_results[resource_name])
+        else:
+            pre_hook_data = {}
+            for hook in rt.get('pre_hooks', []):
+                pre_hook_data[hook] = self._execute_hook(hook)
+
+        # ── Step 2: Render and parse in memory ────────────────────────
+        prerendered = self._rendered.pop(resource_name, None)
+        renderer = self._native_renderer(rt)
+        native = None
+        if renderer is not None and not self.native_verify:
+            native = self._render_native(resource_name, renderer)
+        try:
+            if native is not None:
+                rendered, data = native
+            elif prerendered is not None:
+                rendered, data, error = prerendered
+                if error is not None:
+                    raise RuntimeError(error)
+            else:
+                rendered = self._render_to_string(template)
+                data = yaml.safe_load(rendered) or []
+        except Exception as e:
+            return {
+                'failed': True,
+                'msg': f"Template rendering failed for {resource_name}: {str(e)}",
+            }
+        if renderer is not None and self.native_verify:
+            self._verify_native(resource_name, renderer, data)
+
+        # ── Step 3: Compare, diff and write if changed ────────────────
+        file_changed, diff_result = self._commit_rendered(
+            resource_name, output_file_path, rendered, data,
+            self._should_run_structural_diff(rt.get('diff_compare', False)),
+            compare_data=renderer is not None,
+        )
+        self._remember_render(resource_name, output_file_path, data, rendered=rendered)
+
+        # ── Step 4: Execute post-hooks ────────────────────────────────
+        for hook in rt.get('post_hooks', []):
+            hook_result = self._execute_post_hook(hook, resource_name, data)
+            if hook_result is not None:
+                pre_hook_data[hook] = hook_result
+
+        # ── Step 5: Set change flag ───────────────────────────────────
+        if change_flag and file_changed and self.check_roles.get('save_previous', False):
+            self.change_flags[change_flag] = True
+
+        self._store_resource(resource_name, var_name, data, diff_result, pre_hook_data)
+
+        display.v(
+            f"COMMON [{self.fabric_name}] Built {resource_name}: "
+            f"items={len(data) if isinstance(data, list) else '?'}, "
+            f"changed={file_changed}"
+        )
+
+        result = {'failed': False, 'changed': file_changed}
+        if resource_name in self._native_results:
+            result['renderer'] = self._native_results[resource_name]
+        return result
+
+    def _reuse_resource(self, resource_name, rt, output_file_path):
+        """
+        Complete a resource whose input fingerprint matches the previous run.
+
+        The previous rendered file is kept as-is, so the resource is unchanged
+        by definition. Post-hooks still run so the resource entry matches a
+        full render; its structural diff is empty without comparing anything
+        (the comparison report of the previous render is left in place).
+        """
+        data = self._reusable.pop(resource_name)
+        if data is None:
+            data = self._load_yaml(output_file_path)
+
+        # An unchanged render leaves no backup behind
+        if os.path.exists(output_file_path + '.old'):
+            os.remove(output_file_path + '.old')
+
+        pre_hook_data = {}
+        for hook in rt.get('post_hooks', []):
+            hook_result = self._execute_post_hook(hook, resource_name, data)
+            if hook_result is not None:
+                pre_hook_data[hook] = hook_result
+
+        diff_result = None
+        if self._should_run_structural_diff(rt.get('diff_compare', False)):
+            if self.diff_equal_items == 'full':
+                # Unchanged items are listed, keyed the way diff_compare keys them
+                diff_result = self._compare_in_memory(output_file_path, data, data)
+            else:
+                diff_result = {'updated': [], 'removed': [], 'equal': []}
+
+        self._store_resource(resource_name, rt.get('var_name', resource_name), data, diff_result, pre_hook_data)
+
+        display.v(
+            f"COMMON [{self.fabric_name}] Reused {resource_name} (inputs unchanged): "
+            f"items={len(data) if isinstance(data, list) else '?'}"
+        )
+
+        return {'failed': False, 'changed': False, 'reused': True}
+
+    def _store_resource(self, resource_name, var_name, data, diff_result, pre_hook_data):
+        """Record the resource entry consumed by the create/remove pipelines."""
         # module_data is the authoritative data for downstream NDFC module calls.
         # Default is the raw rendered template data. Post-hooks can override this
         # by returning a 'module_data' key in their result dict (convention).
@@ -334,13 +629,155 @@ class ResourceDataBuilder:
 
         self.resource_data[resource_name] = resource_entry
 
-        display.v(
-            f"COMMON [{self.fabric_name}] Built {resource_name}: "
-            f"items={len(data) if isinstance(data, list) else '?'}, "
-            f"changed={file_changed}"
-        )
+    # ══════════════════════════════════════════════════════════════════════════
+    # Input Fingerprints
+    # ══════════════════════════════════════════════════════════════════════════
 
-        return {'failed': False, 'changed': file_changed}
+    def _find_reusable(self, selected):
+        """
+        Fingerprint the selected resources and collect those reusable as-is.
+
+        A resource is reusable when it declares 'inputs', its fingerprint
+        equals the one recorded by the previous run, and its output file is
+        still the one that run produced. Full runs clean the output directory,
+        so they only record fingerprints for the next run.
+        """
+        if not self.use_fingerprints:
+            return
+
+        full_run = not self.run_map_diff_run or self.force_run_all
+        if not full_run:
+            self._render_cache = self._load_render_cache()
+        for resource_name, rt in selected:
+            fingerprint = self._fingerprint(rt)
+            if fingerprint is None:
+                continue
+            self._fingerprints[resource_name] = fingerprint
+            if full_run:
+                continue
+
+            entry = self._render_cache.get(resource_name)
+            if not isinstance(entry, dict) or entry.get('fingerprint') != fingerprint:
+                continue
+            output_file_path = os.path.join(self.output_path, rt['output_file'])
+            if self._file_md5(output_file_path) != entry.get('md5'):
+                continue
+            self._reusable[resource_name] = entry.get('data')
+
+    def _fingerprint(self, rt):
+        """
+        Hash everything a resource's template reads.
+
+        Returns:
+            Hex digest, or None when the resource declares no inputs or runs
+            pre-hooks (whose results feed the template).
+        """
+        inputs = rt.get('inputs')
+        if not inputs or rt.get('template') is None or rt.get('pre_hooks'):
+            return None
+        material = {
+            'base': self._get_fingerprint_base(),
+            'fabric_type': self.fabric_type,
+            'fabric_name': self.fabric_name,
+            'template': self._resolve_template(rt),
+            'inputs': {path: self._slice_digest(path) for path in inputs},
+        }
+        if self._native_renderer(rt) is not None:
+            material['renderer'] = [rt['renderer'], self._get_native_digest(), self.native_verify]
+        return hashlib.sha1(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def _get_fingerprint_base(self):
+        """Hash the collection version, role templates and FINGERPRINT_TASK_VARS once per build."""
+        if self._fingerprint_base is None:
+            digest = hashlib.sha1(collection_version(self.collection_path).encode())
+            template_dir = os.path.join(self.role_path, 'templates')
+            for dirpath, dirnames, filenames in os.walk(template_dir):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    path = os.path.join(dirpath, filename)
+                    digest.update(os.path.relpath(path, template_dir).encode())
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+            for var in self.FINGERPRINT_TASK_VARS:
+                digest.update(self._digest_value(self.task_vars.get(var)).encode())
+            self._fingerprint_base = digest.hexdigest()
+        return self._fingerprint_base
+
+    def _slice_digest(self, path):
+        """Hash the data_model_extended subtree at a dotted path (None if absent)."""
+        if path not in self._slice_digests:
+            node = self.task_vars.get('data_model_extended', self.data_model)
+            for key in path.split('.'):
+                node = node.get(key) if isinstance(node, dict) else None
+            self._slice_digests[path] = self._digest_value(node)
+        return self._slice_digests[path]
+
+    def _get_native_digest(self):
+        """Hash the native renderers module once per build."""
+        if self._native_digest is None:
+            self._native_digest = self._file_md5(native_renderers.__file__.replace('.pyc', '.py'))
+        return self._native_digest
+
+    @staticmethod
+    def _digest_value(value):
+        return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _file_md5(path):
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.md5(f.read()).hexdigest()
+        except (IOError, OSError):
+            return None
+
+    def _remember_render(self, resource_name, output_file_path, data, rendered=None):
+        """
+        Record a fresh render of a fingerprinted resource for the next run.
+
+        The entry holds the fingerprint, the md5 of the rendered file and a
+        copy of the parsed data, which a reused resource returns and the
+        next render diffs against without re-parsing the file. Other
+        resources are not recorded. rendered is the file text when already
+        in memory.
+        """
+        fingerprint = self._fingerprints.get(resource_name)
+        if fingerprint is None:
+            self._render_cache.pop(resource_name, None)
+            return
+        if rendered is not None:
+            md5 = hashlib.md5(rendered.encode()).hexdigest()
+        else:
+            md5 = self._file_md5(output_file_path)
+        entry = {'fingerprint': fingerprint, 'md5': md5}
+        # Keep a copy of the parsed data only when it survives a JSON round
+        # trip unchanged (e.g. no integer dict keys) and post-hooks cannot
+        # modify it; otherwise the next run re-parses the file.
+        try:
+            data_copy = json.loads(json.dumps(data))
+            if data_copy == data:
+                entry['data'] = data_copy
+        except (TypeError, ValueError):
+            pass
+        self._render_cache[resource_name] = entry
+
+    def _load_render_cache(self):
+        try:
+            with open(os.path.join(self.output_path, self.RENDER_CACHE_FILE)) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _save_render_cache(self):
+        if not self._fingerprints and not self._render_cache:
+            return
+        cache_file = os.path.join(self.output_path, self.RENDER_CACHE_FILE)
+        try:
+            with open(cache_file + '.tmp', 'w') as f:
+                json.dump(self._render_cache, f)
+            os.replace(cache_file + '.tmp', cache_file)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            display.vvv(f"COMMON [{self.fabric_name}] Unable to save render cache: {e}")
 
     # ══════════════════════════════════════════════════════════════════════════
     # Template Rendering
@@ -358,44 +795,223 @@ class ResourceDataBuilder:
             template_name: Template path relative to role templates dir.
             output_path: Absolute path for the rendered output file.
         """
-        from jinja2 import ChoiceLoader, FileSystemLoader
-
-        template_dir = os.path.join(self.role_path, 'templates')
-        template_path = os.path.join(template_dir, template_name)
-
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Template not found: {template_path}")
-
-        with open(template_path) as f:
-            template_content = f.read()
+        self._write_rendered(self._render_to_string(template_name), output_path)
 
+    def _render_to_string(self, template_name):
+        """Render a template from the role templates dir and return the text."""
         templar = self.action_module._templar
         original_loader = templar.environment.loader
-
-        # Add role templates dir to Jinja2 loader for {% include %} and {% import %}
-        new_loader = ChoiceLoader([
-            FileSystemLoader(template_dir),
-            original_loader,
-        ])
-        templar.environment.loader = new_loader
+        original_bytecode_cache = templar.environment.bytecode_cache
         old_vars = templar.available_variables
 
         try:
+            # Add role templates dir to Jinja2 loader for {% include %} and {% import %}
+            templar.environment.loader = self._get_template_loader(templar)
+            templar.environment.bytecode_cache = self._get_bytecode_cache(templar)
             templar.available_variables = self.task_vars
-
-            rendered = templar.template(
-                template_content,
-                preserve_trailing_newlines=True,
-                convert_data=False,
-            )
+            rendered = self._render_with(templar, template_name)
         finally:
             templar.environment.loader = original_loader
+            templar.environment.bytecode_cache = original_bytecode_cache
             templar.available_variables = old_vars
 
+        return rendered
+
+    def _render_with(self, templar, template_name):
+        """
+        Render a template with a templar whose loader and variables are set.
+
+        With the bytecode cache active, the template is rendered as an
+        {% include %} so Jinja2 loads it through the loader (and therefore the
+        cache) instead of compiling the source string. The source's trailing
+        newlines are appended so Templar preserves them exactly as before.
+        """
+        source = self._get_template_source(template_name)
+        if self._bytecode_cache is not None:
+            trailing_newlines = len(source) - len(source.rstrip('\n'))
+            source = '{%% include "%s" %%}%s' % (template_name, '\n' * trailing_newlines)
+        return templar.template(
+            source,
+            preserve_trailing_newlines=True,
+            convert_data=False,
+        )
+
+    def _get_template_source(self, template_name):
+        """Read a template from the role templates dir, once per build."""
+        if template_name not in self._template_sources:
+            template_path = os.path.join(self.role_path, 'templates', template_name)
+            if not os.path.exists(template_path):
+                raise FileNotFoundError(f"Template not found: {template_path}")
+            with open(template_path) as f:
+                self._template_sources[template_name] = f.read()
+        return self._template_sources[template_name]
+
+    def _get_template_loader(self, templar):
+        """
+        Return the loader searching the role templates dir, then the templar's own.
+
+        Built once per build so Jinja2's template cache keeps compiled
+        {% include %}/{% import %} targets across renders.
+        """
+        if self._template_loader is None:
+            from jinja2 import ChoiceLoader, FileSystemLoader
+
+            self._template_loader = ChoiceLoader([
+                FileSystemLoader(os.path.join(self.role_path, 'templates')),
+                templar.environment.loader,
+            ])
+        return self._template_loader
+
+    def _get_bytecode_cache(self, templar):
+        """Return the on-disk bytecode cache for the templar's environment, or None."""
+        if self.use_bytecode_cache and self._bytecode_cache is None:
+            self._bytecode_cache = TemplateBytecodeCache.for_environment(
+                templar.environment, self.collection_path,
+            )
+            if self._bytecode_cache is None:
+                self.use_bytecode_cache = False
+        return self._bytecode_cache
+
+    @staticmethod
+    def _write_rendered(rendered, output_path):
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         with open(output_path, 'w') as f:
             f.write(rendered)
 
+    def _prerender_jobs(self, selected):
+        """
+        Select the resources rendered ahead of the build loop by _prerender.
+
+        Their pre-hooks run before any resource is built, so a resource with
+        pre-hooks is only selected while no earlier resource has post-hooks;
+        later ones are built serially, keeping every hook in registry order.
+
+        Returns:
+            List of (resource_name, rt, template) tuples.
+        """
+        jobs = []
+        post_hooks_seen = False
+        for resource_name, rt in selected:
+            if (rt.get('template') is not None and resource_name not in self._reusable
+                    and (self.native_verify or self._native_renderer(rt) is None)
+                    and not (post_hooks_seen and rt.get('pre_hooks'))):
+                jobs.append((resource_name, rt, self._resolve_template(rt)))
+            if rt.get('post_hooks'):
+                post_hooks_seen = True
+        return jobs
+
+    def _prerender(self, jobs):
+        """
+        Render templates in parallel ahead of the ordered build loop.
+
+        Pre-hooks of the jobs run first (in order) because they feed task_vars
+        used by templates. Templates are then rendered and parsed by forked worker
+        processes that inherit a snapshot of task_vars; results are kept in
+        memory and written by _build_resource in registry order. Falls back to serial rendering
+        when fork is unavailable or the pool breaks.
+
+        Args:
+            jobs: List of (resource_name, rt, template) tuples.
+        """
+        global _RENDER_BUILDER
+
+        for resource_name, rt, _template in jobs:
+            if rt.get('pre_hooks'):
+                self._pre_hook_results[resource_name] = {
+                    hook: self._execute_hook(hook) for hook in rt['pre_hooks']
+                }
+
+        if len(jobs) < 2:
+            return
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            display.warning("template_render_workers requires the 'fork' start method — rendering serially")
+            return
+
+        # Resolve the bytecode cache and read sources before forking so
+        # workers share them
+        self._get_bytecode_cache(self.action_module._templar)
+        for _resource_name, _rt, template in jobs:
+            try:
+                self._get_template_source(template)
+            except FileNotFoundError:
+                pass
+
+        _RENDER_BUILDER = self
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.render_workers, len(jobs)),
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_render_worker,
+            ) as pool:
+                futures = [
+                    pool.submit(_render_in_worker, resource_name, template)
+                    for resource_name, _rt, template in jobs
+                ]
+                for future in futures:
+                    resource_name, rendered, data, error = future.result()
+                    self._rendered[resource_name] = (rendered, data, error)
+        except (BrokenProcessPool, OSError) as e:
+            display.warning(f"Parallel template rendering unavailable ({e}) — rendering serially")
+            self._rendered = {}
+        finally:
+            _RENDER_BUILDER = None
+
+        display.v(
+            f"COMMON [{self.fabric_name}] Rendered {len(self._rendered)} templates "
+            f"with {min(self.render_workers, len(jobs))} workers"
+        )
+
+    def _render_native(self, resource_name, renderer):
+        """
+        Build a resource with its native renderer.
+
+        Returns:
+            (rendered, data) tuple, or None when the template must be
+            rendered instead. rendered is the YAML dump written to the
+            output file.
+        """
+        try:
+            data = native_renderers.render(renderer, self.task_vars)
+        except native_renderers.NativeRenderUnsupported as e:
+            self._native_results[resource_name] = 'unsupported'
+            display.vvv(f"COMMON [{self.fabric_name}] Rendering {resource_name} from its template: {e}")
+            return None
+        except Exception as e:
+            self._native_results[resource_name] = 'failed'
+            display.vvv(f"COMMON [{self.fabric_name}] Native renderer for {resource_name} failed, rendering its template: {e}")
+            return None
+
+        self._native_results[resource_name] = 'native'
+        rendered = (
+            f"---\n# This NDFC {resource_name} data structure is auto-generated\n"
+            "# DO NOT EDIT MANUALLY\n#\n"
+        ) + yaml.dump(data, Dumper=_NATIVE_DUMPER, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return rendered, data
+
+    def _verify_native(self, resource_name, renderer, data):
+        """Compare a resource's native renderer output with its parsed template render."""
+        try:
+            native_data = native_renderers.render(renderer, self.task_vars)
+        except native_renderers.NativeRenderUnsupported as e:
+            self._native_results[resource_name] = 'unsupported'
+            display.vvv(f"COMMON [{self.fabric_name}] Native renderer does not support {resource_name}: {e}")
+            return
+        except Exception as e:
+            self._native_results[resource_name] = 'failed'
+            display.warning(f"COMMON [{self.fabric_name}] Native renderer for {resource_name} failed: {e}")
+            return
+
+        difference = native_renderers.first_difference(data, native_data)
+        if difference is None:
+            self._native_results[resource_name] = 'verified'
+            display.v(f"COMMON [{self.fabric_name}] Native renderer for {resource_name} matches its template")
+        else:
+            self._native_results[resource_name] = 'mismatch'
+            display.warning(
+                f"COMMON [{self.fabric_name}] Native renderer for {resource_name} differs from its template "
+                f"at {difference}"
+            )
+
     def _load_yaml(self, path):
         """Load a YAML file and return its contents, or empty list."""
         if not os.path.exists(path):
@@ -438,19 +1054,92 @@ class ResourceDataBuilder:
             return False
 
         # Normalize omit placeholders and compare again
-        pattern = r'__omit_place_holder__\S+'
-        data_previous = re.sub(pattern, 'NORMALIZED', data_previous, flags=re.MULTILINE)
-        data_current = re.sub(pattern, 'NORMALIZED', data_current, flags=re.MULTILINE)
-
-        md5_prev = hashlib.md5(data_previous.encode()).hexdigest()
-        md5_curr = hashlib.md5(data_current.encode()).hexdigest()
-
-        if md5_prev == md5_curr:
+        if self._normalized_md5(data_previous) == self._normalized_md5(data_current):
             os.remove(old_path)
             return False
 
         return True
 
+    @staticmethod
+    def _normalized_md5(text):
+        """MD5 of rendered text with omit placeholders normalized."""
+        return hashlib.md5(OMIT_PLACEHOLDER_PATTERN.sub('NORMALIZED', text).encode()).hexdigest()
+
+    def _commit_rendered(self, resource_name, output_file_path, rendered, data, structural_diff, compare_data=False):
+        """
+        Compare an in-memory render with the previous file and write it if changed.
+
+        Single-pass replacement for the backup → write → diff_compare →
+        diff_model_changes sequence. The previous file is read once; its
+        parsed data comes from the render cache when the text matches the
+        recorded hash, so neither file is parsed again. The new file and its
+        .old backup are written only when the text differs; an unchanged
+        render leaves the previous file (and no backup) in place.
+
+        Args:
+            resource_name: Resource the render belongs to.
+            output_file_path: Rendered output file path.
+            rendered: Rendered text.
+            data: Parsed rendered data.
+            structural_diff: Whether to run the diff_compare comparison.
+            compare_data: Detect changes by comparing the parsed data instead
+                of the text (resources with a native renderer, whose output
+                file text depends on how they were rendered).
+
+        Returns:
+            (file_changed, diff_result) tuple; diff_result is None when
+            structural_diff is False.
+        """
+        old_file_path = output_file_path + '.old'
+        try:
+            with open(output_file_path) as f:
+                previous = f.read()
+        except (IOError, OSError):
+            previous = None
+
+        previous_data = None
+        if previous is None:
+            file_changed = True
+        elif previous == rendered:
+            file_changed = False
+        elif compare_data:
+            previous_data = self._previous_data(resource_name, previous)
+            file_changed = self._normalized_data(previous_data) != self._normalized_data(data)
+        else:
+            file_changed = self._normalized_md5(previous) != self._normalized_md5(rendered)
+
+        diff_result = None
+        if structural_diff:
+            if previous is None:
+                previous_data = []
+            elif previous == rendered:
+                previous_data = data
+            elif previous_data is None:
+                previous_data = self._previous_data(resource_name, previous)
+            diff_result = self._compare_in_memory(output_file_path, previous_data, data)
+
+        if previous != rendered:
+            if file_changed and previous is not None:
+                self._write_rendered(previous, old_file_path)
+            self._write_rendered(rendered, output_file_path)
+        if not file_changed and os.path.exists(old_file_path):
+            os.remove(old_file_path)
+
+        return file_changed, diff_result
+
+    @staticmethod
+    def _normalized_data(data):
+        """Canonical JSON of parsed data with omit placeholders normalized."""
+        return OMIT_PLACEHOLDER_PATTERN.sub('NORMALIZED', json.dumps(data, sort_keys=True, default=str))
+
+    def _previous_data(self, resource_name, previous):
+        """Parsed data of the previous render, from the render cache when it matches."""
+        entry = self._render_cache.get(resource_name)
+        if (isinstance(entry, dict) and 'data' in entry
+                and entry.get('md5') == hashlib.md5(previous.encode()).hexdigest()):
+            return entry['data']
+        return yaml.safe_load(previous) or []
+
     def _detect_msite_overlay_changes(self):
         """
         Detect changes in MSD/MCFG multisite overlay data model.
@@ -575,10 +1264,42 @@ class ResourceDataBuilder:
         """
         result = self._run_action_plugin(
             "cisco.nac_dc_vxlan.dtc.diff_compare",
-            {"old_file": old_path, "new_file": new_path},
+            {
+                "old_file": old_path,
+                "new_file": new_path,
+                "equal_items": self.diff_equal_items,
+                "report_format": self.diff_report_format,
+            },
         )
         return result
 
+    def _compare_in_memory(self, new_path, old_items, new_items):
+        """
+        Run the diff_compare comparison on data already in memory.
+
+        Args:
+            new_path: Path of the current file; selects the comparison keys
+                and where the comparison results file is written.
+            old_items: Previous rendered data.
+            new_items: Current rendered data.
+
+        Returns:
+            Dict with 'updated', 'removed', 'equal' lists.
+        """
+        action_name = "cisco.nac_dc_vxlan.dtc.diff_compare"
+        args = {"old_file": new_path + '.old', "new_file": new_path}
+        action = self._load_action_plugin(action_name, args)
+        if action is None:
+            return {
+                'failed': True,
+                'msg': f"Action plugin '{action_name}' not found via action_loader",
+            }
+        action.old_file_path = args['old_file']
+        action.new_file_path = args['new_file']
+        action.equal_items = self.diff_equal_items
+        action.report_format = self.diff_report_format
+        return action.compare(old_items, new_items)
+
     # ══════════════════════════════════════════════════════════════════════════
     # Action Plugin Invocation
     # ══════════════════════════════════════════════════════════════════════════
@@ -590,6 +1311,17 @@ class ResourceDataBuilder:
         Used for hooks like get_poap_data and get_credentials which are
         action plugins (not modules) and cannot be called via _execute_module.
         """
+        action = self._load_action_plugin(action_name, args)
+        if action is None:
+            return {
+                'failed': True,
+                'msg': f"Action plugin '{action_name}' not found via action_loader",
+            }
+
+        return action.run(task_vars=self.task_vars, tmp=self.tmp)
+
+    def _load_action_plugin(self, action_name, args):
+        """Instantiate an action plugin for a copy of the current task, or None if not found."""
         task = self.action_module._task.copy()
         task.action = action_name
         task.args = args
@@ -603,18 +1335,11 @@ class ResourceDataBuilder:
             templar=self.action_module._templar,
             shared_loader_obj=self.action_module._shared_loader_obj,
         )
-
-        if action is None:
-            return {
-                'failed': True,
-                'msg': f"Action plugin '{action_name}' not found via action_loader",
-            }
-
-        return action.run(task_vars=self.task_vars, tmp=self.tmp)
+        return action
 
     def _execute_rest(self, method, path):
         """
-        Execute a dcnm_rest API call.
+        Execute an NDFC REST API call through NdfcModuleExecutor.
 
         Args:
             method: HTTP method (GET, POST, etc.).
@@ -623,12 +1348,7 @@ class ResourceDataBuilder:
         Returns:
             Module result dict.
         """
-        return self.action_module._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={"method": method, "path": path},
-            task_vars=self.task_vars,
-            tmp=self.tmp,
-        )
+        return NdfcModuleExecutor(self.action_module, self.task_vars, self.tmp).execute_rest(method, path)
 
     # ══════════════════════════════════════════════════════════════════════════
     # Hooks
@@ -764,23 +1484,32 @@ class ResourceDataBuilder:
         # Write aggregated file for diff comparison
         output_file = os.path.join(self.output_path, 'ndfc_interface_all.yml')
         old_file = output_file + '.old'
+        structural_diff = self._should_run_structural_diff(rt.get('diff_compare', False))
 
-        # Backup previous
-        if os.path.exists(output_file):
-            shutil.copy2(output_file, old_file)
-            os.remove(output_file)
-
-        # Write current
-        with open(output_file, 'w') as f:
-            yaml.dump(create_list, f, default_flow_style=False)
-
-        # Run structural diff only when downstream targeted processing needs it.
-        diff_result = None
-        if self._should_run_structural_diff(rt.get('diff_compare', False)):
-            diff_result = self._run_diff_compare(old_file, output_file)
-
-        # Run MD5 diff
-        file_changed = self._run_diff_model_changes(old_file, output_file)
+        if self.single_pass:
+            rendered = yaml.dump(create_list, default_flow_style=False)
+            file_changed, diff_result = self._commit_rendered(
+                'interface_all', output_file,
+                rendered, create_list, structural_diff,
+            )
+            self._remember_render('interface_all', output_file, create_list, rendered=rendered)
+        else:
+            # Backup previous
+            if os.path.exists(output_file):
+                shutil.copy2(output_file, old_file)
+                os.remove(output_file)
+
+            # Write current
+            with open(output_file, 'w') as f:
+                yaml.dump(create_list, f, default_flow_style=False)
+
+            # Run structural diff only when downstream targeted processing needs it.
+            diff_result = None
+            if structural_diff:
+                diff_result = self._run_diff_compare(old_file, output_file)
+
+            # Run MD5 diff
+            file_changed = self._run_diff_model_changes(old_file, output_file)
 
         # Set change flag
         if file_changed and self.check_roles.get('save_previous', False):
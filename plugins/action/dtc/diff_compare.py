@@ -21,24 +21,47 @@
 
 from __future__ import absolute_import, division, print_function
 
+import json
 import yaml
 import os
 import datetime
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.diff_engine import (
+    DiffEngine,
+    EQUAL_ITEMS_MODES,
+)
+
+try:
+    from yaml import CSafeDumper as ReportDumper
+except ImportError:
+    from yaml import SafeDumper as ReportDumper
+
 display = Display()
 
+REPORT_FORMATS = ('yaml', 'json')
+
 
 class ActionModule(ActionBase):
     """
     Action plugin to compare existing links with new links for a fabric.
     Identifies new/modified, removed, and unchanged items.
+
+    Items are keyed by the diff_key declared for the file's resource in
+    resources/resource_types.yml (see DiffEngine). Optional arguments:
+      - equal_items:    'full' (default, diff_compare_equal_items) returns
+                        and reports unchanged items; 'summary' only counts
+                        them and returns an empty 'equal' list
+      - report_format:  'yaml' (default, diff_compare_report_format) or
+                        'json' comparison report
     """
     def __init__(self, *args, **kwargs):
         super(ActionModule, self).__init__(*args, **kwargs)
         self.old_file_path = None
         self.new_file_path = None
+        self.equal_items = 'full'
+        self.report_format = 'yaml'
 
     def run(self, tmp=None, task_vars=None):
         """
@@ -68,6 +91,17 @@ class ActionModule(ActionBase):
         except (AttributeError, KeyError) as e:
             return {'failed': True, 'msg': f'Missing required argument: {str(e)}'}
 
+        self.equal_items = self._task.args.get(
+            'equal_items', task_vars.get('diff_compare_equal_items', self.equal_items)
+        )
+        self.report_format = self._task.args.get(
+            'report_format', task_vars.get('diff_compare_report_format', self.report_format)
+        )
+        if self.equal_items not in EQUAL_ITEMS_MODES:
+            return {'failed': True, 'msg': f"equal_items must be one of {EQUAL_ITEMS_MODES}"}
+        if self.report_format not in REPORT_FORMATS:
+            return {'failed': True, 'msg': f"report_format must be one of {REPORT_FORMATS}"}
+
         old_items = []
         new_items = []
 
@@ -81,24 +115,40 @@ class ActionModule(ActionBase):
         except (FileNotFoundError, IOError):
             display.warning(f"New file not found: {self.new_file_path}, using empty list")
 
+        results['compare'] = self.compare(old_items, new_items)
+
+        return results['compare']
+
+    def compare(self, old_items, new_items):
+        """
+        Compare already-loaded old and new items for new_file_path.
+
+        Used directly by build_resource_data, which holds both renders in
+        memory and only needs new_file_path (and optionally equal_items and
+        report_format) set to select the comparison.
+
+        Args:
+            old_items: Previously rendered items (list)
+            new_items: Currently rendered items (list)
+
+        Returns:
+            dict: 'updated', 'removed' and 'equal' item lists ('equal' is
+            empty unless equal_items is 'full')
+        """
         # Normalize omit placeholder strings between old and new items
         old_items, new_items = self.normalize_omit_placeholders(old_items, new_items)
 
-        # File-type specific comparison
-        if self.new_file_path.endswith('ndfc_policy.yml'):
-            updated_items, removed_items, equal_items = self.compare_policies(old_items, new_items)
-        elif self.new_file_path.endswith('ndfc_interface_all.yml'):
-            updated_items, removed_items, equal_items = self.compare_items(old_items, new_items)
+        engine = DiffEngine.for_file(self.new_file_path, equal_items=self.equal_items)
+        updated_items, removed_items, equal_items, equal_count = engine.compare(old_items, new_items)
+        if self.new_file_path.endswith('ndfc_interface_all.yml'):
             removed_items = self.order_interface_remove(removed_items)
-        else:
-            updated_items, removed_items, equal_items = self.compare_items(old_items, new_items)
 
-        results['compare'] = {"updated": updated_items, "removed": removed_items, "equal": equal_items}
+        compare_results = {"updated": updated_items, "removed": removed_items, "equal": equal_items}
 
         # Write comparison results to file
-        self.write_comparison_results(results['compare'])
+        self.write_comparison_results(compare_results, equal_count)
 
-        return results['compare']
+        return compare_results
 
     @staticmethod
     def _count_policies(switch_blocks):
@@ -109,12 +159,16 @@ class ActionModule(ActionBase):
                 count += len(sw.get('policies', []))
         return count
 
-    def write_comparison_results(self, compare_results):
+    def write_comparison_results(self, compare_results, equal_count=None):
         """
         Write comparison results to a unique file in the same directory as new_file_path.
 
+        Equal items are only written with equal_items 'full'. The report is
+        dumped with the C YAML emitter when available, or as JSON.
+
         Args:
             compare_results (dict): Dictionary containing 'updated', 'removed', and 'equal' lists
+            equal_count (int): Number of unchanged items (default: len of 'equal')
         """
         if not self.new_file_path:
             display.warning("new_file_path is not set, cannot write comparison results")
@@ -125,43 +179,40 @@ class ActionModule(ActionBase):
 
         # Create a unique filename with timestamp
         base_filename = os.path.splitext(os.path.basename(self.new_file_path))[0]
-        output_filename = f"{base_filename}_comparison.yml"
-        output_path = os.path.join(output_dir, output_filename)
+        extensions = {'yaml': 'yml', 'json': 'json'}
+        output_path = os.path.join(output_dir, f"{base_filename}_comparison.{extensions[self.report_format]}")
 
         # Prepare the data to write
         is_policy = self.new_file_path.endswith('ndfc_policy.yml')
+        count = self._count_policies if is_policy else len
+        if equal_count is None:
+            equal_count = count(compare_results.get('equal', []))
         output_data = {
             'comparison_summary': {
                 'timestamp': datetime.datetime.now().isoformat(),
                 'source_file': self.new_file_path,
-                'total_updated': (
-                    self._count_policies(compare_results.get('updated', []))
-                    if is_policy
-                    else len(compare_results.get('updated', []))
-                ),
-                'total_removed': (
-                    self._count_policies(compare_results.get('removed', []))
-                    if is_policy
-                    else len(compare_results.get('removed', []))
-                ),
-                'total_equal': (
-                    self._count_policies(compare_results.get('equal', []))
-                    if is_policy
-                    else len(compare_results.get('equal', []))
-                ),
+                'total_updated': count(compare_results.get('updated', [])),
+                'total_removed': count(compare_results.get('removed', [])),
+                'total_equal': equal_count,
             },
             'updated_items': compare_results.get('updated', []),
             'removed_items': compare_results.get('removed', []),
-            'equal_items': compare_results.get('equal', [])
         }
+        if self.equal_items == 'full':
+            output_data['equal_items'] = compare_results.get('equal', [])
 
         try:
-            # Remove old file if it exists
-            if os.path.exists(output_path):
-                os.remove(output_path)
+            # Remove old reports (in either format) if they exist
+            for extension in extensions.values():
+                stale_path = os.path.join(output_dir, f"{base_filename}_comparison.{extension}")
+                if os.path.exists(stale_path):
+                    os.remove(stale_path)
 
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(output_data, f, default_flow_style=False, sort_keys=False)
+                if self.report_format == 'json':
+                    json.dump(output_data, f, default=str)
+                else:
+                    yaml.dump(output_data, f, Dumper=ReportDumper, default_flow_style=False, sort_keys=False)
         except Exception as e:
             display.warning(f"Failed to write comparison results to {output_path}: {str(e)}")
 
@@ -206,167 +257,6 @@ class ActionModule(ActionBase):
         display.v("Normalized old_items and new_items by removing __omit_place_holder__ entries")
         return cleaned_old, cleaned_new
 
-    KEY_MAPPING = {
-        'ndfc_underlay_ip_address.yml': 'entity_name',
-        'ndfc_attach_vrfs.yml': 'vrf_name',
-        'ndfc_attach_networks.yml': 'net_name',
-        'ndfc_vpc_domain_id_resource.yml': 'entity_name',
-        'ndfc_vpc_peering.yml': 'peerOneId'
-    }
-
-    def _create_fabric_link_key(self, item):
-        """
-        Create a unique key for fabric links from multiple attributes.
-
-        Args:
-            item (dict): The fabric link item containing link details
-
-        Returns:
-            str: A unique key for the fabric link or None if required fields are missing
-        """
-        required_fields = ['dst_fabric', 'src_device', 'src_interface', 'dst_interface']
-        if not all(item.get(field) for field in required_fields):
-            return None
-
-        return '_'.join([item.get(field) for field in required_fields])
-
-    def _create_interface_key(self, item):
-        """
-        Create a unique key for interfaces from multiple attributes.
-
-        Args:
-            item (dict): The interface item containing interface details
-
-        Returns:
-            str: A unique key for the interface per switch or None if required fields are missing
-        """
-        required_fields = ['name', 'switch']
-        if not all(item.get(field) for field in required_fields):
-            return None
-
-        switch_value = item.get('switch')
-        # Handle both string and list types for switch field
-        if isinstance(switch_value, list):
-            if not switch_value:  # Empty list check
-                return None
-            switch_id = switch_value[0]
-        else:
-            switch_id = switch_value
-
-        return f"{item.get('name')}_{switch_id}"
-
-    def dict_key(self, item):
-        """
-        Return the unique key for an item based on its type.
-
-        Args:
-            item (dict): The item to generate a key for
-
-        Returns:
-            str: The unique key for the item, or None if no key could be generated
-        """
-        if not isinstance(item, dict):
-            return None
-
-        filename = self.new_file_path
-
-        # Special handling for fabric links due to composite key
-        if filename.endswith('ndfc_fabric_links.yml'):
-            return self._create_fabric_link_key(item)
-
-        # Special handling for interfaces due to composite key
-        if filename.endswith('ndfc_interface_all.yml'):
-            return self._create_interface_key(item)
-
-        # Find matching file type and return corresponding key
-        for file_type, key_attr in self.KEY_MAPPING.items():
-            if filename.endswith(file_type):
-                return item.get(key_attr)
-
-        return None
-
-    def compare_policies(self, old_items, new_items):
-        """
-        Compare old and new policy data with nested switch-block structure.
-
-        Policy structure: [{switch: [{ip: str, policies: [{description, name, ...}]}]}]
-        Comparison key: (switch_ip, policy_description)
-        Compared fields: name, priority, policy_vars
-
-        Returns:
-            tuple: (updated, removed, equal) as lists of switch blocks.
-        """
-        old_lookup = {}
-        for switch_block in old_items:
-            for sw in switch_block.get('switch', []):
-                ip = sw.get('ip', '')
-                for pol in sw.get('policies', []):
-                    key = (ip, pol.get('description', ''))
-                    old_lookup[key] = pol
-
-        updated_switches = {}
-        equal_switches = {}
-
-        for switch_block in new_items:
-            for sw in switch_block.get('switch', []):
-                ip = sw.get('ip', '')
-                for pol in sw.get('policies', []):
-                    key = (ip, pol.get('description', ''))
-                    old_pol = old_lookup.pop(key, None)
-                    if old_pol is None or self._policy_differs(pol, old_pol):
-                        updated_switches.setdefault(ip, []).append(pol)
-                    else:
-                        equal_switches.setdefault(ip, []).append(pol)
-
-        removed_switches = {}
-        for key, pol in old_lookup.items():
-            removed_switches.setdefault(key[0], []).append(pol)
-
-        def to_switch_blocks(ip_dict):
-            if not ip_dict:
-                return []
-            return [{'switch': [{'ip': ip, 'policies': pols} for ip, pols in ip_dict.items()]}]
-
-        return to_switch_blocks(updated_switches), to_switch_blocks(removed_switches), to_switch_blocks(equal_switches)
-
-    @staticmethod
-    def _policy_differs(desired, previous):
-        """Compare two local policy dicts (rendered YAML). Returns True if different."""
-        if desired.get('name') != previous.get('name'):
-            return True
-        if desired.get('priority') != previous.get('priority'):
-            return True
-        if desired.get('policy_vars') != previous.get('policy_vars'):
-            return True
-        return False
-
-    def compare_items(self, old_items, new_items):
-        """
-        Compare old and new items, returning updated, removed, and equal items.
-        """
-
-        old_dict = {self.dict_key(item): item for item in old_items}
-        new_dict = {self.dict_key(item): item for item in new_items}
-
-        updated_items = []  # Updated items in new file
-        removed_items = []  # Items removed in new file
-        equal_items = []  # Items unchanged
-
-        for key, new_item in new_dict.items():
-            old_item = old_dict.get(key)
-            if old_item is None:
-                updated_items.append(new_item)
-            elif old_item != new_item:
-                updated_items.append(new_item)
-            else:
-                equal_items.append(new_item)
-
-        for key, old_item in old_dict.items():
-            if key not in new_dict:
-                removed_items.append(old_item)
-
-        return updated_items, removed_items, equal_items
-
     def order_interface_remove(self, removed_items):
         """
         Order interface removals to avoid dependency issues.
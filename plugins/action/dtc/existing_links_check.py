@@ -24,9 +24,13 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.link_index import LinkIndex
+
 display = Display()
 
 
@@ -110,7 +114,11 @@ class ActionModule(ActionBase):
         switch_list = self._task.args['switch_data_model']
         required_links = []
         not_required_links = []
+        # Configured links that matched no existing link, by content, so
+        # identical duplicates are only added once
+        new_link_keys = set()
         display.vvv(f"existing_links_check: {len(fabric_links)} configured links, {len(existing_links)} existing links from NDFC")
+        link_index = LinkIndex(existing_links, switch_list)
         for link in fabric_links:
             display.vvv(
                 f"existing_links_check: evaluating configured link "
@@ -118,106 +126,85 @@ class ActionModule(ActionBase):
                 f"dst={link.get('dst_device')}:{link.get('dst_interface')} "
                 f"template={link.get('template')}"
             )
-            for existing_link in existing_links:
-                if (
-                    'sw1-info' in existing_link and
-                    'sw2-info' in existing_link and
-                    'sw-sys-name' in existing_link['sw1-info'] and
-                    'sw-sys-name' in existing_link['sw2-info']
-                ):
-                    for switch in switch_list:
-                        if existing_link['sw1-info']['sw-sys-name'].lower() == switch['name'].lower():
-                            existing_link['sw1-info']['sw-sys-name'] = switch['management']['management_ipv4_address']
-                        if existing_link['sw2-info']['sw-sys-name'].lower() == switch['name'].lower():
-                            existing_link['sw2-info']['sw-sys-name'] = switch['management']['management_ipv4_address']
-
-                    # Check if the existing link matches the fabric link in either direction
-                    if ((existing_link['sw1-info']['sw-sys-name'].lower() == link['src_device'].lower() and
-                         existing_link['sw1-info']['if-name'].lower() == link['src_interface'].lower() and
-                         existing_link['sw2-info']['sw-sys-name'].lower() == link['dst_device'].lower() and
-                         existing_link['sw2-info']['if-name'].lower() == link['dst_interface'].lower()) or
-                        (existing_link['sw1-info']['sw-sys-name'].lower() == link['dst_device'].lower() and
-                         existing_link['sw1-info']['if-name'].lower() == link['dst_interface'].lower() and
-                         existing_link['sw2-info']['sw-sys-name'].lower() == link['src_device'].lower() and
-                         existing_link['sw2-info']['if-name'].lower() == link['src_interface'].lower())):
-
-                        existing_template = existing_link.get('templateName', '<missing>')
-                        display.vvv(
-                            f"existing_links_check: MATCH found — "
-                            f"existing sw1={existing_link['sw1-info']['sw-sys-name']}:{existing_link['sw1-info']['if-name']} "
-                            f"sw2={existing_link['sw2-info']['sw-sys-name']}:{existing_link['sw2-info']['if-name']} "
-                            f"templateName={existing_template}"
-                        )
-
-                        # If the link is in reverse order, swap the src and dst to match
-                        # swap also in profile peer1 and peer2
-                        # Don't swap IP addresses, bc they are assigned based on existing link
-                        # and should not change
-                        if (
-                            existing_link['sw1-info']['sw-sys-name'].lower() == link['dst_device'].lower()
-                            and existing_link['sw1-info']['if-name'].lower() == link['dst_interface'].lower()
-                            and existing_link['sw2-info']['sw-sys-name'].lower() == link['src_device'].lower()
-                            and existing_link['sw2-info']['if-name'].lower() == link['src_interface'].lower()
-                        ):
-                            link['src_device'], link['dst_device'] = link['dst_device'], link['src_device']
-                            link['src_interface'], link['dst_interface'] = link['dst_interface'], link['src_interface']
-                            # Safely swap descriptions without creating keys when absent
-                            p1_desc = link['profile'].pop('peer1_description', None)
-                            p2_desc = link['profile'].pop('peer2_description', None)
-                            if p2_desc is not None:
-                                link['profile']['peer1_description'] = p2_desc
-                            if p1_desc is not None:
-                                link['profile']['peer2_description'] = p1_desc
-                            # Safely swap freeform without creating keys when absent
-                            p1_free = link['profile'].pop('peer1_freeform', None)
-                            p2_free = link['profile'].pop('peer2_freeform', None)
-                            if p2_free is not None:
-                                link['profile']['peer1_freeform'] = p2_free
-                            if p1_free is not None:
-                                link['profile']['peer2_freeform'] = p1_free
-
-                        if 'templateName' not in existing_link:
-                            display.vvv("existing_links_check: → NOT REQUIRED (templateName missing)")
-                            not_required_links.append(link)
-                        elif existing_link['templateName'] == 'int_pre_provision_intra_fabric_link':
-                            display.vvv("existing_links_check: → REQUIRED (pre-provision)")
-                            required_links.append(link)
-                        elif existing_link['templateName'] == 'int_intra_fabric_num_link':
-                            # Populate additional fields from existing link
-                            # into the required link. IPs are assigned by ND and not managed in NaC Fabric link
-                            # at this time.
-                            # When template is defined as int_pre_provision_intra_fabric_link, template is converted
-                            # by ND to int_intra_fabric_num_link, when fabric-link is P2P and IPs are assigned.
-                            link['template'] = 'int_intra_fabric_num_link'
-                            link['profile']['peer1_ipv4_addr'] = existing_link['nvPairs']['PEER1_IP']
-                            link['profile']['peer2_ipv4_addr'] = existing_link['nvPairs']['PEER2_IP']
-                            if existing_link.get('nvPairs').get('ENABLE_MACSEC'):
-                                link['profile']['enable_macsec'] = existing_link['nvPairs']['ENABLE_MACSEC']
-                            else:
-                                link['profile']['enable_macsec'] = 'false'
-                            if self._link_profile_changed(link, existing_link):
-                                display.vvv("existing_links_check: → REQUIRED (num_link, enriched, profile changed)")
-                                required_links.append(link)
-                            else:
-                                display.vvv("existing_links_check: → NOT REQUIRED (num_link, enriched, profile matches)")
-                                not_required_links.append(link)
-                        elif existing_link['templateName'] == 'int_intra_fabric_unnum_link':
-                            link["template"] = "int_intra_fabric_unnum_link"
-                            if self._link_profile_changed(link, existing_link):
-                                display.vvv("existing_links_check: → REQUIRED (unnum_link, profile changed)")
-                                required_links.append(link)
-                            else:
-                                display.vvv("existing_links_check: → NOT REQUIRED (unnum_link, profile matches)")
-                                not_required_links.append(link)
-                        else:
-                            display.vvv(
-                                f"existing_links_check: → NOT REQUIRED "
-                                f"(unrecognized templateName={existing_link['templateName']})"
-                            )
-                            not_required_links.append(link)
-            if link not in required_links and link not in not_required_links:
-                display.vvv("existing_links_check: → REQUIRED (no existing match, new link)")
-                required_links.append(link)
+            matched = False
+            # Check if the existing link matches the fabric link in either direction
+            for existing_link in link_index.matches(link):
+                matched = True
+                existing_template = existing_link.get('templateName', '<missing>')
+                display.vvv(
+                    f"existing_links_check: MATCH found — "
+                    f"existing sw1={existing_link['sw1-info']['sw-sys-name']}:{existing_link['sw1-info']['if-name']} "
+                    f"sw2={existing_link['sw2-info']['sw-sys-name']}:{existing_link['sw2-info']['if-name']} "
+                    f"templateName={existing_template}"
+                )
+
+                # If the link is in reverse order, swap the src and dst to match
+                # swap also in profile peer1 and peer2
+                # Don't swap IP addresses, bc they are assigned based on existing link
+                # and should not change
+                if link_index.is_reversed(existing_link, link):
+                    link['src_device'], link['dst_device'] = link['dst_device'], link['src_device']
+                    link['src_interface'], link['dst_interface'] = link['dst_interface'], link['src_interface']
+                    # Safely swap descriptions without creating keys when absent
+                    p1_desc = link['profile'].pop('peer1_description', None)
+                    p2_desc = link['profile'].pop('peer2_description', None)
+                    if p2_desc is not None:
+                        link['profile']['peer1_description'] = p2_desc
+                    if p1_desc is not None:
+                        link['profile']['peer2_description'] = p1_desc
+                    # Safely swap freeform without creating keys when absent
+                    p1_free = link['profile'].pop('peer1_freeform', None)
+                    p2_free = link['profile'].pop('peer2_freeform', None)
+                    if p2_free is not None:
+                        link['profile']['peer1_freeform'] = p2_free
+                    if p1_free is not None:
+                        link['profile']['peer2_freeform'] = p1_free
+
+                if 'templateName' not in existing_link:
+                    display.vvv("existing_links_check: → NOT REQUIRED (templateName missing)")
+                    not_required_links.append(link)
+                elif existing_link['templateName'] == 'int_pre_provision_intra_fabric_link':
+                    display.vvv("existing_links_check: → REQUIRED (pre-provision)")
+                    required_links.append(link)
+                elif existing_link['templateName'] == 'int_intra_fabric_num_link':
+                    # Populate additional fields from existing link
+                    # into the required link. IPs are assigned by ND and not managed in NaC Fabric link
+                    # at this time.
+                    # When template is defined as int_pre_provision_intra_fabric_link, template is converted
+                    # by ND to int_intra_fabric_num_link, when fabric-link is P2P and IPs are assigned.
+                    link['template'] = 'int_intra_fabric_num_link'
+                    link['profile']['peer1_ipv4_addr'] = existing_link['nvPairs']['PEER1_IP']
+                    link['profile']['peer2_ipv4_addr'] = existing_link['nvPairs']['PEER2_IP']
+                    if existing_link.get('nvPairs').get('ENABLE_MACSEC'):
+                        link['profile']['enable_macsec'] = existing_link['nvPairs']['ENABLE_MACSEC']
+                    else:
+                        link['profile']['enable_macsec'] = 'false'
+                    if self._link_profile_changed(link, existing_link):
+                        display.vvv("existing_links_check: → REQUIRED (num_link, enriched, profile changed)")
+                        required_links.append(link)
+                    else:
+                        display.vvv("existing_links_check: → NOT REQUIRED (num_link, enriched, profile matches)")
+                        not_required_links.append(link)
+                elif existing_link['templateName'] == 'int_intra_fabric_unnum_link':
+                    link["template"] = "int_intra_fabric_unnum_link"
+                    if self._link_profile_changed(link, existing_link):
+                        display.vvv("existing_links_check: → REQUIRED (unnum_link, profile changed)")
+                        required_links.append(link)
+                    else:
+                        display.vvv("existing_links_check: → NOT REQUIRED (unnum_link, profile matches)")
+                        not_required_links.append(link)
+                else:
+                    display.vvv(
+                        f"existing_links_check: → NOT REQUIRED "
+                        f"(unrecognized templateName={existing_link['templateName']})"
+                    )
+                    not_required_links.append(link)
+            if not matched:
+                new_link_key = json.dumps(link, sort_keys=True, default=str)
+                if new_link_key not in new_link_keys:
+                    new_link_keys.add(new_link_key)
+                    display.vvv("existing_links_check: → REQUIRED (no existing match, new link)")
+                    required_links.append(link)
 
         display.vvv(
             f"existing_links_check: RESULT — "
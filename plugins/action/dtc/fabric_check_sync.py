@@ -26,6 +26,7 @@ __metaclass__ = type
 
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
 
 
 display = Display()
@@ -40,14 +41,12 @@ class ActionModule(ActionBase):
 
         fabric = self._task.args["fabric"]
 
-        ndfc_response = self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={
-                "method": "GET",
-                "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric}/inventory/switchesByFabric",
-            },
-            task_vars=task_vars,
-            tmp=tmp
+        # Sync status must be current, so bypass the response cache; the
+        # fresh inventory still refreshes it for later readers.
+        ndfc_response = NdfcModuleExecutor(self, task_vars, tmp).execute_rest(
+            "GET",
+            f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric}/inventory/switchesByFabric",
+            use_cache=False,
         )
 
         if ndfc_response['response'].get('DATA'):
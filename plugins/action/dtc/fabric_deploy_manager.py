@@ -42,6 +42,8 @@ Refactored for SOLID:
     construction, eliminating repeated if/elif branching in every method.
   - ChildFabricChangeDetector: Extracts VRF/Network change merging (SRP)
     Pure data logic separated from deployment orchestration.
+  - SyncBackoff: Adaptive poll schedule for sync checks (SRP)
+    Exponential backoff with jitter, bounded by a deadline.
   - FabricDeployManager: Uses ApiPathResolver for path resolution with no
     fabric-type branching in individual methods.
 """
@@ -54,8 +56,12 @@ __metaclass__ = type
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
 from ansible_collections.cisco.nac_dc_vxlan.plugins.filter.version_compare import version_compare
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+from concurrent.futures import ThreadPoolExecutor
 from time import monotonic, sleep
+import random
 import re
+import threading
 
 display = Display()
 
@@ -69,6 +75,11 @@ MULTISITE_FABRIC_TYPES = ('MSD', 'MCFG')
 # data model roles border_gateway, border_gateway_spine, border_gateway_super_spine
 BGW_SWITCH_ROLES = ('border gateway', 'border gateway spine', 'border gateway super spine')
 
+# Child fabric deployment error policies (deploy_child_fabric_on_error)
+#   fail_fast: child fabrics not yet started are skipped after a failure
+#   continue:  every changed child fabric is deployed
+CHILD_FABRIC_ERROR_POLICIES = ('fail_fast', 'continue')
+
 # VRF/Network response variable names per multisite fabric type
 # These are registered facts set by the create role's fabric-specific task files
 MULTISITE_RESPONSE_VARS = {
@@ -205,6 +216,64 @@ class ChildFabricChangeDetector:
         return vrf_changed + network_changed
 
 
+class SyncBackoff:
+    """Adaptive poll schedule for fabric sync checks.
+
+    Delays start at deploy_sync_interval_min seconds and grow by
+    deploy_sync_backoff per poll up to deploy_sync_interval_max, each
+    randomized by +/- deploy_sync_jitter (fraction) so concurrent runs do
+    not poll the controller in lockstep. No delay is handed out past the
+    deploy_sync_timeout deadline (seconds since the schedule started).
+    """
+
+    DEFAULTS = {
+        'deploy_sync_interval_min': 2.0,
+        'deploy_sync_interval_max': 30.0,
+        'deploy_sync_backoff': 2.0,
+        'deploy_sync_jitter': 0.2,
+        'deploy_sync_timeout': 600.0,
+    }
+
+    def __init__(self, interval_min, interval_max, backoff, jitter, timeout):
+        self.interval_min = max(0.0, interval_min)
+        self.interval_max = max(self.interval_min, interval_max)
+        self.backoff = max(1.0, backoff)
+        self.jitter = min(max(0.0, jitter), 1.0)
+        self.timeout = max(0.0, timeout)
+        self.start = monotonic()
+        self.polls = 0
+
+    @classmethod
+    def from_task_vars(cls, task_vars):
+        """Build the schedule from the deploy_sync_* task_vars."""
+        task_vars = task_vars or {}
+        values = {
+            key: float(task_vars.get(key) if task_vars.get(key) is not None else default)
+            for key, default in cls.DEFAULTS.items()
+        }
+        return cls(
+            interval_min=values['deploy_sync_interval_min'],
+            interval_max=values['deploy_sync_interval_max'],
+            backoff=values['deploy_sync_backoff'],
+            jitter=values['deploy_sync_jitter'],
+            timeout=values['deploy_sync_timeout'],
+        )
+
+    def elapsed(self):
+        return monotonic() - self.start
+
+    def next_delay(self):
+        """Return the delay before the next poll, or None once the deadline is reached."""
+        remaining = self.timeout - self.elapsed()
+        if remaining <= 0:
+            return None
+        # The exponent is capped so long waits cannot overflow the growth factor
+        delay = min(self.interval_max, self.interval_min * (self.backoff ** min(self.polls, 64)))
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        self.polls += 1
+        return min(delay, remaining)
+
+
 class FabricDeployManager:
     """Manages fabric deployment operations via NDFC REST API.
 
@@ -226,7 +295,7 @@ class FabricDeployManager:
         self.task_vars = params['task_vars']
         self.tmp = params['tmp']
         self.action_module = params['action_module']
-        self.module_name = "cisco.dcnm.dcnm_rest"
+        self.executor = NdfcModuleExecutor(self.action_module, self.task_vars, self.tmp)
 
         # API Path Resolution (Strategy Pattern)
         self.paths = ApiPathResolver(
@@ -244,8 +313,26 @@ class FabricDeployManager:
         # Fabric History
         self.fabric_history = []
 
-    def fabric_check_sync(self):
-        """Check if the fabric is in sync."""
+        # Per-switch sync convergence of the last check_sync
+        # {serial: {hostname, ccStatus, in_sync, polls, elapsed}}
+        self.sync_timeline = {}
+
+    def fabric_check_sync(self, serial_numbers=None):
+        """Wait for switches to reach sync.
+
+        Polls the switch inventory on an adaptive schedule (SyncBackoff)
+        until every target switch is in sync or the deadline is reached.
+        Targets are the given serial numbers (the switches just deployed)
+        or, without them, every managable switch of the fabric. A switch
+        drops out of the evaluation once it is in sync; the poll and time
+        at which it converged are recorded in sync_timeline. Target switches
+        missing from the inventory stay pending, and a failed inventory
+        query counts as not converged: it is retried on the same schedule
+        and the fabric is reported out of sync if the deadline is reached.
+
+        Multisite parent fabrics (MSD or MCFG) are checked once, as they are
+        dependent on child fabrics being in sync.
+        """
         step_start = monotonic()
         display.display(
             f"\n{'─' * display.columns}\n"
@@ -254,29 +341,45 @@ class FabricDeployManager:
             color='dark gray',
         )
 
-        self.fabric_in_sync = True
-        response = self._send_request("GET", self.paths.switches_by_fabric)
-
-        # For non-Multisite fabrics, retry up to 60 times if out-of-sync
-        # Exclude Multisite parent fabrics (MSD or MCFG) as they are dependent on child fabrics being in sync
-        RETRY_COUNT = 60
-        if self.fabric_type not in MULTISITE_FABRIC_TYPES:
-            for attempt in range(RETRY_COUNT):
-                self._fabric_check_sync_helper(response)
-                if self.fabric_in_sync:
-                    break
-                if (attempt + 1) == RETRY_COUNT and not self.fabric_in_sync:
-                    break
-                else:
-                    elapsed = monotonic() - step_start
-                    display.display(
-                        f"DEPLOY [{self.fabric_name}] "
-                        f"check_sync → out of sync, retry {attempt + 1}/{RETRY_COUNT} [{elapsed:.1f}s]",
-                        color='yellow',
-                    )
-                    sleep(10)
-                    self.fabric_in_sync = True
-                    response = self._send_request("GET", self.paths.switches_by_fabric)
+        schedule = SyncBackoff.from_task_vars(self.task_vars)
+        self.sync_timeline = {}
+        pending = set(serial_numbers) if serial_numbers else None
+        converged = False
+        polls = 0
+        while True:
+            response = self._send_request("GET", self.paths.switches_by_fabric, use_cache=False)
+            polls += 1
+            if self._sync_poll_failed(response):
+                state = f"inventory query failed ({response.get('RETURN_CODE')})"
+            else:
+                pending = self._fabric_check_sync_helper(response, pending, polls, schedule.elapsed())
+                converged = not pending
+                state = f"{len(pending)} switches out of sync"
+            if converged or self.fabric_type in MULTISITE_FABRIC_TYPES:
+                break
+            delay = schedule.next_delay()
+            if delay is None:
+                break
+            display.display(
+                f"DEPLOY [{self.fabric_name}] "
+                f"check_sync → {state}, poll {polls} "
+                f"(next in {delay:.1f}s) [{schedule.elapsed():.1f}s]",
+                color='yellow',
+            )
+            sleep(delay)
+
+        self.fabric_in_sync = converged
+        if serial_numbers and not self._sync_poll_failed(response):
+            others = [
+                switch.get('serialNumber', '') for switch in response['DATA']
+                if str(switch.get('managable')) == 'True' and switch.get('ccStatus') == 'Out-of-Sync'
+                and switch.get('serialNumber', '') not in self.sync_timeline
+            ]
+            if others:
+                display.v(
+                    f"DEPLOY [{self.fabric_name}] check_sync: switches out of sync "
+                    f"but not deployed in this run: {', '.join(others)}"
+                )
 
         elapsed = monotonic() - step_start
         if self.fabric_in_sync:
@@ -292,14 +395,51 @@ class FabricDeployManager:
                 color='yellow',
             )
 
-    def _fabric_check_sync_helper(self, response):
-        if response.get('DATA'):
-            for switch in response['DATA']:
-                # Devices that are not managable (example: pre-provisioned devices) should be
-                # skipped in this check
-                if str(switch['managable']) == 'True' and switch['ccStatus'] == 'Out-of-Sync':
-                    self.fabric_in_sync = False
-                    break
+    def _fabric_check_sync_helper(self, response, pending, polls, elapsed):
+        """Record the sync state of the pending switches of one poll.
+
+        Args:
+            response: switchesByFabric inventory response.
+            pending: Serial numbers still being waited on, or None for every
+                     managable switch in the inventory.
+            polls: Number of this poll.
+            elapsed: Seconds since the sync wait started.
+
+        Returns:
+            Set of serial numbers still out of sync, including pending
+            switches missing from the inventory.
+        """
+        out_of_sync = set(pending) if pending is not None else set()
+        for switch in response['DATA']:
+            serial = switch.get('serialNumber', '')
+            if pending is not None and serial not in pending:
+                continue
+            out_of_sync.discard(serial)
+            # Devices that are not managable (example: pre-provisioned devices) should be
+            # skipped in this check
+            if str(switch.get('managable')) != 'True':
+                continue
+            in_sync = switch.get('ccStatus') != 'Out-of-Sync'
+            self.sync_timeline[serial] = {
+                'hostname': switch.get('hostName', switch.get('logicalName', 'unknown')),
+                'ccStatus': switch.get('ccStatus'),
+                'in_sync': in_sync,
+                'polls': polls,
+                'elapsed': round(elapsed, 1),
+            }
+            if in_sync:
+                display.vvv(
+                    f"DEPLOY [{self.fabric_name}] check_sync: {serial} in sync "
+                    f"after {polls} polls [{elapsed:.1f}s]"
+                )
+            else:
+                out_of_sync.add(serial)
+        return out_of_sync
+
+    @staticmethod
+    def _sync_poll_failed(response):
+        """Whether a switchesByFabric poll returned no switch inventory."""
+        return response.get('RETURN_CODE') != 200 or not isinstance(response.get('DATA'), list)
 
     def fabric_config_save(self):
         """Trigger a config-save on the fabric."""
@@ -503,22 +643,9 @@ class FabricDeployManager:
         # Get last 2 history entries
         self.fabric_history = response.get('DATA', [])[0:2]
 
-    def _send_request(self, method, path, data=None):
+    def _send_request(self, method, path, data=None, use_cache=True):
         """Helper method to send REST API requests."""
-
-        module_args = {
-            "method": method,
-            "path": path,
-        }
-        if data:
-            module_args["data"] = data
-
-        response = self.action_module._execute_module(
-            module_name=self.module_name,
-            module_args=module_args,
-            task_vars=self.task_vars,
-            tmp=self.tmp
-        )
+        response = self.executor.execute_rest(method, path, json_data=data or None, use_cache=use_cache)
         if isinstance(response, dict) and 'response' in response:
             response = response['response']
         if isinstance(response, dict) and 'msg' in response and isinstance(response['msg'], dict):
@@ -580,7 +707,10 @@ class ActionModule(ActionBase):
 
         Checks task_vars['create_result']['msite_data'] first (populated when
         the create pipeline ran). Falls back to calling prepare_msite_data
-        plugin directly when create was skipped.
+        plugin directly when create was skipped; its child fabric and ToR
+        discovery reads through the per-cluster discovery cache
+        (MsiteDiscovery), so inventories already discovered in this run
+        are not queried again.
 
         Returns:
             msite_data dict or None if not a multisite fabric.
@@ -698,23 +828,99 @@ class ActionModule(ActionBase):
 
         # Deploy changed child fabrics
         if changed_fabrics:
-            child_fabric_type = f"{fabric_type}_Child_Fabric"
+            results = self._deploy_child_fabrics(results, params, changed_fabrics)
+
+        return results
 
+    def _deploy_child_fabrics(self, results, params, changed_fabrics):
+        """Deploy changed child fabrics, concurrently when configured.
+
+        Up to deploy_child_fabric_workers child fabrics run the full
+        manage_fabrics sequence at once, with at most
+        deploy_child_fabric_cluster_workers of them on the same cluster
+        (0: no per-cluster limit). With deploy_child_fabric_on_error
+        'fail_fast' the child fabrics not yet started are skipped after a
+        failure; with 'continue' all of them are deployed. Child fabrics
+        only run concurrently when ndfc_rest_mode is 'direct', as dcnm_rest
+        module executions cannot overlap.
+
+        Each child fabric runs with its own params and results, aggregated
+        under results['child_fabrics'][<name>]. The first failure (in
+        child fabric order) is reported as the overall result.
+        """
+        task_vars = params['task_vars'] or {}
+        workers = max(1, int(task_vars.get('deploy_child_fabric_workers', 1) or 1))
+        cluster_workers = max(0, int(task_vars.get('deploy_child_fabric_cluster_workers', 0) or 0))
+        on_error = task_vars.get('deploy_child_fabric_on_error', 'fail_fast') or 'fail_fast'
+        if on_error not in CHILD_FABRIC_ERROR_POLICIES:
+            results['failed'] = True
+            results['msg'] = (
+                f"Parameter 'deploy_child_fabric_on_error' must be one of: "
+                f"[{', '.join(CHILD_FABRIC_ERROR_POLICIES)}]"
+            )
+            return results
+
+        child_fabric_type = f"{params['fabric_type']}_Child_Fabric"
+        abort = threading.Event()
+        cluster_limits = {}
+        if cluster_workers:
             for changed_fabric in changed_fabrics:
-                params['fabric_name'] = changed_fabric['name']
-                params['fabric_type'] = child_fabric_type
-                params['cluster_name'] = changed_fabric.get('cluster', None)
+                cluster_limits.setdefault(
+                    changed_fabric.get('cluster'), threading.BoundedSemaphore(cluster_workers)
+                )
+
+        def deploy(changed_fabric):
+            child_params = dict(params)
+            child_params['fabric_name'] = changed_fabric['name']
+            child_params['fabric_type'] = child_fabric_type
+            child_params['cluster_name'] = changed_fabric.get('cluster', None)
+            limit = cluster_limits.get(child_params['cluster_name'])
+            if limit is not None:
+                limit.acquire()
+            try:
+                if abort.is_set():
+                    return {'failed': False, 'skipped': True}
                 display.display(
                     f"\n{'─' * display.columns}\n"
-                    f"DEPLOY [{params['fabric_name']}] "
-                    f"child_fabric (cluster={params['cluster_name']})\n"
+                    f"DEPLOY [{child_params['fabric_name']}] "
+                    f"child_fabric (cluster={child_params['cluster_name']})\n"
                     f"{'─' * display.columns}",
                     color='dark gray',
                 )
-
-                results = self.manage_fabrics(results, params)
-                if results.get('failed'):
-                    return results
+                child_results = self.manage_fabrics({'failed': False}, child_params)
+            finally:
+                if limit is not None:
+                    limit.release()
+            if child_results.get('failed') and on_error == 'fail_fast':
+                abort.set()
+            return child_results
+
+        executor = NdfcModuleExecutor(self, task_vars, params['tmp'])
+        workers = executor.max_concurrency(min(workers, len(changed_fabrics)))
+        if workers == 1:
+            child_results = [deploy(changed_fabric) for changed_fabric in changed_fabrics]
+        else:
+            display.v(
+                f"DEPLOY [{params['fabric_name']}] deploying {len(changed_fabrics)} child fabrics "
+                f"({workers} concurrent, {cluster_workers or 'unlimited'} per cluster, on_error={on_error})"
+            )
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                child_results = list(pool.map(deploy, changed_fabrics))
+
+        aggregated = results.setdefault('child_fabrics', {})
+        for changed_fabric, child_result in zip(changed_fabrics, child_results):
+            aggregated[changed_fabric['name']] = {
+                key: child_result[key]
+                for key in ('failed', 'skipped', 'msg', 'fabric_history')
+                if key in child_result
+            }
+            for name, timeline in child_result.get('sync_timeline', {}).items():
+                results.setdefault('sync_timeline', {})[name] = timeline
+            if child_result.get('failed') and not results.get('failed'):
+                results['failed'] = True
+                for key in ('msg', 'fabric_history'):
+                    if key in child_result:
+                        results[key] = child_result[key]
 
         return results
 
@@ -841,7 +1047,7 @@ class ActionModule(ActionBase):
 
             if deployable:
                 fabric_manager.switch_deploy(deployable)
-                fabric_manager.fabric_check_sync()
+                fabric_manager.fabric_check_sync(deployable)
 
                 # For non-Multisite fabrics, retry if still out-of-sync
                 if not fabric_manager.fabric_in_sync and params['fabric_type'] not in MULTISITE_FABRIC_TYPES:
@@ -854,7 +1060,7 @@ class ActionModule(ActionBase):
                     deployable = fabric_manager.get_deployable_switches()
                     if deployable:
                         fabric_manager.switch_deploy(deployable)
-                        fabric_manager.fabric_check_sync()
+                        fabric_manager.fabric_check_sync(deployable)
 
                 if not fabric_manager.fabric_in_sync and params['fabric_type'] not in MULTISITE_FABRIC_TYPES:
                     fabric_manager.fabric_history_get()
@@ -899,6 +1105,9 @@ class ActionModule(ActionBase):
                 results['fabric_history'] = fabric_manager.fabric_history
                 results['failed'] = True
 
+        if fabric_manager.sync_timeline:
+            results.setdefault('sync_timeline', {})[fabric_name] = fabric_manager.sync_timeline
+
         workflow_elapsed = monotonic() - workflow_start
         status_color = 'red' if results.get('failed') else 'dark gray'
         display.display(
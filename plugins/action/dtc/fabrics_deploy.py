@@ -26,6 +26,7 @@ __metaclass__ = type
 
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
 
 
 display = Display()
@@ -42,14 +43,9 @@ class ActionModule(ActionBase):
 
         for fabric in fabrics:
             display.display(f"Executing config-deploy on Fabric: {fabric}")
-            ndfc_deploy = self._execute_module(
-                module_name="cisco.dcnm.dcnm_rest",
-                module_args={
-                    "method": "POST",
-                    "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric}/config-deploy?forceShowRun=false",
-                },
-                task_vars=task_vars,
-                tmp=tmp
+            ndfc_deploy = NdfcModuleExecutor(self, task_vars, tmp).execute_rest(
+                "POST",
+                f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric}/config-deploy?forceShowRun=false",
             )
 
             # Successful response:
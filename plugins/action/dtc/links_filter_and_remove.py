@@ -27,6 +27,12 @@ __metaclass__ = type
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.link_index import (
+    LinkIndex,
+    configured_endpoints,
+    link_key,
+)
+
 display = Display()
 
 
@@ -41,41 +47,17 @@ class ActionModule(ActionBase):
         existing_links = self._task.args['existing_links']
         fabric_links = self._task.args['fabric_links']
         switch_list = self._task.args['switch_data_model']
-        required_links = []
         links_to_be_removed = []
-        filtered_existing_links = []
-        for existing_link in existing_links:
-            # Cannot assume the existing_link has the 'templateName' key so use get for safety
-            if existing_link.get('templateName') == "int_pre_provision_intra_fabric_link" or existing_link.get('templateName') == "int_intra_fabric_num_link":
-                filtered_existing_links.append(existing_link)
-                if (
-                    'sw1-info' in existing_link and
-                    'sw2-info' in existing_link and
-                    'sw-sys-name' in existing_link['sw1-info'] and
-                    'sw-sys-name' in existing_link['sw2-info']
-                ):
-                    for switch in switch_list:
-                        if existing_link['sw1-info']['sw-sys-name'].lower() == switch['name'].lower():
-                            existing_link['sw1-info']['sw-sys-name'] = switch['management']['management_ipv4_address']
-                        if existing_link['sw2-info']['sw-sys-name'].lower() == switch['name'].lower():
-                            existing_link['sw2-info']['sw-sys-name'] = switch['management']['management_ipv4_address']
-                    for link in fabric_links:
-                        if ((existing_link['sw1-info']['sw-sys-name'].lower() == link['src_device'].lower() and
-                             existing_link['sw1-info']['if-name'].lower() == link['src_interface'].lower() and
-                             existing_link['sw2-info']['sw-sys-name'].lower() == link['dst_device'].lower() and
-                             existing_link['sw2-info']['if-name'].lower() == link['dst_interface'].lower()) or
-                            (existing_link['sw1-info']['sw-sys-name'].lower() == link['dst_device'].lower() and
-                             existing_link['sw1-info']['if-name'].lower() == link['dst_interface'].lower() and
-                             existing_link['sw2-info']['sw-sys-name'].lower() == link['src_device'].lower() and
-                             existing_link['sw2-info']['if-name'].lower() == link['src_interface'].lower())):
-                            required_links.append(existing_link)
+        # Cannot assume the existing_link has the 'templateName' key so use get for safety
+        filtered_existing_links = [
+            existing_link for existing_link in existing_links
+            if existing_link.get('templateName') in ("int_pre_provision_intra_fabric_link", "int_intra_fabric_num_link")
+        ]
+        link_index = LinkIndex(filtered_existing_links, switch_list)
+        # Existing links match configured links in either direction
+        required_link_keys = {link_key(*configured_endpoints(link)) for link in fabric_links}
         for link in filtered_existing_links:
-            link_found = False
-            for required_link in required_links:
-                if link == required_link:
-                    link_found = True
-                    break
-            if not link_found:
+            if link_index.key_of(link) not in required_link_keys:
                 # The theory here is that links without a fabricName are links that are
                 # automatically created by the system and should not be removed.
                 #
@@ -26,6 +26,7 @@ __metaclass__ = type
 
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
 
 display = Display()
 
@@ -87,15 +88,8 @@ class ActionModule(ActionBase):
         Manage child fabrics associated with the parent fabric
         in Nexus Dashboard for MSD and MCFG parent fabrics.
         """
-        response = self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={
-                "method": method,
-                "path": path,
-                "json_data": data
-            },
-            task_vars=self.task_vars,
-            tmp=self.tmp
+        response = NdfcModuleExecutor(self, self.task_vars, self.tmp).execute_rest(
+            method, path, json_data=data
         )
 
         return response
@@ -39,8 +39,6 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import json
-
 from ansible.utils.display import Display
 
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.pipeline_base import (
@@ -49,6 +47,9 @@ from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.pipeline_base i
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.dtc_action_base import (
     DtcPipelineActionBase,
 )
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.policy_fetcher import (
+    PolicyFetcher,
+)
 
 display = Display()
 
@@ -389,93 +390,20 @@ class ResourceManager(PipelineRunnerBase):
         )
         return ip_map
 
-    def _fetch_policies_by_serials(self, serial_numbers):
-        """
-        Fetch policies for specific switches via per-switch API.
-
-        API: GET /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/
-             policies/switches?serialNumber=<comma-separated>
-
-        Chunks serial numbers into groups of 20 to avoid URL length issues.
-
-        Args:
-            serial_numbers: List of switch serial number strings.
-
-        Returns:
-            List of policy dicts from the controller.
-        """
-        chunk_size = 20
-        all_policies = []
-
-        for i in range(0, len(serial_numbers), chunk_size):
-            chunk = serial_numbers[i : i + chunk_size]
-            serials_param = ",".join(chunk)
-            api_path = (
-                "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control"
-                f"/policies/switches?serialNumber={serials_param}"
-            )
-
-            display.vvv(
-                f"CREATE [{self.fabric_name}] fetching policies for "
-                f"{len(chunk)} switches (chunk {i // chunk_size + 1})"
-            )
-
-            result = self.executor.execute_rest("GET", api_path)
-            if result.get("failed"):
-                display.warning(
-                    f"Per-switch policy query failed for chunk: "
-                    f"{result.get('msg', 'unknown')}"
-                )
-                continue
-
-            policies = self._parse_policy_response(result)
-            all_policies.extend(policies)
-
-        display.vvv(
-            f"CREATE [{self.fabric_name}] fetched {len(all_policies)} "
-            f"policies for {len(serial_numbers)} switches"
-        )
-        return all_policies
-
-    def _parse_policy_response(self, query_result):
-        """
-        Parse REST response into a list of policy dicts.
-
-        Handles string, dict (with DATA key), and list response formats.
-
-        Args:
-            query_result: Raw result from execute_rest.
-
-        Returns:
-            List of policy dicts.
-        """
-        response_data = query_result.get("response", {})
-        if isinstance(response_data, str):
-            try:
-                response_data = json.loads(response_data)
-            except (json.JSONDecodeError, TypeError):
-                return []
-
-        if isinstance(response_data, dict):
-            return response_data.get("DATA", [])
-        elif isinstance(response_data, list):
-            return response_data
-        return []
-
     def _policy_controller_diff(self, resource_name, desired_config):
         """
         Phase 2: Compare desired policies against NDFC controller state.
 
         Queries per-switch API using serial numbers resolved from
-        desired_config switch IPs. Bounds the diff to only the switches
-        NAC is managing.
+        desired_config switch IPs (PolicyFetcher). Bounds the diff to only
+        the switches NAC is managing.
 
         If no serial numbers can be resolved (unexpected), logs a warning
         and returns early — the full config will be sent to dcnm_policy
         without pre-filtering.
 
         Comparison:
-            Key: (switch_ip, description)
+            Key: (switch serial resolved from switch_ip, description)
             Fields: template name (name vs templateName),
                     priority, policy_vars vs nvPairs
 
@@ -510,16 +438,15 @@ class ResourceManager(PipelineRunnerBase):
             f"CREATE [{self.fabric_name}] policy diff using per-switch API "
             f"for {len(target_serials)} switches"
         )
-        controller_policies = self._fetch_policies_by_serials(target_serials)
-
-        # Build lookup: {(ipAddress, description): controller_policy}
+        # Index: {(serialNumber, description): controller_policy}
         # Only nac_ managed policies with empty source (user-created)
-        ctrl_lookup = {}
-        for cpol in controller_policies:
-            desc = cpol.get('description', '')
-            if (desc.startswith('nac_') or desc.startswith('nace_')) and cpol.get('source', '') == '':
-                ip = cpol.get('ipAddress', '')
-                ctrl_lookup[(ip, desc)] = cpol
+        ctrl_index = PolicyFetcher(self.executor, self.fabric_name, label='CREATE').fetch(
+            target_serials,
+            predicate=lambda cpol: (
+                (cpol.get('description') or '').startswith(('nac_', 'nace_'))
+                and cpol.get('source', '') == ''
+            ),
+        )
 
         # Filter desired config to new or changed policies only
         filtered_config = []
@@ -530,11 +457,12 @@ class ResourceManager(PipelineRunnerBase):
             filtered_switches = []
             for sw in switch_block.get('switch', []):
                 ip = sw.get('ip', '')
+                serial = ip_serial_map.get(ip)
                 diff_pols = []
                 for pol in sw.get('policies', []):
                     total_policies += 1
                     desc = pol.get('description', '')
-                    ctrl_pol = ctrl_lookup.get((ip, desc))
+                    ctrl_pol = ctrl_index.get(serial, desc) if serial else None
 
                     if ctrl_pol is None or self._policy_differs_from_controller(pol, ctrl_pol):
                         diff_pols.append(pol)
@@ -553,7 +481,7 @@ class ResourceManager(PipelineRunnerBase):
 
         display.v(
             f"CREATE [{self.fabric_name}] policy controller diff: "
-            f"{total_policies} desired, {len(ctrl_lookup)} on controller "
+            f"{total_policies} desired, {len(ctrl_index.by_key)} on controller "
             f"-> {diff_policies} to push"
         )
         return {'changed': False}
@@ -26,6 +26,7 @@ __metaclass__ = type
 
 from ansible.utils.display import Display
 from ansible.plugins.action import ActionBase
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
 
 display = Display()
 
@@ -45,15 +46,7 @@ class ActionModule(ActionBase):
         Get current child fabrics associated with the parent fabric
         in Nexus Dashboard for MSD and MCFG parent fabrics.
         """
-        response = self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={
-                "method": "GET",
-                "path": path,
-            },
-            task_vars=self.task_vars,
-            tmp=self.tmp
-        )
+        response = NdfcModuleExecutor(self, self.task_vars, self.tmp).execute_rest("GET", path)
 
         return response
 
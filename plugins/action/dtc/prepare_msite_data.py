@@ -29,7 +29,8 @@ from ansible.plugins.action import ActionBase
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import ndfc_get_fabric_attributes
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import ndfc_get_fabric_switches
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import restructure_leaf_tor_data
-from ansible_collections.cisco.nac_dc_vxlan.plugins.filter.version_compare import version_compare
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.msite_discovery import MsiteDiscovery
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
 import re
 
 display = Display()
@@ -49,6 +50,8 @@ class ActionModule(ActionBase):
 
         nd_version = self._task.args["nd_version"]
 
+        executor = NdfcModuleExecutor(self, task_vars, tmp)
+
         # Extract major, minor, patch and patch letter from nd_version
         # that is set in nac_dc_vxlan.dtc.connectivity_check role
         # Example nd_version: "3.1.1l" or "3.2.2m"
@@ -64,14 +67,9 @@ class ActionModule(ActionBase):
         if parent_fabric_type == 'MSD':
             # This is actaully not an accurrate API endpoint as it returns all fabrics in NDFC, not just the fabrics associated with MSD
             # Therefore, we need to get the fabric associations response and filter out the fabrics that are not associated with the parent fabric (MSD)
-            msd_fabric_associations = self._execute_module(
-                module_name="cisco.dcnm.dcnm_rest",
-                module_args={
-                    "method": "GET",
-                    "path": "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/msd/fabric-associations",
-                },
-                task_vars=task_vars,
-                tmp=tmp
+            msd_fabric_associations = executor.execute_rest(
+                "GET",
+                "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/msd/fabric-associations",
             )
 
             # Build a list of child fabrics that are associated with the parent fabric (MSD)
@@ -80,16 +78,23 @@ class ActionModule(ActionBase):
                 if fabric.get('fabricParent') == parent_fabric:
                     associated_child_fabrics.append(fabric.get('fabricName'))
 
-            # Get the fabric attributes and switches for each child fabric
+            # Get the fabric attributes and switches for each child fabric (concurrently, see MsiteDiscovery)
             # These queries are potentially trying to get data for a fabric that is not associated with the parent fabric (MSD) yet
-            child_fabrics_data = {}
-            for fabric in associated_child_fabrics:
-                child_fabrics_data.update({fabric: {}})
-                child_fabrics_data[fabric].update(
-                    {'type': [_fabric['fabricType'] for _fabric in msd_fabric_associations['response']['DATA'] if _fabric['fabricName'] == fabric][0]}
+            discovery = MsiteDiscovery(executor, parent_fabric)
+
+            def discover_child_fabric(fabric):
+                switches, _error = discovery.cached(
+                    None, fabric, 'switches', lambda: (ndfc_get_fabric_switches(self, task_vars, tmp, fabric), None)
                 )
-                child_fabrics_data[fabric].update({'attributes': ndfc_get_fabric_attributes(self, task_vars, tmp, fabric)})
-                child_fabrics_data[fabric].update({'switches': ndfc_get_fabric_switches(self, task_vars, tmp, fabric)})
+                return {
+                    'type': [_fabric['fabricType'] for _fabric in msd_fabric_associations['response']['DATA'] if _fabric['fabricName'] == fabric][0],
+                    'attributes': ndfc_get_fabric_attributes(self, task_vars, tmp, fabric),
+                    'switches': switches,
+                }
+
+            child_fabrics_data = dict(
+                zip(associated_child_fabrics, discovery.map(discover_child_fabric, associated_child_fabrics))
+            )
 
         elif parent_fabric_type == 'MCFG':
             # MCFG fabric associations API to get child fabrics associated with the parent MCFG fabric is performed differently than MSD
@@ -104,14 +109,9 @@ class ActionModule(ActionBase):
                 )
                 return results
 
-            mcfg_fabric_associations = self._execute_module(
-                module_name="cisco.dcnm.dcnm_rest",
-                module_args={
-                    "method": "GET",
-                    "path": f"/onemanage/appcenter/cisco/ndfc/api/v1/onemanage/fabrics/{parent_fabric}",
-                },
-                task_vars=task_vars,
-                tmp=tmp
+            mcfg_fabric_associations = executor.execute_rest(
+                "GET",
+                f"/onemanage/appcenter/cisco/ndfc/api/v1/onemanage/fabrics/{parent_fabric}",
             )
 
             if mcfg_fabric_associations.get('failed'):
@@ -132,62 +132,21 @@ class ActionModule(ActionBase):
                 return results
 
             # Build child fabrics data set that are associated with the parent fabric (MCFG)
-            child_fabrics_data = {}
-            for fabric in members:
-                fabric_name = fabric.get('fabricName')
-                fabric_cluster = fabric.get('clusterName')
-
-                child_fabrics_data.update({fabric_name: {}})
-                child_fabrics_data[fabric_name].update(
-                    {'type': fabric.get('fabricType')}
-                )
-                child_fabrics_data[fabric_name].update(
-                    {'attributes': fabric.get('nvPairs')}
-                )
-
-                proxy = ''
-                if version_compare(nd_major_minor_patch, '3.2.2', '<='):
-                    proxy = f'/onepath/{fabric_cluster}'
-                elif version_compare(nd_major_minor_patch, '4.1.1', '>='):
-                    proxy = f'/fedproxy/{fabric_cluster}'
-
-                mcfg_child_fabric_switches = self._execute_module(
-                    module_name="cisco.dcnm.dcnm_rest",
-                    module_args={
-                        "method": "GET",
-                        "path": f"{proxy}/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/inventory/switchesByFabric",
-                    },
-                    task_vars=task_vars,
-                    tmp=tmp
-                )
-
-                if mcfg_child_fabric_switches.get('failed'):
-                    results['failed'] = True
-                    results['msg'] = (
-                        f"Failed to query switches for MCFG child fabric '{fabric_name}' "
-                        f"(cluster: '{fabric_cluster}'): {mcfg_child_fabric_switches.get('msg', 'Unknown error')}"
-                    )
-                    return results
+            # Each member's switches are queried through its cluster's proxy path (concurrently, see MsiteDiscovery)
+            discovery = MsiteDiscovery(executor, parent_fabric, nd_major_minor_patch)
+            member_switches, error = discovery.mcfg_member_switches(members)
+            if error is not None:
+                results['failed'] = True
+                results['msg'] = error
+                return results
 
-                fabric_switches = []
-                switch_data = (mcfg_child_fabric_switches.get('response', {}).get('DATA') or [])
-                for fabric_switch in switch_data:
-                    if 'logicalName' in fabric_switch:
-                        fabric_switches.append(
-                            {
-                                'hostname': fabric_switch['logicalName'],
-                                'name': fabric_switch['logicalName'],
-                                'mgmt_ip_address': fabric_switch['ipAddress'],
-                                'fabric_name': fabric_switch['fabricName'],
-                                'fabric_cluster': fabric_cluster,
-                                'serial_number': fabric_switch['serialNumber'],
-                                'role': fabric_switch['switchRole'],
-                            }
-                        )
-
-                child_fabrics_data[fabric_name].update(
-                    {'switches': fabric_switches}
-                )
+            child_fabrics_data = {}
+            for fabric, fabric_switches in zip(members, member_switches):
+                child_fabrics_data[fabric.get('fabricName')] = {
+                    'type': fabric.get('fabricType'),
+                    'attributes': fabric.get('nvPairs'),
+                    'switches': fabric_switches,
+                }
 
         else:
             results['failed'] = True
@@ -196,74 +155,23 @@ class ActionModule(ActionBase):
 
         results['child_fabrics_data'] = child_fabrics_data
 
-        all_child_fabric_switches = []
-        for child_fabric in child_fabrics_data.keys():
-            all_child_fabric_switches = all_child_fabric_switches + child_fabrics_data[child_fabric]['switches']
+        all_child_fabric_switches = [
+            switch
+            for child_fabric in child_fabrics_data.values()
+            for switch in child_fabric['switches']
+        ]
 
         results['switches'] = all_child_fabric_switches
 
+        # One ToR switch per fabric identifies the fabric's ToR pairings
         tor_fabrics = {}
         for switch in all_child_fabric_switches:
             if switch['role'] == 'tor' and switch['fabric_name'] not in tor_fabrics:
-                if parent_fabric_type == 'MCFG':
-                    tor_fabrics[switch['fabric_name']] = switch['serial_number'], switch['fabric_cluster']
-                else:
-                    tor_fabrics[switch['fabric_name']] = (switch['serial_number'])
-
-        tor_ndfc_responses = {}
-        if tor_fabrics != {}:
-            for fabric in tor_fabrics.keys():
-                if parent_fabric_type == 'MCFG':
-                    proxy = ''
-                    if version_compare(nd_major_minor_patch, '3.2.2', '<='):
-                        proxy = f'/onepath/{tor_fabrics[fabric][1]}'
-                    elif version_compare(nd_major_minor_patch, '4.1.1', '>='):
-                        proxy = f'/fedproxy/{tor_fabrics[fabric][1]}'
-                    tor_response = self._execute_module(
-                        module_name="cisco.dcnm.dcnm_rest",
-                        module_args={
-                            "method": "GET",
-                            "path": f"{proxy}/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/tor/fabrics/{fabric}/switches/{tor_fabrics[fabric][0]}",
-                        },
-                        task_vars=task_vars,
-                        tmp=tmp
-                    )
-                else:
-                    tor_response = self._execute_module(
-                        module_name="cisco.dcnm.dcnm_rest",
-                        module_args={
-                            "method": "GET",
-                            "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/tor/fabrics/{fabric}/switches/{tor_fabrics[fabric]}",
-                        },
-                        task_vars=task_vars,
-                        tmp=tmp
-                    )
-                if 'response' in tor_response and 'DATA' in tor_response['response']:
-                    tor_ndfc_responses = []
-                    for pair in tor_response['response']['DATA']['torPairs']:
-                        entry = {}
-                        tor_name = pair['torName']
-                        if '~' in tor_name:
-                            entry['tor1'] = tor_name.split('~')[0]
-                            entry['tor2'] = tor_name.split('~')[1]
-                        else:
-                            entry['tor1'] = tor_name
-
-                        remarks_match = re.search(r'\(([^)]+)\)', pair.get('remarks', ''))
-                        if remarks_match:
-                            leaf_value = remarks_match.group(1)
-                            if ',' in leaf_value:
-                                entry['parent_leaf1'] = leaf_value.split(',')[0].strip()
-                                entry['parent_leaf2'] = leaf_value.split(',')[1].strip()
-                            else:
-                                entry['parent_leaf1'] = leaf_value
-                        else:
-                            entry['parent_leaf1'] = None
-
-                        tor_ndfc_responses.append(entry)
-                else:
-                    display.warning(f"Failed to get TOR data for fabric {fabric}: {tor_response}")
-                    tor_ndfc_responses[fabric] = []
+                tor_fabrics[switch['fabric_name']] = switch['serial_number'], switch.get('fabric_cluster')
+
+        tor_ndfc_responses = None
+        if tor_fabrics:
+            tor_ndfc_responses = discovery.tor_pairs(tor_fabrics)
 
         # Rebuild sm_data['vxlan']['multisite']['overlay']['vrf_attach_groups'] into
         # a structure that is easier to use just like data_model_extended.
@@ -318,7 +226,7 @@ class ActionModule(ActionBase):
             net_grp_name_list.append(grp['name'])
 
             # Restructure flat TOR entries under parent leaves if TORs exist in the fabric
-            if tor_ndfc_responses != {}:
+            if tor_ndfc_responses is not None:
                 grp['switches'] = restructure_leaf_tor_data(
                     grp['switches'], all_child_fabric_switches, tor_ndfc_responses
                 )
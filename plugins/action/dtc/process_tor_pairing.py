@@ -20,11 +20,15 @@
 # SPDX-License-Identifier: MIT
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
 from ansible.plugins.action import ActionBase  # type: ignore
 from ansible.utils.display import Display
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+
 display = Display()
 
 
@@ -473,6 +477,61 @@ class TorRemovalProcessor:
         return removal_operations
 
 
+# =============================================================================
+# TOR Operation Executor
+# =============================================================================
+
+class TorOperationExecutor:
+    """
+    Run independent TOR pairing API calls, up to a number of workers at once.
+
+    Each pairing (or discovery query per leaf) is its own NDFC request with no
+    ordering dependency on the others, so they can be in flight together.
+    Results are returned in input order, so reporting is identical to a
+    serial run.
+    """
+
+    DEFAULT_WORKERS = 1
+
+    def __init__(self, workers=None):
+        """
+        Initialize the TOR operation executor.
+
+        Args:
+            workers: Maximum concurrent requests (default 1, serial).
+        """
+        try:
+            self.workers = max(1, int(workers or self.DEFAULT_WORKERS))
+        except (TypeError, ValueError):
+            self.workers = self.DEFAULT_WORKERS
+
+    @staticmethod
+    def _timed(func, item):
+        """Call func(item) and return (result, elapsed seconds)."""
+        start = time.monotonic()
+        result = func(item)
+        return result, round(time.monotonic() - start, 3)
+
+    def run(self, func, items):
+        """
+        Apply func to every item, up to workers at once.
+
+        Args:
+            func: Callable sending one request and returning its result.
+            items: Operations (or leaf serial numbers) to process.
+
+        Returns:
+            list: (result, elapsed) tuples in input order.
+        """
+        items = list(items)
+        workers = min(self.workers, len(items))
+        if workers <= 1:
+            return [self._timed(func, item) for item in items]
+        display.v(f"TOR: {len(items)} requests ({workers} concurrent)")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: self._timed(func, item), items))
+
+
 # =============================================================================
 # Action Module
 # =============================================================================
@@ -510,41 +569,49 @@ class ActionModule(ActionBase):
           cisco.nac_dc_vxlan.dtc.process_tor_pairing:
             operation: remove
             fabric_name: "{{ fabric }}"
-            leaf_serial_number: "{{ leaf_sn }}"
+            leaf_serial_numbers: "{{ leaf_sns }}"
             current_pairings: "{{ desired_pairings }}"
 
     Parameters:
-        operation (str):          Required. 'create' or 'remove'.
-        fabric_name (str):        Required. Target NDFC fabric name.
-        pairings (list):          Direct mode — pre-computed pairing dicts.
-        leaf_serial_number (str): Discovery mode — triggers NDFC query + diff.
-        current_pairings (list):  Discovery mode — desired state to diff against.
+        operation (str):            Required. 'create' or 'remove'.
+        fabric_name (str):          Required. Target NDFC fabric name.
+        pairings (list):            Direct mode — pre-computed pairing dicts.
+        leaf_serial_number (str):   Discovery mode — triggers NDFC query + diff.
+        leaf_serial_numbers (list): Discovery mode — query every listed leaf;
+                                    pairings found on several leaves are merged.
+        current_pairings (list):    Discovery mode — desired state to diff against.
+
+    Pairing API calls (discovery queries, POSTs and DELETEs) run up to
+    tor_pairing_workers at once (default 1) when ndfc_rest_mode is 'direct';
+    over cisco.dcnm.dcnm_rest they run one after the other. Each entry of
+    'api_results' and 'discovery_results' reports its 'status' and 'elapsed'
+    seconds.
     """
 
+    _ndfc_executor = None
+
     # ─── NDFC REST helper ─────────────────────────────────────────────
 
+    def _executor(self, task_vars, tmp):
+        """NdfcModuleExecutor shared by every request of this task."""
+        if self._ndfc_executor is None:
+            self._ndfc_executor = NdfcModuleExecutor(self, task_vars or {}, tmp)
+        return self._ndfc_executor
+
     def _execute_ndfc_rest(
         self, method, path, json_data=None, task_vars=None, tmp=None
     ):
-        """Execute an NDFC REST API call via cisco.dcnm.dcnm_rest."""
-        module_args = {"method": method, "path": path}
-        if json_data is not None:
-            module_args["data"] = json_data
-        return self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args=module_args,
-            task_vars=task_vars,
-            tmp=tmp,
-        )
+        """Execute an NDFC REST API call through NdfcModuleExecutor."""
+        return self._executor(task_vars, tmp).execute_rest(method, path, json_data=json_data)
 
     # ─── Discovery ────────────────────────────────────────────────────
 
-    def _discover_pairings(self, fabric_name, leaf_serial_number, task_vars, tmp):
+    def _discover_leaf(self, fabric_name, leaf_serial_number, task_vars, tmp):
         """
-        Query NDFC for existing TOR pairings and parse the response.
+        Query NDFC for the TOR pairings of one leaf and parse the response.
 
         Returns:
-            dict with 'discovered_pairings' list and 'failed' status.
+            dict with 'discovered_pairings' list, 'status' and 'msg'.
         """
         api_path = (
             f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/tor/"
@@ -558,7 +625,7 @@ class ActionModule(ActionBase):
 
         if ndfc_result.get('failed'):
             return {
-                'failed': False,
+                'status': 'failed',
                 'discovered_pairings': [],
                 'msg': f"NDFC query returned: {ndfc_result.get('msg', 'unknown error')}",
             }
@@ -566,17 +633,83 @@ class ActionModule(ActionBase):
         discovery_response = ndfc_result.get('response', {})
         if not discovery_response:
             return {
-                'failed': False,
+                'status': 'empty',
                 'discovered_pairings': [],
                 'msg': 'No discovery response to process',
             }
 
         processor = TorDiscoveryProcessor({'discovery_response': discovery_response})
-        result = processor.process()
-        return {'failed': False, **result}
+        return {'status': 'ok', **processor.process()}
+
+    def _discover_pairings(self, fabric_name, leaf_serial_numbers, task_vars, tmp):
+        """
+        Query NDFC for existing TOR pairings of the given leaves.
+
+        Leaves are queried concurrently (tor_pairing_workers). A pairing
+        reported by several leaves (vPC leaf pairs) is kept once, from the
+        first leaf in input order. Failed queries are logged and contribute
+        no pairings.
+
+        Returns:
+            dict with 'discovered_pairings' list, per-leaf
+            'discovery_results' and 'failed' status.
+        """
+        leaf_results = self._operation_executor(task_vars, tmp).run(
+            lambda leaf: self._discover_leaf(fabric_name, leaf, task_vars, tmp),
+            leaf_serial_numbers,
+        )
+
+        discovered = []
+        seen = set()
+        discovery_results = []
+        normalize = TorDiffProcessor({})._normalize_serials
+        for leaf_serial_number, (leaf_result, elapsed) in zip(leaf_serial_numbers, leaf_results):
+            pairings = leaf_result.get('discovered_pairings', [])
+            discovery_results.append({
+                'leaf_serial_number': leaf_serial_number,
+                'status': leaf_result['status'],
+                'count': len(pairings),
+                'elapsed': elapsed,
+                'msg': leaf_result.get('msg', ''),
+            })
+            if leaf_result['status'] == 'failed':
+                display.warning(
+                    f"TOR Discovery: Query for leaf {leaf_serial_number} failed: {leaf_result.get('msg')}"
+                )
+            for pairing in pairings:
+                serial_key = normalize(pairing.get('payload', {}))
+                if serial_key not in seen:
+                    seen.add(serial_key)
+                    discovered.append(pairing)
+
+        return {
+            'failed': False,
+            'discovered_pairings': discovered,
+            'discovery_results': discovery_results,
+            'count': len(discovered),
+            'msg': f'Discovered {len(discovered)} TOR pairing(s) on {len(leaf_serial_numbers)} leaf switch(es)',
+        }
 
     # ─── Execution helpers ────────────────────────────────────────────
 
+    def _operation_executor(self, task_vars, tmp):
+        """
+        TorOperationExecutor sized by the tor_pairing_workers variable.
+
+        Requests only run concurrently over the direct REST client; module
+        executions are serialized by NdfcModuleExecutor.
+        """
+        operation_executor = TorOperationExecutor((task_vars or {}).get('tor_pairing_workers'))
+        operation_executor.workers = self._executor(task_vars, tmp).max_concurrency(operation_executor.workers)
+        return operation_executor
+
+    @staticmethod
+    def _summarize_timing(result, timings):
+        """Add aggregate latency figures of the executed operations to a result."""
+        if timings:
+            result['elapsed_total'] = round(sum(timings), 3)
+            result['elapsed_max'] = max(timings)
+
     def _execute_create_operations(self, pairings, fabric_name, task_vars, tmp):
         """Build and execute TOR pairing create operations via NDFC POST."""
         result = {
@@ -600,11 +733,9 @@ class ActionModule(ActionBase):
 
         display.v(f"TOR Create: Executing {len(operations)} POST operations")
 
-        for op in operations:
-            pairing_id = op['pairing_id']
-            display.v(f"TOR Create: Creating pairing {pairing_id}")
-
-            api_result = self._execute_ndfc_rest(
+        def create(op):
+            display.v(f"TOR Create: Creating pairing {op['pairing_id']}")
+            return self._execute_ndfc_rest(
                 method="POST",
                 path=op['path'],
                 json_data=json.dumps(op['payload']),
@@ -612,6 +743,11 @@ class ActionModule(ActionBase):
                 tmp=tmp,
             )
 
+        api_results = self._operation_executor(task_vars, tmp).run(create, operations)
+
+        for op, (api_result, elapsed) in zip(operations, api_results):
+            pairing_id = op['pairing_id']
+
             raw_msg = api_result.get('msg', '')
             if isinstance(raw_msg, dict):
                 error_msg = json.dumps(raw_msg)
@@ -628,6 +764,8 @@ class ActionModule(ActionBase):
                 'pairing_id': pairing_id,
                 'path': op['path'],
                 'success': not api_result.get('failed', False),
+                'status': 'failed' if api_result.get('failed', False) else 'created',
+                'elapsed': elapsed,
                 'response': api_result.get('response'),
                 'msg': error_msg,
                 'raw_result': api_result,
@@ -653,6 +791,7 @@ class ActionModule(ActionBase):
         else:
             result['msg'] = f"Successfully created {result['success_count']} TOR pairing(s)"
 
+        self._summarize_timing(result, [elapsed for _api_result, elapsed in api_results])
         return result
 
     def _execute_remove_operations(self, pairings, fabric_name, task_vars, tmp):
@@ -677,17 +816,20 @@ class ActionModule(ActionBase):
 
         display.v(f"TOR Remove: Executing {len(operations)} DELETE operations")
 
-        for op in operations:
-            pairing_id = op['pairing_id']
-            display.v(f"TOR Remove: Removing pairing {pairing_id}")
-
-            api_result = self._execute_ndfc_rest(
+        def remove(op):
+            display.v(f"TOR Remove: Removing pairing {op['pairing_id']}")
+            return self._execute_ndfc_rest(
                 method="DELETE",
                 path=op['path'],
                 task_vars=task_vars,
                 tmp=tmp,
             )
 
+        api_results = self._operation_executor(task_vars, tmp).run(remove, operations)
+
+        for op, (api_result, elapsed) in zip(operations, api_results):
+            pairing_id = op['pairing_id']
+
             raw_msg = api_result.get('msg', '')
             if isinstance(raw_msg, dict):
                 error_msg_str = (
@@ -709,10 +851,13 @@ class ActionModule(ActionBase):
                 full_error_msg = f"{full_error_msg} | stdout: {stdout} | stderr: {stderr}"
                 display.warning(f"TOR Remove MODULE FAILURE details: {api_result}")
 
+            success = not api_result.get('failed', False) or is_not_found_error
             op_result = {
                 'pairing_id': pairing_id,
                 'path': op['path'],
-                'success': not api_result.get('failed', False) or is_not_found_error,
+                'success': success,
+                'status': ('already_removed' if is_not_found_error else 'removed') if success else 'failed',
+                'elapsed': elapsed,
                 'response': api_result.get('response'),
                 'msg': full_error_msg,
                 'already_removed': is_not_found_error,
@@ -743,6 +888,7 @@ class ActionModule(ActionBase):
         else:
             result['msg'] = f"Successfully removed {result['success_count']} TOR pairing(s)"
 
+        self._summarize_timing(result, [elapsed for _api_result, elapsed in api_results])
         return result
 
     # ─── Mode dispatch ────────────────────────────────────────────────
@@ -766,12 +912,12 @@ class ActionModule(ActionBase):
 
     def _execute_with_discovery(self, operation, fabric_name, task_vars, tmp):
         """Discovery mode: query NDFC, diff against desired state, then execute."""
-        leaf_serial_number = self._task.args.get('leaf_serial_number', '')
+        leaf_serial_numbers = self._leaf_serial_numbers()
         current_pairings = self._task.args.get('current_pairings', []) or []
 
         # Step 1: Discover existing pairings from NDFC
         discovery = self._discover_pairings(
-            fabric_name, leaf_serial_number, task_vars, tmp
+            fabric_name, leaf_serial_numbers, task_vars, tmp
         )
         if discovery.get('failed'):
             discovery['operation'] = operation
@@ -798,6 +944,7 @@ class ActionModule(ActionBase):
                 'failed': False,
                 'operation': operation,
                 'discovered_count': len(discovered),
+                'discovery_results': discovery.get('discovery_results', []),
                 'diff_stats': diff.get('stats', {}),
                 'msg': f"No TOR pairings to {operation} after discovery diff",
             }
@@ -814,9 +961,18 @@ class ActionModule(ActionBase):
 
         result['operation'] = operation
         result['discovered_count'] = len(discovered)
+        result['discovery_results'] = discovery.get('discovery_results', [])
         result['diff_stats'] = diff.get('stats', {})
         return result
 
+    def _leaf_serial_numbers(self):
+        """Leaf serial numbers to discover, from leaf_serial_numbers and leaf_serial_number."""
+        leaf_serial_numbers = list(self._task.args.get('leaf_serial_numbers') or [])
+        leaf_serial_number = self._task.args.get('leaf_serial_number', '')
+        if leaf_serial_number:
+            leaf_serial_numbers.insert(0, leaf_serial_number)
+        return list(dict.fromkeys(sn for sn in leaf_serial_numbers if sn))
+
     # ─── Entry point ──────────────────────────────────────────────────
 
     def run(self, tmp=None, task_vars=None):
@@ -824,14 +980,14 @@ class ActionModule(ActionBase):
         Execute the action plugin.
 
         Routes to direct mode (pairings provided) or discovery mode
-        (leaf_serial_number provided) based on parameters.
+        (leaf_serial_number or leaf_serial_numbers provided) based on
+        parameters.
         """
         results = super(ActionModule, self).run(tmp, task_vars)
 
         operation = self._task.args.get('operation')
         fabric_name = self._task.args.get('fabric_name', '')
         pairings = self._task.args.get('pairings', [])
-        leaf_serial_number = self._task.args.get('leaf_serial_number', '')
 
         if operation not in ('create', 'remove'):
             results['failed'] = True
@@ -854,7 +1010,7 @@ class ActionModule(ActionBase):
                 )
 
             # Discovery mode: query NDFC, diff, execute
-            if leaf_serial_number:
+            if self._leaf_serial_numbers():
                 return self._execute_with_discovery(
                     operation, fabric_name, task_vars, tmp
                 )
@@ -862,7 +1018,7 @@ class ActionModule(ActionBase):
             # Nothing to do
             results['operation'] = operation
             results['msg'] = (
-                'No pairings or leaf_serial_number provided — skipped'
+                'No pairings or leaf serial numbers provided — skipped'
             )
             return results
 
@@ -67,6 +67,7 @@ __metaclass__ = type
 
 from ansible.plugins.action import ActionBase
 from ansible.utils.display import Display
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
 
 display = Display()
 
@@ -205,15 +206,7 @@ def _extract_resource_items(data):
 
 class ActionModule(ActionBase):
     def _execute_ndfc_rest(self, method, path, task_vars, tmp):
-        return self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={
-                "method": method,
-                "path": path,
-            },
-            task_vars=task_vars,
-            tmp=tmp,
-        )
+        return NdfcModuleExecutor(self, task_vars, tmp).execute_rest(method, path)
 
     def run(self, tmp=None, task_vars=None):
         result = super(ActionModule, self).run(tmp, task_vars)
@@ -25,7 +25,9 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.plugins.action import ActionBase
-from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import ndfc_get_switch_policy_using_desc
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import items_by_name
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.policy_fetcher import PolicyFetcher
 
 
 class ActionModule(ActionBase):
@@ -51,7 +53,18 @@ class ActionModule(ActionBase):
         dm_policy_groups = data_model["vxlan"]["policy"]["groups"]
         dm_policy_switches = data_model["vxlan"]["policy"]["switches"]
 
-        # For each switch current_sw_policies will be used to store a list of policies currently associated to the switch
+        # Policy groups keyed by name, so each switch's groups resolve without scanning the groups list
+        dm_policy_groups_by_name = items_by_name(dm_policy_groups)
+
+        # Topology switches keyed by serial number and policy switches keyed by management IP address
+        # The first entry wins, matching a scan of the data model lists
+        dm_topology_switches_by_serial = {}
+        for dm_topology_switch in dm_topology_switches:
+            dm_topology_switches_by_serial.setdefault(dm_topology_switch["serial_number"], dm_topology_switch)
+        dm_policy_switches_by_ip = {}
+        for position, dm_policy_switch in enumerate(dm_policy_switches):
+            dm_policy_switches_by_ip.setdefault(dm_policy_switch["mgmt_ip_address"], (position, dm_policy_switch))
+
         # For each switch that has unmanaged policies, the switch IP address and the list of unmanaged policies will be stored
         # This default dict is the start of what is required for the NDFC policy module
         unmanaged_policies = [
@@ -60,116 +73,80 @@ class ActionModule(ActionBase):
             }
         ]
 
-        # Loop over each serial number obtained from NDFC
+        # Resolve the management IP addresses of the NDFC switches found in the data model
+        # Switches without a management IP address in the data model are skipped and not queried
+        managed_switches = []
         for ndfc_sw_serial_number in ndfc_sw_serial_numbers:
-            # Set empty default values to reset for each switch
-            dm_switch_found = {}
-            dm_management_ipv4_address = ""
-            dm_management_ipv6_address = ""
-            dm_policy_switch = {}
-            current_sw_policies = []
-
-            # Check if the serial number from NDFC matches any serial number for a switch in the data model
-            # If found, grab the specific switch entry from the data model
-            # Also if a match, set the IP mgmt information for the current switch found
-            if any(switch["serial_number"] == ndfc_sw_serial_number for switch in dm_topology_switches):
-                dm_switch_found = next(
-                    (dm_topology_switch for dm_topology_switch in dm_topology_switches if dm_topology_switch["serial_number"] == ndfc_sw_serial_number)
-                )
-                dm_management_ipv4_address = dm_switch_found["management"].get("management_ipv4_address", None)
-                dm_management_ipv6_address = dm_switch_found["management"].get("management_ipv6_address", None)
-
-            # Skip this switch if no management ip address is found in the data model that matches the serial number from NDFC
-            if not dm_management_ipv4_address and not dm_management_ipv6_address:
+            dm_switch_found = dm_topology_switches_by_serial.get(ndfc_sw_serial_number)
+            if dm_switch_found is None:
                 continue
-
-            # Check if the name matching either the IPv4 or IPv6 mgmt address is found in the policy switches data model
-            # If found, grab the specific entry from the policy switches data model and store
-            # This stores the current switches policy group list
-            if any(
-                (switch["mgmt_ip_address"] == dm_management_ipv4_address for switch in dm_policy_switches) or
-                (switch["mgmt_ip_address"] == dm_management_ipv6_address for switch in dm_policy_switches)
-            ):
-                dm_policy_switch = next(
-                    (
-                        dm_policy_switch for dm_policy_switch in dm_policy_switches
-                        if dm_policy_switch["mgmt_ip_address"] == dm_management_ipv4_address or
-                        dm_policy_switch["mgmt_ip_address"] == dm_management_ipv6_address
-                    )
-                )
-
-                # Loop over each policy group associated to the current switch in the data model
+            dm_management_ipv4_address = dm_switch_found.get("management", {}).get("management_ipv4_address", None)
+            dm_management_ipv6_address = dm_switch_found.get("management", {}).get("management_ipv6_address", None)
+            if dm_management_ipv4_address or dm_management_ipv6_address:
+                managed_switches.append((ndfc_sw_serial_number, dm_management_ipv4_address, dm_management_ipv6_address))
+
+        # Query NDFC once for the policies of all switches with the description prepended with "nac_"
+        # Only switch-level (SWITCH/SWITCH) policies are considered, matching the per-switch query
+        ndfc_policy_index = PolicyFetcher(NdfcModuleExecutor(self, task_vars, tmp), fabric_name, label='REMOVE').fetch(
+            [serial_number for serial_number, _ipv4, _ipv6 in managed_switches],
+            predicate=lambda policy: (
+                (policy.get("description") or "").startswith("nac_")
+                and policy.get("source") == ""
+                and policy.get("entityType", "SWITCH") == "SWITCH"
+                and policy.get("entityName", "SWITCH") == "SWITCH"
+            ),
+        )
+
+        # Loop over each switch found in the data model, in NDFC serial number order
+        for ndfc_sw_serial_number, dm_management_ipv4_address, dm_management_ipv6_address in managed_switches:
+            # current_sw_policies stores the policies currently associated to the switch in the data model
+            current_sw_policies = set()
+
+            # Find the policy switch whose name matches either the IPv4 or IPv6 mgmt address
+            # When both match different entries, the one listed first in the data model is used
+            # If found, store the policies of each of its policy groups
+            # In the process of storing, reformat the policy description name to prepend "nac_" and replace white spaces with underscores
+            dm_policy_switch_matches = [
+                dm_policy_switches_by_ip[mgmt_ip_address]
+                for mgmt_ip_address in (dm_management_ipv4_address, dm_management_ipv6_address)
+                if mgmt_ip_address and mgmt_ip_address in dm_policy_switches_by_ip
+            ]
+            if dm_policy_switch_matches:
+                dm_policy_switch = min(dm_policy_switch_matches, key=lambda match: match[0])[1]
                 for dm_sw_policy_group in dm_policy_switch["groups"]:
-                    # Check if the policy group name associated to the switch is found in the policy groups data model
-                    # If found, store a list of current policies that are part of that policy group in the data model
-                    # In the process of storing, reformat the policy description name to prepend "nac_" and replace white spaces with underscores
-                    if any(dm_policy_group["name"] == dm_sw_policy_group for dm_policy_group in dm_policy_groups):
-                        current_sw_policies.extend(
-                            next(
-                                (
-                                    ["nac_" + policy["name"].replace(" ", "_") for policy in dm_policy_group["policies"]]
-                                    for dm_policy_group in dm_policy_groups if dm_policy_group["name"] == dm_sw_policy_group
-                                )
-                            )
+                    dm_policy_group = dm_policy_groups_by_name.get(dm_sw_policy_group)
+                    if dm_policy_group is not None:
+                        current_sw_policies.update(
+                            "nac_" + policy["name"].replace(" ", "_") for policy in dm_policy_group["policies"]
                         )
 
-            # Query NDFC for the current switch's serial number to get back any policy that exists for that switch
-            # with the description prepended with "nac_"
-            ndfc_policies_with_nac_desc = ndfc_get_switch_policy_using_desc(self, task_vars, tmp, ndfc_sw_serial_number, "nac_")
+            # Policies that exist for the current switch with the description prepended with "nac_"
+            ndfc_policies_with_nac_desc = ndfc_policy_index.for_serial(ndfc_sw_serial_number)
 
             # Currently, check two things to determine an unmanaged policy:
             # Check no matching policy in the data model against the policy returned from NDFC for the current switch
             # This check uses the prepended "nac_"
             # Additionally, as of now, check no matching policy is from the VRF Lite policy of the data model
-            if any(
-                (ndfc_policy_with_nac_desc["description"] not in current_sw_policies)
+            _unmanaged_policies = [
+                {
+                    "name": ndfc_policy_with_nac_desc["policyId"],
+                    "description": ndfc_policy_with_nac_desc["description"]
+                }
                 for ndfc_policy_with_nac_desc in ndfc_policies_with_nac_desc
-            ):
-                # If found, do the following:
-                # Update Ansible result status
-                # Add the switch to unmanaged_policies payload
-                # Get the last index of where the switch was added
-                # Build specific unmanaged policy entry
-                # Add unmanaged policy entry to last switch added to list
+                if ndfc_policy_with_nac_desc["description"] not in current_sw_policies
+            ]
 
+            if _unmanaged_policies:
                 # Update Ansible for a configuration change
                 results['changed'] = True
 
                 # Update unmanaged_policies with the IP address of the switch that now has unmanaged policy
+                # and the policies key the NDFC policy module expects
                 # The NDFC policy module can take a list of various dictionaries with the switch key previously being pre-stored
-                # Given this, each update the switch element with a new switch entry is the zeroth reference location always in unmanaged_policies
-                # Example:
-                # [
-                #     {
-                #         "switch": [
-                #             {
-                #                 "ip": <mgmt_ip_address>,
-                #             }
-                #         ]
-                #     }
-                # ]
+                # Given this, each new switch entry is added to the zeroth reference location always in unmanaged_policies
                 unmanaged_policies[0]["switch"].append(
                     {
-                        "ip": dm_management_ipv4_address if dm_management_ipv4_address else dm_management_ipv6_address
-                    }
-                )
-
-                # Grab the last index of a switch added
-                last_idx = len(unmanaged_policies[0]["switch"]) - 1
-
-                # Since initially found there is indeed an unmananged policy, build a list of unmanaged policy
-                _unmanaged_policies = [
-                    {
-                        "name": ndfc_policy_with_nac_desc["policyId"],
-                        "description": ndfc_policy_with_nac_desc["description"]
-                    }
-                    for ndfc_policy_with_nac_desc in ndfc_policies_with_nac_desc
-                    if (ndfc_policy_with_nac_desc["description"] not in current_sw_policies)
-                ]
-
-                # Update the dictionary entry for the last switch with the expected policies key the NDFC policy module expects
-                unmanaged_policies[0]["switch"][last_idx].update(
-                    {
+                        "ip": dm_management_ipv4_address if dm_management_ipv4_address else dm_management_ipv6_address,
                         "policies": _unmanaged_policies
                     }
                 )
@@ -200,17 +177,8 @@ class ActionModule(ActionBase):
 
         # Execute dcnm_policy deletion if unmanaged policies were found
         if unmanaged_policies[0]["switch"]:
-            policy_result = self._execute_module(
-                module_name="cisco.dcnm.dcnm_policy",
-                module_args={
-                    "fabric": fabric_name,
-                    "use_desc_as_key": True,
-                    "config": unmanaged_policies,
-                    "deploy": deploy,
-                    "state": "deleted",
-                },
-                task_vars=task_vars,
-                tmp=tmp,
+            policy_result = NdfcModuleExecutor(self, task_vars, tmp).execute(
+                "cisco.dcnm.dcnm_policy", "deleted", unmanaged_policies, fabric_name, deploy=deploy,
             )
             if policy_result.get('failed'):
                 results['failed'] = True
@@ -29,8 +29,9 @@ import json
 from ansible.plugins.action import ActionBase
 from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import (
     ndfc_get_fabric_policies_by_template,
-    ndfc_get_switch_policy_using_template
 )
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.policy_fetcher import PolicyFetcher
 
 
 class ActionModule(ActionBase):
@@ -52,12 +53,11 @@ class ActionModule(ActionBase):
 
     def _get_policies_with_fallback(self, fabric_name, template_name, switch_serial_numbers):
         """
-        Get switch policies using bulk API if available, fallback to per-switch queries.
+        Get switch policies using bulk API if available, fallback to chunked
+        per-switch queries (PolicyFetcher).
 
         Returns:
-            tuple: (policies_dict, used_bulk_api)
-                - policies_dict: Dictionary mapping serial_number to policy data (or None if not found)
-                - used_bulk_api: Boolean indicating if bulk API was used
+            dict: Dictionary mapping serial_number to policy data (or None if not found)
         """
         policies_dict = {}
 
@@ -72,24 +72,24 @@ class ActionModule(ActionBase):
                     template_name=template_name
                 )
                 # If successful, return the bulk result
-                return policies_dict, True
+                return policies_dict
             except Exception as e:
                 # Bulk API not available or failed, mark it and fall back
                 self.bulk_api_available = False
 
-        # Fallback: Query each switch individually
-        # Note: ndfc_get_switch_policy_using_template handles the host_11_1 special case
+        # Fallback: Query the switches in chunks by serial number
+        policy_index = PolicyFetcher(
+            NdfcModuleExecutor(self, self.task_vars, self.tmp), fabric_name, label='HOSTNAME'
+        ).fetch(
+            switch_serial_numbers,
+            predicate=lambda policy: policy.get("templateName") == template_name,
+        )
         for switch_serial_number in switch_serial_numbers:
-            policy = ndfc_get_switch_policy_using_template(
-                self=self,
-                task_vars=self.task_vars,
-                tmp=self.tmp,
-                switch_serial_number=switch_serial_number,
-                template_name=template_name
+            policies_dict[switch_serial_number] = next(
+                iter(policy_index.for_serial(switch_serial_number)), None
             )
-            policies_dict[switch_serial_number] = policy
 
-        return policies_dict, False
+        return policies_dict
 
     def nd_policy_add(self, switch_name, switch_serial_number):
         """
@@ -108,15 +108,10 @@ class ActionModule(ActionBase):
             "serialNumber": switch_serial_number
         }
 
-        nd_policy_add = self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={
-                "method": "POST",
-                "path": "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies",
-                "data": json.dumps(policy)
-            },
-            task_vars=self.task_vars,
-            tmp=self.tmp
+        nd_policy_add = NdfcModuleExecutor(self, self.task_vars, self.tmp).execute_rest(
+            "POST",
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies",
+            json_data=json.dumps(policy)
         )
 
         if nd_policy_add.get('response'):
@@ -141,15 +136,10 @@ class ActionModule(ActionBase):
         """
         policy_ids = ",".join([str(value["policyId"]) for key, value in self.policy_update.items()])
 
-        nd_policy_update = self._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args={
-                "method": "PUT",
-                "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/{policy_ids}/bulk",
-                "data": json.dumps(list(self.policy_update.values()))
-            },
-            task_vars=self.task_vars,
-            tmp=self.tmp
+        nd_policy_update = NdfcModuleExecutor(self, self.task_vars, self.tmp).execute_rest(
+            "PUT",
+            f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/{policy_ids}/bulk",
+            json_data=json.dumps(list(self.policy_update.values()))
         )
 
         if nd_policy_update.get('response'):
@@ -179,22 +169,21 @@ class ActionModule(ActionBase):
 
         # Get policies using bulk API with fallback to per-switch queries
         fabric_name = data_model["vxlan"]["fabric"]["name"]
-        policies_dict, used_bulk_api = self._get_policies_with_fallback(
+        policies_dict = self._get_policies_with_fallback(
             fabric_name=fabric_name,
             template_name=template_name,
             switch_serial_numbers=switch_serial_numbers
         )
 
         for switch_serial_number in switch_serial_numbers:
-            # Look up policy from the dictionary (bulk or per-switch query)
+            # Look up policy from the dictionary (bulk or chunked per-switch query)
             policy_match = policies_dict.get(switch_serial_number)
 
             switch_match = next((item for item in dm_switches if item["serial_number"] == switch_serial_number))
 
             if not policy_match:
-                # If bulk API was used and policy not found for non-host_11_1 template, raise error
-                # (per-switch method already handles this via exception in helper function)
-                if used_bulk_api and template_name != "host_11_1":
+                # Policy not found for non-host_11_1 template, raise error
+                if template_name != "host_11_1":
                     err_msg = f"Policy for template {template_name} and switch {switch_serial_number} not found!"
                     err_msg += f" Please ensure switch with serial number {switch_serial_number} is part of the fabric."
                     results['failed'] = True
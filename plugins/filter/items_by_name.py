@@ -0,0 +1,89 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+DOCUMENTATION = r"""
+  name: items_by_name
+  short_description: Index a list of dicts by name
+  description:
+    - Build a dict of the items of a list keyed by their name, so templates resolve
+      an item by name with a single lookup instead of a json_query over the list.
+    - When several items share a name, the first one wins, like
+      C([?(@.name==`name`)] | first) with json_query.
+  positional: key
+  options:
+    _input:
+      description: List of dicts, for example vxlan.policy.policies or vxlan.policy.groups.
+      type: list
+      elements: dict
+      required: true
+    key:
+      description: Key holding the name of each item.
+      type: str
+      default: name
+"""
+
+EXAMPLES = r"""
+
+# {% set policies_by_name = data_model_extended.vxlan.policy.policies | cisco.nac_dc_vxlan.items_by_name %}
+# {% set policy_match = policies_by_name[policy.name] %}
+
+switches_by_serial: "{{ data_model_extended.vxlan.topology.switches | cisco.nac_dc_vxlan.items_by_name('serial_number') }}"
+"""
+
+RETURN = r"""
+  _value:
+    description:
+      - A dict of the items keyed by name.
+    type: dict
+"""
+
+from ansible.errors import AnsibleFilterTypeError
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import items_by_name as _items_by_name
+
+
+def items_by_name(items, key='name'):
+    """
+    Index a list of dicts by the value of one of their keys.
+    Args:
+        items (list): List of dicts.
+        key (str): Key holding the name of each item.
+    Returns:
+        dict: Item for each name, the first one when names repeat.
+    Raises:
+        AnsibleFilterTypeError: If items is not a list of dicts.
+    """
+    if items is None:
+        return {}
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise AnsibleFilterTypeError(f"items_by_name requires a list of dicts, however got: {type(items)}")
+
+    return _items_by_name(items, key)
+
+
+# ---- Ansible filters ----
+class FilterModule(object):
+    """ Items by name filter """
+
+    def filters(self):
+        return {
+            "items_by_name": items_by_name
+        }
@@ -0,0 +1,334 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Controller Response Cache — Run-scoped GET response cache for NDFC REST calls.
+
+The DTC plugins repeat the same controller reads many times per run (for
+example switchesByFabric is read by the remove pipeline, the create pipeline,
+fabric deployment and prepare_msite_data). NdfcModuleExecutor.execute_rest
+reads through this cache so repeated GETs are answered locally.
+
+Entries are keyed by (controller, method, path), where the controller is
+the ansible_user@ansible_host the request is sent to, and expire after
+ndfc_rest_cache_ttl seconds (0 disables the cache). Writes invalidate the
+entries of the same controller:
+  - POST/PUT/DELETE to a path containing /fabrics/<name> drop the entries
+    of that fabric plus entries that are not tied to any fabric
+  - writes without a fabric in the path, and writes that change multisite
+    membership (msdAdd, msdExit, onemanage members), drop every entry
+
+Scope is selected with ndfc_rest_cache_scope:
+  - 'task' (default): entries live in the controller process memory and are
+                      shared by every executor of the running task, including
+                      nested plugins
+  - 'run':            entries are additionally persisted under a directory
+                      keyed by the local user and the ansible-playbook
+                      process, so separate tasks
+                      (create, remove, deploy) share them. Writes made by
+                      native Ansible tasks outside the DTC plugins do not
+                      invalidate entries; the TTL bounds their staleness.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from ansible.utils.display import Display
+
+display = Display()
+
+
+class ControllerResponseCache:
+    """
+    Thread-safe GET response cache with per-fabric write invalidation.
+
+    The in-memory store is class level so every NdfcModuleExecutor in the
+    process shares it; instances only carry the TTL and scope settings.
+    """
+
+    # HTTP methods whose responses are cached
+    CACHEABLE_METHODS = frozenset({'GET'})
+
+    # HTTP methods that invalidate cached responses
+    WRITE_METHODS = frozenset({'POST', 'PUT', 'DELETE'})
+
+    # Supported values for the ndfc_rest_cache_scope variable
+    SCOPES = ('task', 'run')
+
+    # Prefix of the per-run directories used by the 'run' scope
+    RUN_DIR_PREFIX = 'nac_dc_vxlan_rest_cache_'
+
+    _FABRIC_PATTERN = re.compile(r'/fabrics/([^/?]+)')
+
+    # Writes that change the fabrics of several entries (parent and children)
+    _MEMBERSHIP_PATTERN = re.compile(r'/fabrics/(msdAdd|msdExit)\b|/members\b')
+
+    # (controller, method, path) -> (expires_at, fabric, result)
+    _entries = {}
+    _lock = threading.Lock()
+
+    def __init__(self, ttl, scope='task', run_id=None, controller=''):
+        """
+        Initialize the cache view.
+
+        Args:
+            ttl: Entry lifetime in seconds.
+            scope: 'task' (in-memory) or 'run' (in-memory plus run directory).
+            run_id: Identifier of the run directory. Defaults to the parent
+                    process id, which is the ansible-playbook process for
+                    forked task workers.
+            controller: Identity of the controller the cached requests are
+                        sent to (user@host). Part of every entry key.
+        """
+        self.ttl = ttl
+        self.scope = scope
+        self.controller = controller
+        self.run_dir = None
+        if scope == 'run':
+            self.run_dir = os.path.join(
+                tempfile.gettempdir(),
+                f"{_run_dir_prefix()}{run_id if run_id is not None else os.getppid()}",
+            )
+
+    @classmethod
+    def from_task_vars(cls, task_vars, templar=None):
+        """
+        Build a cache view from ndfc_rest_cache_ttl and ndfc_rest_cache_scope.
+
+        The controller identity is taken from ansible_user and ansible_host.
+
+        Args:
+            task_vars: Ansible task variables.
+            templar: Optional Templar used to resolve templated values.
+
+        Returns:
+            ControllerResponseCache, or None when the cache is disabled.
+        """
+        try:
+            ttl = float(task_vars.get('ndfc_rest_cache_ttl', 0) or 0)
+        except (TypeError, ValueError):
+            display.warning(
+                f"Invalid ndfc_rest_cache_ttl '{task_vars.get('ndfc_rest_cache_ttl')}' — cache disabled"
+            )
+            return None
+        if ttl <= 0:
+            return None
+
+        scope = task_vars.get('ndfc_rest_cache_scope', 'task')
+        if scope not in cls.SCOPES:
+            display.warning(f"Unknown ndfc_rest_cache_scope '{scope}' — using 'task'")
+            scope = 'task'
+
+        controller = []
+        for name in ('ansible_user', 'ansible_host'):
+            value = task_vars.get(name) or ''
+            if templar is not None and isinstance(value, str):
+                value = templar.template(value)
+            controller.append(str(value))
+        return cls(ttl, scope=scope, controller='@'.join(controller))
+
+    @classmethod
+    def fabric_of(cls, path):
+        """Return the fabric name referenced by an API path, or None."""
+        match = cls._FABRIC_PATTERN.search(path or '')
+        return match.group(1) if match else None
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Lookup / Store
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def get(self, method, path):
+        """
+        Return a copy of the cached result of (method, path) on this controller, or None.
+
+        Args:
+            method: HTTP method.
+            path: NDFC API path.
+        """
+        method = method.upper()
+        if method not in self.CACHEABLE_METHODS:
+            return None
+
+        key = (self.controller, method, path)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+
+        if entry is None and self.run_dir:
+            entry = self._read_run_entry(key, now)
+            if entry is not None:
+                with self._lock:
+                    self._entries[key] = entry
+
+        if entry is None:
+            return None
+        return copy.deepcopy(entry[2])
+
+    def put(self, method, path, result):
+        """
+        Store a successful GET result.
+
+        Failed results and non-cacheable methods are ignored.
+
+        Args:
+            method: HTTP method.
+            path: NDFC API path.
+            result: dcnm_rest-shaped result dict.
+        """
+        method = method.upper()
+        if method not in self.CACHEABLE_METHODS or not self._is_success(result):
+            return
+
+        key = (self.controller, method, path)
+        entry = (time.time() + self.ttl, self.fabric_of(path), copy.deepcopy(result))
+        with self._lock:
+            self._entries[key] = entry
+        if self.run_dir:
+            self._write_run_entry(key, entry)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Invalidation
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def invalidate_path(self, path):
+        """Invalidate the entries affected by a write to path."""
+        if self._MEMBERSHIP_PATTERN.search(path or ''):
+            self.invalidate_fabric(None)
+        else:
+            self.invalidate_fabric(self.fabric_of(path))
+
+    def invalidate_fabric(self, fabric):
+        """
+        Invalidate the entries of a fabric plus entries not tied to a fabric.
+
+        Only entries of this view's controller are affected.
+
+        Args:
+            fabric: Fabric name, or None to invalidate every entry.
+        """
+        with self._lock:
+            for key in [k for k, v in self._entries.items()
+                        if k[0] == self.controller and (fabric is None or v[1] in (fabric, None))]:
+                del self._entries[key]
+
+        if self.run_dir and os.path.isdir(self.run_dir):
+            prefix = _digest(self.controller)
+            patterns = [f"{prefix}-*.json"] if fabric is None else [
+                f"{prefix}-{_digest(owner or '')}-*.json" for owner in (fabric, None)
+            ]
+            for pattern in patterns:
+                for entry_file in glob.glob(os.path.join(self.run_dir, pattern)):
+                    try:
+                        os.remove(entry_file)
+                    except OSError:
+                        pass
+
+        display.vvv(f"CACHE invalidated {'all entries' if fabric is None else f'fabric {fabric}'}")
+
+    @classmethod
+    def clear(cls):
+        """Drop every in-memory entry."""
+        with cls._lock:
+            cls._entries.clear()
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Run Scope Persistence
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _entry_file(self, key, fabric):
+        return os.path.join(
+            self.run_dir,
+            f"{_digest(key[0])}-{_digest(fabric or '')}-{_digest(' '.join(key))}.json",
+        )
+
+    def _read_run_entry(self, key, now):
+        """Load a non-expired entry from the run directory, or None."""
+        fabric = self.fabric_of(key[2])
+        try:
+            with open(self._entry_file(key, fabric), 'r', encoding='utf-8') as entry_file:
+                stored = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        if stored.get('expires_at', 0) <= now:
+            return None
+        return (stored['expires_at'], fabric, stored['result'])
+
+    def _write_run_entry(self, key, entry):
+        """Atomically persist an entry; skipped when it cannot be serialized."""
+        try:
+            if not os.path.isdir(self.run_dir):
+                os.makedirs(self.run_dir, mode=0o700, exist_ok=True)
+                _purge_stale_run_dirs(self.run_dir)
+            payload = json.dumps({'expires_at': entry[0], 'result': entry[2]})
+            fd, tmp_path = tempfile.mkstemp(dir=self.run_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as entry_file:
+                entry_file.write(payload)
+            os.replace(tmp_path, self._entry_file(key, entry[1]))
+        except (OSError, TypeError, ValueError) as exc:
+            display.vvv(f"CACHE unable to persist {key[1]} {key[2]}: {exc}")
+
+    @staticmethod
+    def _is_success(result):
+        if not isinstance(result, dict) or result.get('failed'):
+            return False
+        response = result.get('response')
+        return isinstance(response, dict) and response.get('RETURN_CODE') == 200
+
+
+def _digest(value):
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()[:20]
+
+
+def _run_dir_prefix():
+    """Run directory name prefix of the local user."""
+    return f"{ControllerResponseCache.RUN_DIR_PREFIX}{os.getuid()}_"
+
+
+def _purge_stale_run_dirs(current_dir):
+    """Remove run directories of the local user left behind by ansible-playbook processes that have exited."""
+    pattern = os.path.join(os.path.dirname(current_dir), f"{_run_dir_prefix()}*")
+    for run_dir in glob.glob(pattern):
+        if run_dir == current_dir:
+            continue
+        pid = run_dir.rsplit('_', 1)[-1]
+        if not pid.isdigit():
+            continue
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            shutil.rmtree(run_dir, ignore_errors=True)
+        except OSError:
+            pass
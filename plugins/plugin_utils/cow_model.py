@@ -0,0 +1,320 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Copy-On-Write Model — Extend the golden data model without deep copying it.
+
+prepare_service_model wraps the golden model in a CowDict and hands it to the
+prepare plugins as results['model_extended']. Each CowDict / CowList starts as
+a shallow copy of one golden container; a nested dict or list is copied (and
+wrapped in turn) the first time it is read through the overlay, so any object
+a plugin can reach — and mutate — belongs to the extended model. Subtrees the
+plugins never visit are not copied at all and the golden model is never
+modified.
+
+Reads go through __getitem__, get, setdefault, pop, items, values and
+iteration; dict.update / dict(...) / {**d}, list(...) / sorted(...) and
+copy.copy / copy.deepcopy of an overlay are routed through them as well.
+
+to_plain() converts the overlay back to plain dicts and lists once the plugins
+are done. Only containers that were modified (and their parents) are copied;
+everything else is returned as the golden object itself, so the extended model
+shares every unchanged subtree with model_golden.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+
+_CONTAINERS = (dict, list)
+_MISSING = object()
+
+
+def overlay(golden):
+    """Copy-on-write overlay of a golden dict or list; other values are returned as is."""
+    if isinstance(golden, _OVERLAYS):
+        return golden
+    if isinstance(golden, dict):
+        return CowDict(golden)
+    if isinstance(golden, list):
+        return CowList(golden)
+    return golden
+
+
+def _modifies(method):
+    """Wrap a mutating dict / list method so the overlay is flagged as modified."""
+    def mutate(self, *args, **kwargs):
+        self._dirty = True
+        return method(self, *args, **kwargs)
+    mutate.__name__ = method.__name__
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+class CowDict(dict):
+    """
+    Dict overlay of a golden dict; nested containers are copied on first read.
+
+    Args:
+        golden: Golden dict; it is shallow copied, never modified.
+    """
+
+    __slots__ = ('_golden', '_dirty')
+
+    def __init__(self, golden=None):
+        golden = golden if golden is not None else {}
+        dict.__init__(self, golden)
+        self._golden = golden
+        self._dirty = False
+
+    def _is_golden(self, key, value):
+        return (
+            isinstance(value, _CONTAINERS)
+            and not isinstance(value, _OVERLAYS)
+            and dict.get(self._golden, key, _MISSING) is value
+        )
+
+    def _own(self, key, value):
+        if self._is_golden(key, value):
+            value = overlay(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _own_all(self):
+        for key, value in list(dict.items(self)):
+            self._own(key, value)
+
+    def __getitem__(self, key):
+        return self._own(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # A custom tp_iter makes dict.update() / dict(...) read through keys()
+        # and __getitem__ instead of copying the raw (golden) values.
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key = next(reversed(dict.keys(self))) if self else None
+        value = self[key] if self else None
+        dict.popitem(self)
+        self._dirty = True
+        return key, value
+
+    def items(self):
+        self._own_all()
+        return dict.items(self)
+
+    def values(self):
+        self._own_all()
+        return dict.values(self)
+
+    __setitem__ = _modifies(dict.__setitem__)
+    __delitem__ = _modifies(dict.__delitem__)
+    __ior__ = _modifies(dict.__ior__)
+    update = _modifies(dict.update)
+    clear = _modifies(dict.clear)
+
+    def copy(self):
+        self._own_all()
+        return dict(dict.items(self))
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = {}
+        for key, value in dict.items(self):
+            result[key] = copy.deepcopy(value, memo)
+        return result
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (self.copy(),))
+
+
+class CowList(list):
+    """
+    List overlay of a golden list; nested containers are copied on first read.
+
+    Args:
+        golden: Golden list; it is shallow copied, never modified.
+    """
+
+    __slots__ = ('_golden', '_golden_ids', '_dirty')
+
+    def __init__(self, golden=None):
+        golden = golden if golden is not None else []
+        list.__init__(self, golden)
+        self._golden = golden
+        self._golden_ids = None
+        self._dirty = False
+
+    def _is_golden(self, value):
+        if not isinstance(value, _CONTAINERS) or isinstance(value, _OVERLAYS):
+            return False
+        if self._golden_ids is None:
+            self._golden_ids = {id(item) for item in self._golden if isinstance(item, _CONTAINERS)}
+        return id(value) in self._golden_ids
+
+    def _own(self, index, value):
+        if self._is_golden(value):
+            value = overlay(value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def _own_all(self):
+        for index in range(list.__len__(self)):
+            self._own(index, list.__getitem__(self, index))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self._own(position, list.__getitem__(self, position))
+                for position in range(*index.indices(len(self)))
+            ]
+        return self._own(index, list.__getitem__(self, index))
+
+    def __iter__(self):
+        # Index based so entries appended while iterating are visited, as
+        # with the built-in list iterator.
+        position = 0
+        while position < len(self):
+            yield self._own(position, list.__getitem__(self, position))
+            position += 1
+
+    def __reversed__(self):
+        self._own_all()
+        return list.__reversed__(self)
+
+    def pop(self, index=-1):
+        value = self[index]
+        del self[index]
+        return value
+
+    def __add__(self, other):
+        self._own_all()
+        return list.__add__(self, other)
+
+    def __mul__(self, count):
+        self._own_all()
+        return list.__mul__(self, count)
+
+    __rmul__ = __mul__
+
+    __setitem__ = _modifies(list.__setitem__)
+    __delitem__ = _modifies(list.__delitem__)
+    __iadd__ = _modifies(list.__iadd__)
+    __imul__ = _modifies(list.__imul__)
+    append = _modifies(list.append)
+    extend = _modifies(list.extend)
+    insert = _modifies(list.insert)
+    remove = _modifies(list.remove)
+    clear = _modifies(list.clear)
+    sort = _modifies(list.sort)
+    reverse = _modifies(list.reverse)
+
+    def copy(self):
+        self._own_all()
+        return list(list.__iter__(self))
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = []
+        for value in list.__iter__(self):
+            result.append(copy.deepcopy(value, memo))
+        return result
+
+    def __reduce_ex__(self, protocol):
+        return (list, (self.copy(),))
+
+
+_OVERLAYS = (CowDict, CowList)
+
+
+def to_plain(node, _memo=None):
+    """
+    Convert an overlay to plain dicts and lists, without modifying it.
+
+    Overlays that were not modified, and whose children were not either, are
+    replaced by their golden container; modified ones by a plain copy. Plain
+    containers holding overlays are copied as well, all others are returned
+    as is. Objects referenced from several places stay shared.
+    """
+    memo = {} if _memo is None else _memo
+    node_id = id(node)
+    if node_id in memo:
+        return memo[node_id]
+
+    if isinstance(node, CowDict):
+        golden = node._golden
+        changed = node._dirty
+        result = {}
+        for key, value in dict.items(node):
+            plain = to_plain(value, memo) if isinstance(value, _CONTAINERS) else value
+            changed = changed or plain is not dict.get(golden, key, _MISSING)
+            result[key] = plain
+        if not changed:
+            result = golden
+    elif isinstance(node, CowList):
+        golden = node._golden
+        changed = node._dirty
+        result = []
+        for position, value in enumerate(list.__iter__(node)):
+            plain = to_plain(value, memo) if isinstance(value, _CONTAINERS) else value
+            changed = changed or plain is not golden[position]
+            result.append(plain)
+        if not changed:
+            result = golden
+    elif isinstance(node, dict):
+        result = {}
+        changed = False
+        for key, value in node.items():
+            plain = to_plain(value, memo) if isinstance(value, _CONTAINERS) else value
+            changed = changed or plain is not value
+            result[key] = plain
+        if not changed:
+            result = node
+    elif isinstance(node, list):
+        result = [to_plain(value, memo) if isinstance(value, _CONTAINERS) else value for value in node]
+        if all(plain is value for plain, value in zip(result, node)):
+            result = node
+    else:
+        return node
+    memo[node_id] = result
+    return result
@@ -0,0 +1,225 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Diff Engine — Keyed structural diff of rendered resource lists.
+
+Items are indexed once by the composite key declared for the resource in
+resources/resource_types.yml (diff_key) and compared by content hash, so a
+comparison is a single pass over each list regardless of size.
+
+Items without a usable key (a key field missing or empty) are matched by
+content instead of collapsing into one slot, and items sharing a key are
+paired in order, so no item is ever dropped from the result.
+
+Two layouts are supported (diff_layout):
+  - items:            a flat list of dicts (default)
+  - switch_policies:  [{switch: [{ip, policies: [...]}]}] — policies are
+                      keyed per switch ip by diff_key and results are
+                      returned as switch blocks
+
+Equal items are only collected with equal_items='full'; with 'summary'
+only their number is counted.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.registry_loader import (
+    DIFF_LAYOUTS,
+    RegistryLoader,
+)
+
+EQUAL_ITEMS_MODES = ('full', 'summary')
+
+
+class DiffEngine:
+    """
+    Keyed, hash-based comparison of old and new resource data.
+
+    Args:
+        key_fields: Item fields forming the composite key. List values
+            contribute their first element (e.g. interface 'switch').
+        compare_fields: Fields compared for equality (default: whole item).
+        layout: One of DIFF_LAYOUTS.
+        equal_items: One of EQUAL_ITEMS_MODES.
+    """
+
+    def __init__(self, key_fields=None, compare_fields=None, layout='items', equal_items='full'):
+        if layout not in DIFF_LAYOUTS:
+            raise ValueError(f"Unknown diff layout '{layout}', expected one of {DIFF_LAYOUTS}")
+        if equal_items not in EQUAL_ITEMS_MODES:
+            raise ValueError(f"Unknown equal_items mode '{equal_items}', expected one of {EQUAL_ITEMS_MODES}")
+        self.key_fields = list(key_fields or [])
+        self.compare_fields = list(compare_fields) if compare_fields else None
+        self.layout = layout
+        self.equal_items = equal_items
+
+    @classmethod
+    def for_file(cls, file_path, equal_items='full', collection_path=None):
+        """
+        Build the engine for a rendered file from its resource_types.yml entry.
+
+        The entry is the one whose output_file the path ends with. Files
+        without an entry get an engine without key fields, which matches
+        items by content.
+        """
+        if collection_path is None:
+            collection_path = RegistryLoader.get_collection_path()
+        resource_types = RegistryLoader.load(collection_path, 'resource_types').get('resource_types', {})
+        basename = os.path.basename(file_path)
+        for cfg in resource_types.values():
+            if isinstance(cfg, dict) and cfg.get('output_file') == basename:
+                return cls(
+                    key_fields=cfg.get('diff_key'),
+                    compare_fields=cfg.get('diff_fields'),
+                    layout=cfg.get('diff_layout', 'items'),
+                    equal_items=equal_items,
+                )
+        return cls(equal_items=equal_items)
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Keys and Hashes
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def item_key(self, item):
+        """Return the composite key tuple of an item, or None if any key field is empty."""
+        if not self.key_fields or not isinstance(item, dict):
+            return None
+        key = []
+        for field in self.key_fields:
+            value = item.get(field)
+            if isinstance(value, list):
+                value = value[0] if value else None
+            if value is None or value == '':
+                return None
+            key.append(value)
+        return tuple(key)
+
+    def item_hash(self, item):
+        """Stable digest of an item (or of its compare_fields) for equality checks."""
+        if self.compare_fields is not None and isinstance(item, dict):
+            item = {field: item.get(field) for field in self.compare_fields}
+        return hashlib.sha1(
+            json.dumps(item, sort_keys=True, separators=(',', ':'), default=str).encode()
+        ).hexdigest()
+
+    def index(self, items):
+        """
+        Index items by (scope, key, occurrence).
+
+        Keyless items are keyed by their content hash; repeated keys get
+        increasing occurrence numbers so every item keeps its own slot.
+
+        Returns:
+            Dict mapping slot → (digest, item), in input order.
+        """
+        return self._index_scoped((None, item) for item in items or [])
+
+    def _index_scoped(self, scoped_items):
+        indexed = {}
+        occurrences = {}
+        for scope, item in scoped_items:
+            digest = self.item_hash(item)
+            key = self.item_key(item)
+            if key is None:
+                key = ('#', digest)
+            key = (scope, key)
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            indexed[key + (occurrence,)] = (digest, item)
+        return indexed
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Comparison
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def compare(self, old_items, new_items):
+        """
+        Compare old and new data.
+
+        Returns:
+            tuple: (updated, removed, equal, equal_count). equal is empty
+            unless equal_items is 'full'; equal_count always counts the
+            unchanged items (policies for the switch_policies layout).
+        """
+        if self.layout == 'switch_policies':
+            return self._compare_switch_policies(old_items, new_items)
+
+        updated, removed, equal, equal_count = self._compare_indexed(
+            self.index(old_items), self.index(new_items),
+        )
+        return (
+            [item for _slot, item in updated],
+            [item for _slot, item in removed],
+            [item for _slot, item in equal],
+            equal_count,
+        )
+
+    def _compare_indexed(self, old_index, new_index):
+        """Compare two indexes; returns (slot, item) lists and the equal count."""
+        updated = []
+        equal = []
+        equal_count = 0
+        for slot, (digest, item) in new_index.items():
+            old = old_index.pop(slot, None)
+            if old is None or old[0] != digest:
+                updated.append((slot, item))
+            else:
+                equal_count += 1
+                if self.equal_items == 'full':
+                    equal.append((slot, item))
+        removed = [(slot, item) for slot, (_digest, item) in old_index.items()]
+        return updated, removed, equal, equal_count
+
+    def _compare_switch_policies(self, old_items, new_items):
+        old_index = self._index_switch_policies(old_items)
+        new_index = self._index_switch_policies(new_items)
+        updated, removed, equal, equal_count = self._compare_indexed(old_index, new_index)
+        return (
+            self._to_switch_blocks(updated),
+            self._to_switch_blocks(removed),
+            self._to_switch_blocks(equal),
+            equal_count,
+        )
+
+    def _index_switch_policies(self, switch_blocks):
+        return self._index_scoped(
+            (sw.get('ip', ''), policy)
+            for switch_block in switch_blocks or []
+            for sw in switch_block.get('switch', [])
+            for policy in sw.get('policies', [])
+        )
+
+    @staticmethod
+    def _to_switch_blocks(entries):
+        """Group (slot, policy) entries back into switch blocks keyed by switch ip."""
+        if not entries:
+            return []
+        by_ip = {}
+        for slot, policy in entries:
+            by_ip.setdefault(slot[0], []).append(policy)
+        return [{'switch': [{'ip': ip, 'policies': policies} for ip, policies in by_ip.items()]}]
@@ -25,6 +25,10 @@
 # For example in prepare_serice_model.py we can do the following:
 #  from ..helper_functions import do_something
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.topology_index import TopologyIndex
+
+
 def data_model_key_check(tested_object, keys):
     """
     Check if key(s) are found and exist in the data model.
@@ -54,12 +58,13 @@ def data_model_key_check(tested_object, keys):
     return dm_key_dict
 
 
-def hostname_to_ip_mapping(data_model):
+def hostname_to_ip_mapping(data_model, topology_index=None):
     """
     Update in-memory data model with IP address mapping to hostname.
 
     :Parameters:
         :data_model (dict): The in-memory data model.
+        :topology_index (TopologyIndex, optional): Switch index of the data model. Built when not given.
 
     :Returns:
         :data_model: The updated in-memory data model with IP address mapping to hostname.
@@ -67,18 +72,40 @@ def hostname_to_ip_mapping(data_model):
     :Raises:
         N/A
     """
-    topology_switches = data_model['vxlan']['topology']['switches']
+    if topology_index is None:
+        topology_index = TopologyIndex(data_model)
     for switch in data_model['vxlan']['policy']['switches']:
-        if any(sw['name'] == switch['name'] for sw in topology_switches):
-            found_switch = next((item for item in topology_switches if item["name"] == switch['name']))
-            if found_switch.get('management').get('management_ipv4_address'):
-                switch['mgmt_ip_address'] = found_switch['management']['management_ipv4_address']
-            elif found_switch.get('management').get('management_ipv6_address'):
-                switch['mgmt_ip_address'] = found_switch['management']['management_ipv6_address']
+        mgmt_ip_address = topology_index.mgmt_ip(switch['name'])
+        if mgmt_ip_address:
+            switch['mgmt_ip_address'] = mgmt_ip_address
 
     return data_model
 
 
+def items_by_name(items, key='name'):
+    """
+    Index a list of data model items (policies, policy groups, ...) by name.
+
+    Resolves like a '[?(@.name==`name`)] | first' json_query: when several
+    items share a name, the first one wins.
+
+    :Parameters:
+        :items (list): List of dicts, or None.
+        :key (str): Key holding the name.
+
+    :Returns:
+        :by_name (dict): Item for each name.
+
+    :Raises:
+        N/A
+    """
+    by_name = {}
+    for item in items or []:
+        by_name.setdefault(item.get(key), item)
+
+    return by_name
+
+
 def ndfc_get_switch_policy(self, task_vars, tmp, switch_serial_number):
     """
     Get NDFC policy for a given managed switch by the switch's serial number.
@@ -95,14 +122,9 @@ def ndfc_get_switch_policy(self, task_vars, tmp, switch_serial_number):
     :Raises:
         N/A
     """
-    policy_data = self._execute_module(
-        module_name="cisco.dcnm.dcnm_rest",
-        module_args={
-            "method": "GET",
-            "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/switches/{switch_serial_number}/SWITCH/SWITCH"
-        },
-        task_vars=task_vars,
-        tmp=tmp
+    policy_data = NdfcModuleExecutor(self, task_vars, tmp).execute_rest(
+        "GET",
+        f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/switches/{switch_serial_number}/SWITCH/SWITCH"
     )
 
     return policy_data
@@ -184,14 +206,9 @@ def ndfc_get_fabric_attributes(self, task_vars, tmp, fabric):
     :Raises:
         N/A
     """
-    fabric_response = self._execute_module(
-        module_name="cisco.dcnm.dcnm_rest",
-        module_args={
-            "method": "GET",
-            "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric}",
-        },
-        task_vars=task_vars,
-        tmp=tmp
+    fabric_response = NdfcModuleExecutor(self, task_vars, tmp).execute_rest(
+        "GET",
+        f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric}"
     )
 
     fabric_attributes = fabric_response['response']['DATA']['nvPairs']
@@ -215,14 +232,8 @@ def ndfc_get_fabric_switches(self, task_vars, tmp, fabric):
     :Raises:
         N/A
     """
-    fabric_response = self._execute_module(
-        module_name="cisco.dcnm.dcnm_inventory",
-        module_args={
-            "fabric": fabric,
-            "state": "query"
-        },
-        task_vars=task_vars,
-        tmp=tmp
+    fabric_response = NdfcModuleExecutor(self, task_vars, tmp).execute(
+        "cisco.dcnm.dcnm_inventory", "query", None, fabric
     )
 
     fabric_switches = []
@@ -359,14 +370,9 @@ def ndfc_get_fabric_policies_by_template(self, task_vars, tmp, fabric_name, temp
     :Raises:
         N/A
     """
-    policy_response = self._execute_module(
-        module_name="cisco.dcnm.dcnm_rest",
-        module_args={
-            "method": "GET",
-            "path": f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/{fabric_name}/policy?templateName={template_name}"
-        },
-        task_vars=task_vars,
-        tmp=tmp
+    policy_response = NdfcModuleExecutor(self, task_vars, tmp).execute_rest(
+        "GET",
+        f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/{fabric_name}/policy?templateName={template_name}"
     )
 
     # Build a dictionary mapping serial number to policy
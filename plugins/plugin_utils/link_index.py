@@ -0,0 +1,128 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Link Index — Hashed lookup of controller fabric links by their endpoints.
+
+Shared by existing_links_check and links_filter_and_remove, which match the
+fabric links configured in the data model against the links queried from the
+controller (dcnm_links state: query).
+
+Controller links identify their switches by system name (sw1-info/sw2-info
+'sw-sys-name') while configured links use management IPs. LinkIndex rewrites
+each controller link's system names to management IPs once, using a
+name → management IP dict built from the data model switches, and indexes the
+links by a direction-insensitive endpoint key so a configured link is matched
+in O(1) regardless of its src/dst orientation.
+
+All comparisons are case-insensitive.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+def switch_addresses(switches):
+    """Map lower-cased switch names to their management IPv4 address."""
+    addresses = {}
+    for switch in switches or []:
+        name = switch.get('name')
+        ip = (switch.get('management') or {}).get('management_ipv4_address')
+        if name and ip:
+            addresses.setdefault(name.lower(), ip)
+    return addresses
+
+
+def endpoint(device, interface):
+    """Normalized (device, interface) endpoint."""
+    return (str(device).lower(), str(interface).lower())
+
+
+def link_key(src, dst):
+    """Direction-insensitive key of a link between two endpoints."""
+    return (src, dst) if src <= dst else (dst, src)
+
+
+def configured_endpoints(link):
+    """(src, dst) endpoints of a configured (data model) fabric link."""
+    return (
+        endpoint(link['src_device'], link['src_interface']),
+        endpoint(link['dst_device'], link['dst_interface']),
+    )
+
+
+class LinkIndex:
+    """
+    Controller links indexed by direction-insensitive endpoint key.
+
+    Only links carrying 'sw-sys-name' on both sides are indexed; their
+    system names are rewritten in place to the switch management IP when
+    the switch is part of the data model.
+
+    Args:
+        existing_links: Links returned by the controller.
+        switches: Data model switches (vxlan.topology.switches).
+    """
+
+    def __init__(self, existing_links, switches):
+        self.addresses = switch_addresses(switches)
+        self._endpoints = {}
+        self._by_key = {}
+        for existing_link in existing_links or []:
+            endpoints = self._normalize(existing_link)
+            if endpoints is None:
+                continue
+            self._endpoints[id(existing_link)] = endpoints
+            self._by_key.setdefault(link_key(*endpoints), []).append(existing_link)
+
+    def _normalize(self, existing_link):
+        """Rewrite system names to management IPs and return the link endpoints."""
+        sw1 = existing_link.get('sw1-info')
+        sw2 = existing_link.get('sw2-info')
+        if not isinstance(sw1, dict) or not isinstance(sw2, dict):
+            return None
+        if 'sw-sys-name' not in sw1 or 'sw-sys-name' not in sw2:
+            return None
+        for info in (sw1, sw2):
+            info['sw-sys-name'] = self.addresses.get(info['sw-sys-name'].lower(), info['sw-sys-name'])
+        return (
+            endpoint(sw1['sw-sys-name'], sw1.get('if-name', '')),
+            endpoint(sw2['sw-sys-name'], sw2.get('if-name', '')),
+        )
+
+    def is_indexed(self, existing_link):
+        """Whether an existing link has both endpoints and was indexed."""
+        return id(existing_link) in self._endpoints
+
+    def key_of(self, existing_link):
+        """Direction-insensitive key of an indexed existing link, or None."""
+        endpoints = self._endpoints.get(id(existing_link))
+        return link_key(*endpoints) if endpoints else None
+
+    def matches(self, link):
+        """Existing links connecting the endpoints of a configured link, in controller order."""
+        return self._by_key.get(link_key(*configured_endpoints(link)), [])
+
+    def is_reversed(self, existing_link, link):
+        """Whether an existing link connects a configured link's endpoints dst → src."""
+        src, dst = configured_endpoints(link)
+        return self._endpoints.get(id(existing_link)) == (dst, src)
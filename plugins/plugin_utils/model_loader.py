@@ -0,0 +1,341 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Model Loader — Cached loading of the host_vars data model for nac_dc_validate.
+
+ModelLoader.load() returns the same merged data model as nac_yaml's
+load_yaml_files(): files are visited in the same order, merged with
+nac_yaml's merge_dict() and deduplicated with deduplicate_list_items().
+Only the parsing of each file changes:
+
+  - When PyYAML is built with libyaml, files are parsed by its C parser with
+    the YAML 1.2 implicit resolvers of ruamel.yaml, so scalars resolve as
+    they do with nac_yaml. Files using anything beyond plain mappings,
+    sequences, strings, decimal integers and floats, booleans and nulls
+    (explicit tags, merge keys, timestamps, duplicate keys, ...) fall back
+    to nac_yaml's ruamel.yaml round-trip parse.
+  - With validate_yaml_cache (default true) the parsed files are kept in
+
+        ~/.ansible/nac_dc_vxlan/model_cache/<data dir>-<path digest>.pickle
+
+    (see ModelLoader.cache_path_for), keyed by path, modification time, size
+    and SHA-256 of the content, together with the merged model. A file is
+    parsed again only when its content changed; when no file changed, the
+    merged model itself is reused, so the second nac_dc_validate task of a
+    run (custom enhanced rules) loads it without parsing or merging.
+
+Files using the !vault or !env tags are never cached: their values are
+resolved when the file is parsed and depend on the vault and environment.
+
+The cache lives in the user's home rather than in the collection, which may
+be read-only or shared. As unpickling runs code, a cache file is only loaded
+when it is owned by the current user and not writable by anyone else.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import io
+import os
+import pickle
+import re
+
+from ansible.utils.display import Display
+
+try:
+    import yaml
+    CSafeLoader = getattr(yaml, 'CSafeLoader', None)
+except ImportError:
+    CSafeLoader = None
+
+try:
+    from ruamel import yaml as ruamel_yaml
+    from ruamel.yaml.resolver import implicit_resolvers as ruamel_implicit_resolvers
+    from nac_yaml.yaml import EnvTag, VaultTag, deduplicate_list_items, merge_dict
+except ImportError:
+    ruamel_yaml = None
+
+display = Display()
+
+CACHE_VERSION = 1
+
+# Default cache root, next to the template bytecode cache
+DEFAULT_CACHE_ROOT = os.path.join('~', '.ansible', 'nac_dc_vxlan', 'model_cache')
+
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+_UNCACHEABLE_TAGS = (b'!vault', b'!env')
+
+_DECIMAL_INT = re.compile(r'[-+]?(?:0|[1-9][0-9]*)$')
+_DECIMAL_FLOAT = re.compile(r'[-+]?[0-9]+\.[0-9]+$')
+
+
+class _Fallback(Exception):
+    """Raised by the C parser for content it does not load like nac_yaml."""
+
+
+if CSafeLoader is not None and ruamel_yaml is not None:
+
+    class _CModelLoader(CSafeLoader):
+        """libyaml parser resolving plain scalars like ruamel.yaml (YAML 1.2)."""
+
+        yaml_implicit_resolvers = {}
+
+        def construct_mapping(self, node, deep=False):
+            keys = set()
+            for key_node, _value_node in node.value:
+                if key_node.tag == 'tag:yaml.org,2002:merge':
+                    raise _Fallback('merge key')
+                key = self.construct_object(key_node, deep=deep)
+                if key in keys:
+                    raise _Fallback('duplicate key')
+                keys.add(key)
+            return super(_CModelLoader, self).construct_mapping(node, deep=deep)
+
+        def construct_strict_int(self, node):
+            value = self.construct_scalar(node)
+            if not _DECIMAL_INT.match(value):
+                raise _Fallback('int format')
+            return int(value)
+
+        def construct_strict_float(self, node):
+            value = self.construct_scalar(node)
+            if not _DECIMAL_FLOAT.match(value):
+                raise _Fallback('float format')
+            return float(value)
+
+        def construct_unsupported(self, node):
+            raise _Fallback(node.tag)
+
+    for _versions, _tag, _regexp, _first in ruamel_implicit_resolvers:
+        if (1, 2) in _versions:
+            _CModelLoader.add_implicit_resolver(_tag, re.compile(_regexp.pattern, _regexp.flags), _first)
+    _CModelLoader.add_constructor('tag:yaml.org,2002:int', _CModelLoader.construct_strict_int)
+    _CModelLoader.add_constructor('tag:yaml.org,2002:float', _CModelLoader.construct_strict_float)
+    for _tag in ('timestamp', 'value', 'binary', 'set', 'omap', 'pairs'):
+        _CModelLoader.add_constructor(f'tag:yaml.org,2002:{_tag}', _CModelLoader.construct_unsupported)
+    _CModelLoader.add_constructor(None, _CModelLoader.construct_unsupported)
+
+else:
+    _CModelLoader = None
+
+
+def _parse_c(text):
+    loader = _CModelLoader(text)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def _parse_round_trip(text):
+    """Parse a file the way nac_yaml's load_yaml_files() does."""
+    y = ruamel_yaml.YAML()
+    y.preserve_quotes = True
+    y.register_class(VaultTag)
+    y.register_class(EnvTag)
+    return y.load(text)
+
+
+class ModelLoader:
+    """
+    Load and merge the YAML files of a data model directory.
+
+    Args:
+        cache_path: Parsed file cache, or None to disable caching.
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.loader_name = 'libyaml' if _CModelLoader is not None else 'ruamel'
+        self.parsed = 0
+        self.reused = 0
+        self._files = {}
+        self._model = None
+        self._load_cache()
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Cache File
+    # ══════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def cache_path_for(data_path, cache_root=None):
+        """
+        Cache file of a data model directory, or None if it cannot be created.
+
+        Args:
+            data_path: Data model directory (mdata).
+            cache_root: Cache root directory (defaults to DEFAULT_CACHE_ROOT).
+        """
+        data_path = os.path.abspath(data_path)
+        directory = os.path.expanduser(cache_root or DEFAULT_CACHE_ROOT)
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        except OSError as error:
+            display.warning(f"Model cache disabled, cannot create {directory}: {error}")
+            return None
+        digest = hashlib.sha1(data_path.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(directory, f"{os.path.basename(data_path)}-{digest}.pickle")
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.isfile(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'rb') as cache_file:
+                stat = os.fstat(cache_file.fileno())
+                if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+                    display.warning(f"Ignoring model cache {self.cache_path}: not private to the current user")
+                    return
+                cached = pickle.load(cache_file)
+        except Exception as error:
+            display.warning(f"Ignoring model cache {self.cache_path}: {error}")
+            return
+        if isinstance(cached, dict) and cached.get('version') == CACHE_VERSION and cached.get('loader') == self.loader_name:
+            self._files = cached.get('files') or {}
+            self._model = cached.get('model')
+
+    def _save_cache(self, files, model):
+        if not self.cache_path:
+            return
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, 'wb') as cache_file:
+                pickle.dump(
+                    {'version': CACHE_VERSION, 'loader': self.loader_name, 'files': files, 'model': model},
+                    cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.cache_path)
+        except (OSError, pickle.PicklingError) as error:
+            display.warning(f"Unable to write model cache {self.cache_path}: {error}")
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Files
+    # ══════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _walk(paths):
+        """(file_path, skip_on_error) of every file, in load_yaml_files() order."""
+        for path in paths:
+            if os.path.isfile(path):
+                yield str(path), False
+            else:
+                for directory, _subdirs, file_names in os.walk(path):
+                    for file_name in file_names:
+                        yield os.path.join(directory, file_name), True
+
+    def _parse(self, text):
+        if _CModelLoader is not None:
+            try:
+                return _parse_c(text)
+            except Exception:
+                pass
+        return _parse_round_trip(text)
+
+    def _read(self, file_path):
+        """
+        Parsed content of a YAML file, from the cache when unchanged.
+
+        Returns:
+            (data, entry) tuple; entry is the new cache entry or None.
+        """
+        stat = os.stat(file_path)
+        entry = self._files.get(file_path)
+        if entry is not None and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.reused += 1
+            return pickle.loads(entry['data']), entry
+
+        with open(file_path, 'rb') as source:
+            raw = source.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry is not None and entry['sha256'] == digest:
+            self.reused += 1
+            return pickle.loads(entry['data']), dict(entry, mtime=stat.st_mtime_ns, size=stat.st_size)
+
+        # Decode as open(file_path, 'r') does
+        text = io.TextIOWrapper(io.BytesIO(raw)).read()
+        self.parsed += 1
+        data = self._parse(text)
+        if any(tag in raw for tag in _UNCACHEABLE_TAGS):
+            return data, None
+        try:
+            blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return data, None
+        return data, {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest, 'data': blob}
+
+    def load(self, paths, deduplicate=True):
+        """
+        Load and merge the YAML files below the given paths.
+
+        Returns:
+            dict: Merged data model.
+        """
+        files = {}
+        cacheable = True
+        parsed = []
+        for file_path, skip_on_error in self._walk(paths):
+            try:
+                if os.path.splitext(file_path)[1] not in YAML_SUFFIXES:
+                    open(file_path, 'r').close()
+                    continue
+                data, entry = self._read(file_path)
+            except Exception:
+                if not skip_on_error:
+                    raise
+                display.vvv(f"Could not load file: {os.path.basename(file_path)}")
+                continue
+            if entry is None:
+                cacheable = False
+            else:
+                files[file_path] = entry
+            parsed.append((file_path, skip_on_error, data))
+
+        model_key = hashlib.sha256(repr([
+            (file_path, files[file_path]['sha256'] if file_path in files else None)
+            for file_path, _skip_on_error, _data in parsed
+        ] + [deduplicate]).encode()).hexdigest()
+        if cacheable and self._model is not None and self._model.get('key') == model_key:
+            display.vvv(f"MODEL Reused merged data model of {len(parsed)} files")
+            return pickle.loads(self._model['data'])
+
+        result = {}
+        for file_path, skip_on_error, data in parsed:
+            try:
+                merge_dict(data, result)
+            except Exception:
+                if not skip_on_error:
+                    raise
+                display.vvv(f"Could not load file: {os.path.basename(file_path)}")
+        if deduplicate:
+            result = deduplicate_list_items(result)
+
+        model = None
+        if cacheable:
+            try:
+                model = {'key': model_key, 'data': pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)}
+            except Exception:
+                model = None
+        self._save_cache(files, model)
+        display.vvv(f"MODEL Loaded {len(parsed)} files ({self.parsed} parsed with {self.loader_name}, {self.reused} cached)")
+        return result
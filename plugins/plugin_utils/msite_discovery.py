@@ -0,0 +1,248 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Multisite Discovery — Concurrent child fabric and ToR inventory discovery.
+
+Used by prepare_msite_data (and through it by fabric_deploy_manager's
+_acquire_msite_data fallback) to query the switch inventory of each
+multisite member fabric and the ToR pairings of fabrics with ToR switches.
+
+Up to msite_discovery_workers queries run at once (default 1) when
+ndfc_rest_mode is 'direct'; module executions (dcnm_rest, dcnm_inventory)
+are serialized by the executor, so module mode always runs serially. Results
+are returned in input order, so the discovered data is identical to a serial
+run.
+
+Discovered inventories and ToR pairings are stored in the controller
+response cache (ndfc_rest_cache_ttl / ndfc_rest_cache_scope) per cluster and
+fabric, under the pseudo path
+
+    msite-discovery/<cluster>/fabrics/<fabric>/<switches|tor_pairs>
+
+so they follow the cache's TTL, 'run' scope sharing across tasks and
+per-fabric write invalidation. Discovery repeated later in the run (for
+example by the deploy role) is answered without controller queries.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.utils.display import Display
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.filter.version_compare import version_compare
+
+display = Display()
+
+LAN_FABRIC_BASE = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control"
+
+
+class MsiteDiscovery:
+    """
+    Discover multisite member inventories and ToR pairings.
+
+    Args:
+        executor: NdfcModuleExecutor used for the REST calls.
+        parent_fabric: Parent (MSD or MCFG) fabric name, for log messages.
+        nd_major_minor_patch: ND version ('major.minor.patch') selecting the
+            MCFG proxy path, or None for MSD.
+        workers: Concurrent queries (default: msite_discovery_workers).
+    """
+
+    CACHE_PATH = "msite-discovery/{cluster}/fabrics/{fabric}/{kind}"
+
+    def __init__(self, executor, parent_fabric, nd_major_minor_patch=None, workers=None):
+        task_vars = executor.task_vars or {}
+        self.executor = executor
+        self.parent_fabric = parent_fabric
+        self.nd_major_minor_patch = nd_major_minor_patch
+        self.workers = max(1, int(workers or task_vars.get('msite_discovery_workers') or 1))
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Helpers
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def proxy(self, cluster):
+        """Proxy path prefix for a member fabric's cluster ('' without MCFG)."""
+        if self.nd_major_minor_patch is None:
+            return ''
+        if version_compare(self.nd_major_minor_patch, '3.2.2', '<='):
+            return f'/onepath/{cluster}'
+        if version_compare(self.nd_major_minor_patch, '4.1.1', '>='):
+            return f'/fedproxy/{cluster}'
+        return ''
+
+    def map(self, func, items):
+        """Apply func to every item, up to workers at once; results in input order."""
+        items = list(items)
+        workers = self.executor.max_concurrency(min(self.workers, len(items)))
+        if workers <= 1:
+            return [func(item) for item in items]
+        display.vvv(
+            f"DISCOVERY [{self.parent_fabric}] {len(items)} queries ({workers} concurrent)"
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items))
+
+    def cached(self, cluster, fabric, kind, load):
+        """
+        Return discovered data from the cache, or load() and cache it.
+
+        load() returns (data, error); data is only cached when error is None.
+
+        Returns:
+            tuple: (data, error)
+        """
+        cache = self.executor.cache
+        path = self.CACHE_PATH.format(cluster=cluster or 'local', fabric=fabric, kind=kind)
+        if cache is not None:
+            hit = cache.get('GET', path)
+            if hit is not None:
+                display.vvv(f"DISCOVERY [{self.parent_fabric}] cache hit {path}")
+                return hit['response']['DATA'], None
+
+        data, error = load()
+        if cache is not None and error is None:
+            cache.put('GET', path, {'response': {'RETURN_CODE': 200, 'DATA': data}})
+        return data, error
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # MCFG Member Inventories
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def mcfg_member_switches(self, members):
+        """
+        Query the switch inventory of every MCFG member fabric.
+
+        Args:
+            members: MCFG 'members' entries (fabricName, clusterName, ...).
+
+        Returns:
+            tuple: (switches, error) — switches is a list of switch lists in
+            member order; error is the message of the first failed member.
+        """
+        results = self.map(self._mcfg_member_switches, members)
+        for _switches, error in results:
+            if error is not None:
+                return None, error
+        return [switches for switches, _error in results], None
+
+    def _mcfg_member_switches(self, member):
+        fabric_name = member.get('fabricName')
+        fabric_cluster = member.get('clusterName')
+
+        def load():
+            response = self.executor.execute_rest(
+                "GET",
+                f"{self.proxy(fabric_cluster)}{LAN_FABRIC_BASE}/fabrics/{fabric_name}/inventory/switchesByFabric",
+            )
+            if response.get('failed'):
+                return None, (
+                    f"Failed to query switches for MCFG child fabric '{fabric_name}' "
+                    f"(cluster: '{fabric_cluster}'): {response.get('msg', 'Unknown error')}"
+                )
+            switches = []
+            for fabric_switch in (response.get('response', {}).get('DATA') or []):
+                if 'logicalName' in fabric_switch:
+                    switches.append(
+                        {
+                            'hostname': fabric_switch['logicalName'],
+                            'name': fabric_switch['logicalName'],
+                            'mgmt_ip_address': fabric_switch['ipAddress'],
+                            'fabric_name': fabric_switch['fabricName'],
+                            'fabric_cluster': fabric_cluster,
+                            'serial_number': fabric_switch['serialNumber'],
+                            'role': fabric_switch['switchRole'],
+                        }
+                    )
+            return switches, None
+
+        return self.cached(fabric_cluster, fabric_name, 'switches', load)
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # ToR Pairings
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def tor_pairs(self, tor_fabrics):
+        """
+        Query the ToR pairings of fabrics with ToR switches.
+
+        Args:
+            tor_fabrics: {fabric_name: (tor_serial_number, cluster)}; cluster
+                is None for MSD member fabrics.
+
+        Returns:
+            List of {tor1, tor2, parent_leaf1, parent_leaf2} entries of all
+            fabrics, in fabric order. Fabrics whose query failed are logged
+            and contribute no entries.
+        """
+        pairs = []
+        for fabric_pairs in self.map(self._tor_pairs, tor_fabrics.items()):
+            pairs.extend(fabric_pairs)
+        return pairs
+
+    def _tor_pairs(self, tor_fabric):
+        fabric, (serial_number, cluster) = tor_fabric
+
+        def load():
+            response = self.executor.execute_rest(
+                "GET",
+                f"{self.proxy(cluster)}{LAN_FABRIC_BASE}/tor/fabrics/{fabric}/switches/{serial_number}",
+            )
+            if 'response' in response and 'DATA' in response['response']:
+                return self.parse_tor_pairs(response['response']['DATA']), None
+            return [], f"Failed to get TOR data for fabric {fabric}: {response}"
+
+        pairs, error = self.cached(cluster, fabric, 'tor_pairs', load)
+        if error is not None:
+            display.warning(error)
+        return pairs
+
+    @staticmethod
+    def parse_tor_pairs(data):
+        """Convert controller torPairs into tor1/tor2/parent_leaf1/parent_leaf2 entries."""
+        entries = []
+        for pair in (data or {}).get('torPairs', []):
+            entry = {}
+            tor_name = pair['torName']
+            if '~' in tor_name:
+                entry['tor1'] = tor_name.split('~')[0]
+                entry['tor2'] = tor_name.split('~')[1]
+            else:
+                entry['tor1'] = tor_name
+
+            remarks_match = re.search(r'\(([^)]+)\)', pair.get('remarks', ''))
+            if remarks_match:
+                leaf_value = remarks_match.group(1)
+                if ',' in leaf_value:
+                    entry['parent_leaf1'] = leaf_value.split(',')[0].strip()
+                    entry['parent_leaf2'] = leaf_value.split(',')[1].strip()
+                else:
+                    entry['parent_leaf1'] = leaf_value
+            else:
+                entry['parent_leaf1'] = None
+
+            entries.append(entry)
+        return entries
@@ -0,0 +1,728 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Native Renderers — Python builders for the largest dtc/common resource types.
+
+Each renderer returns the data its Jinja2 template produces once the render
+is parsed with yaml.safe_load(), without rendering or parsing the whole
+document. Renderers are registered by name and selected per resource with
+the 'renderer' key of resources/resource_types.yml.
+
+Equivalence with the templates is kept field by field: a value is turned
+into text the way Ansible's templar does ({{ }} finalizes None to '',
+filters come from Jinja2 and Ansible), placed on the line(s) the template
+emits and parsed by the YAML loader. Parsed lines are memoized, so repeated
+values (defaults, names shared across switches) are parsed once.
+
+A renderer raises NativeRenderUnsupported for input it does not handle
+(other fabric types, policies loaded from files); the template is rendered
+instead. Any other error also falls back to the template, which then
+reports it as before.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+from functools import lru_cache
+
+import yaml
+from jinja2.filters import do_indent
+
+from ansible.plugins.filter.core import regex_replace, to_bool
+from ansible.plugins.test.core import match
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.filter.version_compare import version_compare
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.helper_functions import items_by_name
+
+# Same results as yaml.safe_load(), with the C parser when available
+_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# policy_vars values rendered as "" by ndfc_policy.j2
+_EMPTY_VALUE_PATTERN = '(^$|^\\s*$|^"\\s*"|^\'\\s*\'$)'
+
+_MISSING = object()
+
+RENDERERS = {}
+
+
+class NativeRenderUnsupported(Exception):
+    """Raised by a renderer for input only its template handles."""
+
+
+def renderer(name):
+    """Register a renderer function under the name used in resource_types.yml."""
+    def register(func):
+        RENDERERS[name] = func
+        return func
+    return register
+
+
+class RenderContext:
+    """
+    Variables available to a renderer.
+
+    Args:
+        task_vars: Task variables the template would be rendered with.
+    """
+
+    def __init__(self, task_vars):
+        self.task_vars = task_vars
+        self.model = task_vars['data_model_extended']
+        self.defaults = task_vars['defaults']
+        self.omit = task_vars.get('omit')
+
+    def default(self, *path):
+        """Value at a path below defaults (raises KeyError when absent)."""
+        node = self.defaults
+        for key in path:
+            node = node[key]
+        return node
+
+
+def render(name, task_vars):
+    """
+    Build the data of a resource with its registered renderer.
+
+    Returns:
+        List of resource items, as yaml.safe_load() of the template render.
+    """
+    return RENDERERS[name](RenderContext(task_vars))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# YAML Lines
+# ══════════════════════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=65536)
+def _load(snippet):
+    return yaml.load(snippet, Loader=_LOADER)
+
+
+def _copy(value):
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+def text(value):
+    """Text of a {{ value }} expression (None renders as an empty string)."""
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+def plain(value):
+    """Parsed value of a 'key: {{ value }}' line."""
+    return _copy(_load('k: ' + text(value))['k'])
+
+
+def quoted(value):
+    """Parsed value of a 'key: "{{ value }}"' line."""
+    return _copy(_load('k: "' + text(value) + '"')['k'])
+
+
+def block(value, header, key_indent, indent):
+    """
+    Parsed value of a block scalar whose content is rendered with indent().
+
+    Args:
+        value: Rendered value, already indented for continuation lines.
+        header: Block scalar header, e.g. '|2-'.
+        key_indent: Column of the key.
+        indent: Column of the first content line.
+    """
+    return _copy(_load(' ' * key_indent + 'k: ' + header + '\n' + ' ' * indent + value + '\n')['k'])
+
+
+def mapping_lines(snippet):
+    """Parsed mapping of lines rendered at their template indentation."""
+    return copy.deepcopy(_load(snippet))
+
+
+def lower(value):
+    """Result of the lower filter."""
+    return text(value).lower() if value is not None else 'none'
+
+
+def mgmt_switch(entry):
+    """'switch' list of an interface bucket entry (None when no management IP)."""
+    if 'mgmt_ip_address' in entry:
+        return [plain(entry['mgmt_ip_address'])]
+    return None
+
+
+def lookup(node, *path):
+    """Value at a path of mappings, or _MISSING when any key is absent."""
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return _MISSING
+        node = node[key]
+    return node
+
+
+def first_difference(expected, actual, path=''):
+    """
+    Describe the first difference between two parsed resources.
+
+    Returns:
+        'path: expected != actual' string, or None when both are equal.
+    """
+    if type(expected) is not type(actual):
+        return f"{path or '<root>'}: {expected!r} != {actual!r}"
+    if isinstance(expected, dict):
+        for key in list(expected) + [key for key in actual if key not in expected]:
+            if key not in expected or key not in actual:
+                return f"{path}.{key}: {expected.get(key, '<absent>')!r} != {actual.get(key, '<absent>')!r}"
+            difference = first_difference(expected[key], actual[key], f"{path}.{key}")
+            if difference:
+                return difference
+        return None
+    if isinstance(expected, list):
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            difference = first_difference(left, right, f"{path}[{index}]")
+            if difference:
+                return difference
+        if len(expected) != len(actual):
+            return f"{path or '<root>'}: {len(expected)} items != {len(actual)} items"
+        return None
+    if expected != actual:
+        return f"{path or '<root>'}: {expected!r} != {actual!r}"
+    return None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Interfaces (ndfc_interfaces/*.j2)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _interfaces(ctx, bucket):
+    """(bucket entry, interface) pairs of a vxlan.topology.interfaces.by_type bucket."""
+    switches = ctx.model['vxlan']['topology']['switches']
+    for entry in ctx.model['vxlan']['topology']['interfaces']['by_type'][bucket]:
+        yield entry, switches[entry['switch']]['interfaces'][entry['interface']]
+
+
+def _interface_defaults(ctx, name):
+    return ctx.default('vxlan', 'topology', 'switches', 'interfaces', name)
+
+
+def _value(item, key, defaults, default_key=None):
+    """item[key] | default(defaults[default_key])"""
+    return item[key] if key in item else defaults[default_key or key]
+
+
+def _or_omit(ctx, item, key):
+    """item[key] | default(omit)"""
+    return item[key] if key in item else ctx.omit
+
+
+def _freeform(config):
+    """cmds: |2- with {{ freeform_config | default('') | indent(6) }}"""
+    return block(do_indent(config, 6), '|2-', 4, 6)
+
+
+def _convert_ranges(item, key, default_range):
+    """macros/convert_ranges.j2 followed by | trim."""
+    if key in item:
+        ranges = item[key]
+    elif isinstance(default_range, (list, tuple)):
+        ranges = default_range
+    else:
+        return text(default_range).strip()
+    parts = []
+    for vlan_range in ranges:
+        if 'to' in vlan_range:
+            parts.append(f"{vlan_range['from']}-{vlan_range['to']}")
+        else:
+            parts.append(str(vlan_range['from']))
+    return ','.join(parts).strip()
+
+
+def _interface_item(name, interface_type, entry, profile):
+    return {
+        'name': plain(name),
+        'type': interface_type,
+        'switch': mgmt_switch(entry),
+        'deploy': False,
+        'profile': profile,
+    }
+
+
+def _qos(profile, interface, defaults):
+    profile['enable_qos'] = plain(lower(_value(interface, 'enable_qos', defaults)))
+    if _value(interface, 'enable_qos', defaults):
+        profile['qos_policy'] = plain(interface.get('qos_policy', ''))
+        profile['queuing_policy'] = plain(interface.get('queuing_policy', ''))
+
+
+def _orphan_port(profile, interface, defaults):
+    if interface.get('orphan_port', False):
+        profile['orphan_port'] = plain(lower(_value(interface, 'orphan_port', defaults)))
+
+
+def _address(ctx, profile, interface, family):
+    """{family}_addr and {family}_mask_len of an address/length value, when defined."""
+    if f'{family}_address' in interface:
+        address_mask = interface[f'{family}_address'].split('/')
+        profile[f'{family}_addr'] = plain(address_mask[0])
+        profile[f'{family}_mask_len'] = plain(address_mask[1] if len(address_mask) > 1 else ctx.omit)
+
+
+def _switching_interface(ctx, bucket, defaults_name, interface_type, mode):
+    """access, trunk, access_po and trunk_po interfaces."""
+    defaults = _interface_defaults(ctx, defaults_name)
+    port_channel = interface_type == 'pc'
+    items = []
+    for entry, interface in _interfaces(ctx, bucket):
+        profile = {
+            'admin_state': plain(lower(_value(interface, 'enabled', defaults))),
+            'mode': mode,
+            'description': quoted(_value(interface, 'description', defaults)),
+            'mtu': plain(_value(interface, 'mtu', defaults)),
+            'speed': plain(_value(interface, 'speed', defaults)),
+        }
+        portfast = _value(interface, 'spanning_tree_portfast', defaults)
+        profile['port_type_fast'] = plain(portfast if port_channel else lower(portfast))
+        if port_channel:
+            profile['pc_mode'] = quoted(_value(interface, 'pc_mode', defaults))
+            profile['members'] = plain(_or_omit(ctx, interface, 'members'))
+        if mode == 'access':
+            profile['access_vlan'] = plain(_value(interface, 'access_vlan', defaults))
+        profile['bpdu_guard'] = plain(lower(_value(interface, 'enable_bpdu_guard', defaults)))
+        if mode == 'trunk':
+            profile['allowed_vlans'] = quoted(
+                _convert_ranges(interface, 'trunk_allowed_vlans', defaults['trunk_allowed_vlans']))
+        profile['duplex'] = plain(_value(interface, 'duplex', defaults))
+        if port_channel:
+            profile['disable_lacp_suspend_individual'] = plain(
+                lower(_value(interface, 'disable_lacp_suspend_individual', defaults)))
+            profile['lacp_port_priority'] = plain(_value(interface, 'lacp_port_priority', defaults))
+            profile['lacp_rate'] = plain(_value(interface, 'lacp_rate', defaults))
+        _orphan_port(profile, interface, defaults)
+        if mode == 'trunk':
+            profile['native_vlan'] = quoted(_value(interface, 'native_vlan', defaults))
+        _qos(profile, interface, defaults)
+        profile['enable_monitor'] = plain(lower(_value(interface, 'monitor', defaults)))
+        profile['cmds'] = _freeform(interface.get('freeform_config', ''))
+        items.append(_interface_item(interface['name'], interface_type, entry, profile))
+    return items
+
+
+@renderer('interface_access')
+def interface_access(ctx):
+    return _switching_interface(ctx, 'access', 'topology_switch_access_interface', 'eth', 'access')
+
+
+@renderer('interface_access_po')
+def interface_access_po(ctx):
+    return _switching_interface(ctx, 'access_po', 'topology_switch_access_po_interface', 'pc', 'access')
+
+
+@renderer('interface_trunk')
+def interface_trunk(ctx):
+    return _switching_interface(ctx, 'trunk', 'topology_switch_trunk_interface', 'eth', 'trunk')
+
+
+@renderer('interface_trunk_po')
+def interface_trunk_po(ctx):
+    return _switching_interface(ctx, 'trunk_po', 'topology_switch_trunk_po_interface', 'pc', 'trunk')
+
+
+@renderer('interface_dot1q')
+def interface_dot1q(ctx):
+    defaults = _interface_defaults(ctx, 'topology_switch_dot1q_interface')
+    items = []
+    for entry, interface in _interfaces(ctx, 'dot1q'):
+        profile = {
+            'admin_state': plain(lower(_value(interface, 'enabled', defaults))),
+            'mode': 'dot1q',
+            'description': quoted(_value(interface, 'description', defaults)),
+            'mtu': plain(_value(interface, 'mtu', defaults)),
+            'speed': plain(_value(interface, 'speed', defaults)),
+            'port_type_fast': plain(lower(_value(interface, 'spanning_tree_portfast', defaults))),
+            'access_vlan': plain(_value(interface, 'access_vlan', defaults)),
+            'bpdu_guard': plain(lower(_value(interface, 'enable_bpdu_guard', defaults))),
+            'duplex': plain(_value(interface, 'duplex', defaults)),
+        }
+        _orphan_port(profile, interface, defaults)
+        profile['cmds'] = _freeform(interface.get('freeform_config', ''))
+        items.append(_interface_item(interface['name'], 'eth', entry, profile))
+    return items
+
+
+def _routed_interface(ctx, bucket, defaults_name, interface_type, mode):
+    """routed, routed_po and routed_sub interfaces."""
+    defaults = _interface_defaults(ctx, defaults_name)
+    port_channel = interface_type == 'pc'
+    items = []
+    for entry, interface in _interfaces(ctx, bucket):
+        profile = {
+            'admin_state': plain(lower(_value(interface, 'enabled', defaults))),
+            'mode': mode,
+        }
+        _address(ctx, profile, interface, 'ipv4')
+        if not port_channel:
+            _address(ctx, profile, interface, 'ipv6')
+        if mode == 'subint':
+            profile['vlan'] = plain(interface['dot1q_id'])
+        profile['description'] = quoted(_value(interface, 'description', defaults))
+        profile['route_tag'] = plain(_or_omit(ctx, interface, 'ipv4_route_tag'))
+        profile['int_vrf'] = plain(_or_omit(ctx, interface, 'vrf'))
+        profile['mtu'] = plain(_value(interface, 'mtu', defaults))
+        profile['speed'] = plain(_value(interface, 'speed', defaults))
+        if port_channel:
+            profile['pc_mode'] = quoted(_value(interface, 'pc_mode', defaults))
+            profile['members'] = plain(_or_omit(ctx, interface, 'members'))
+        profile['cmds'] = _freeform(interface.get('freeform_config', ''))
+        items.append(_interface_item(interface['name'], interface_type, entry, profile))
+    return items
+
+
+@renderer('interface_routed')
+def interface_routed(ctx):
+    return _routed_interface(ctx, 'routed', 'topology_switch_routed_interface', 'eth', 'routed')
+
+
+@renderer('interface_po_routed')
+def interface_po_routed(ctx):
+    return _routed_interface(ctx, 'routed_po', 'topology_switch_routed_po_interface', 'pc', 'l3')
+
+
+@renderer('sub_interface_routed')
+def sub_interface_routed(ctx):
+    return _routed_interface(ctx, 'routed_sub', 'topology_switch_routed_sub_interface', 'sub_int', 'subint')
+
+
+_LOOPBACK_MODES = {'loopback': 'lo', 'mpls_loopback': 'mpls', 'fabric_loopback': 'fabric'}
+
+
+@renderer('interface_loopback')
+def interface_loopback(ctx):
+    manual_allocation = False
+    reserved = set()
+    if 'underlay' in ctx.model['vxlan']:
+        general = lookup(ctx.model, 'vxlan', 'underlay', 'general')
+        manual_allocation = lookup(general, 'manual_underlay_allocation')
+        if manual_allocation is _MISSING:
+            manual_allocation = ctx.default('vxlan', 'underlay', 'general', 'manual_underlay_allocation')
+        if manual_allocation is True:
+            underlay_ids = {str(general['underlay_routing_loopback_id']), str(general['underlay_vtep_loopback_id'])}
+            reserved = {prefix + loopback_id for prefix in ('loopback', 'lo') for loopback_id in underlay_ids}
+
+    defaults = _interface_defaults(ctx, 'topology_switch_loopback_interface')
+    items = []
+    for entry, interface in _interfaces(ctx, 'loopback'):
+        if manual_allocation is True and interface['name'].lower() in reserved:
+            continue
+        profile = {}
+        if interface['mode'] in _LOOPBACK_MODES:
+            profile['mode'] = _LOOPBACK_MODES[interface['mode']]
+        profile['int_vrf'] = plain(_or_omit(ctx, interface, 'vrf'))
+        profile['description'] = quoted(_value(interface, 'description', defaults))
+        profile['admin_state'] = plain(lower(_value(interface, 'enabled', defaults)))
+        profile['ipv4_addr'] = plain(_or_omit(ctx, interface, 'ipv4_address'))
+        profile['ipv6_addr'] = plain(_or_omit(ctx, interface, 'ipv6_address'))
+        profile['route_tag'] = plain(_or_omit(ctx, interface, 'ipv4_route_tag'))
+        try:
+            secondary = interface['secondary_ipv4_addresses'][0]['ip_address']
+        except (KeyError, IndexError, TypeError):
+            secondary = ctx.omit
+        profile['secondary_ipv4_addr'] = plain(secondary)
+        profile['cmds'] = _freeform(interface.get('freeform_config', ''))
+        items.append(_interface_item(interface['name'], 'lo', entry, profile))
+    return items
+
+
+def _breakouts(ctx, bucket):
+    switches = ctx.model['vxlan']['topology']['switches']
+    items = []
+    for entry in ctx.model['vxlan']['topology']['interfaces']['by_type'][bucket]:
+        breakout = switches[entry['switch']]['interface_breakouts'][entry['breakout']]
+        if 'to' in breakout:
+            ports = range(breakout['from'], breakout['to'] + 1)
+        else:
+            ports = [breakout['from']]
+        for port in ports:
+            items.append({
+                'name': plain(f"Ethernet{text(breakout['module'])}/{text(port)}"),
+                'type': 'breakout',
+                'switch': mgmt_switch(entry),
+                'deploy': True,
+                'profile': {'map': plain(breakout['map'])},
+            })
+    return items
+
+
+@renderer('interface_breakout')
+def interface_breakout(ctx):
+    return _breakouts(ctx, 'breakout')
+
+
+@renderer('interface_breakout_preprov')
+def interface_breakout_preprov(ctx):
+    return _breakouts(ctx, 'breakout_preprov')
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Overlay (ndfc_attach_networks.j2, ndfc_attach_vrfs.j2)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _dc_overlay(ctx, key):
+    """Overlay list rendered by the dc_vxlan_fabric templates."""
+    if ctx.model['vxlan']['fabric']['type'] not in ('VXLAN_EVPN', 'eBGP_VXLAN'):
+        raise NativeRenderUnsupported(f"{key} of {ctx.model['vxlan']['fabric']['type']} fabrics")
+    items = lookup(ctx.model, 'vxlan', 'overlay', key)
+    return items if items is not _MISSING and items else []
+
+
+def _attach_groups(ctx, key):
+    groups = lookup(ctx.model, 'vxlan', 'overlay', key)
+    if groups is _MISSING or not groups:
+        raise NativeRenderUnsupported(f"undefined {key}")
+    return groups
+
+
+@renderer('networks')
+def networks(ctx):
+    defaults = ctx.default('vxlan', 'overlay', 'networks')
+    replication_mode = lookup(ctx.model, 'vxlan', 'underlay', 'general', 'replication_mode')
+    if replication_mode is _MISSING:
+        replication_mode = ctx.default('vxlan', 'underlay', 'general', 'replication_mode')
+    multicast = lower(replication_mode) == 'multicast'
+
+    items = []
+    for net in _dc_overlay(ctx, 'networks'):
+        item = {
+            'net_name': plain(net['name']),
+            'is_l2only': plain(_value(net, 'is_l2_only', defaults)),
+            'vrf_name': plain(_or_omit(ctx, net, 'vrf_name')),
+            'net_id': plain(_or_omit(ctx, net, 'net_id')),
+            'vlan_id': plain(_or_omit(ctx, net, 'vlan_id')),
+            'vlan_name': plain(_or_omit(ctx, net, 'vlan_name')),
+            'gw_ip_subnet': plain(_or_omit(ctx, net, 'gw_ip_address')),
+        }
+        if 'secondary_ip_addresses' in net and 1 <= len(net['secondary_ip_addresses']) <= 4:
+            for index, secondary in enumerate(net['secondary_ip_addresses'], start=1):
+                item[f'secondary_ip_gw{index}'] = plain(secondary['ip_address'])
+        item['arp_suppress'] = plain(_value(net, 'arp_suppress', defaults))
+        item['dhcp_loopback_id'] = plain(_or_omit(ctx, net, 'dhcp_loopback_id'))
+        if net.get('dhcp_servers'):
+            item['dhcp_servers'] = [
+                {'srvr_ip': plain(server['ip_address']), 'srvr_vrf': plain(server['vrf'])}
+                for server in net['dhcp_servers']
+            ]
+        item['gw_ipv6_subnet'] = plain(_or_omit(ctx, net, 'gw_ipv6_address'))
+        item['int_desc'] = plain(_value(net, 'int_desc', defaults, 'net_description'))
+        item['l3gw_on_border'] = plain(_value(net, 'l3gw_on_border', defaults))
+        item['mtu_l3intf'] = plain(_value(net, 'mtu_l3intf', defaults))
+        if multicast:
+            item['multicast_group_address'] = plain(_value(net, 'multicast_group_address', defaults))
+        item['netflow_enable'] = plain(_value(net, 'netflow_enable', defaults))
+        if 'netflow_enable' in net and to_bool(net['netflow_enable']):
+            item['vlan_nf_monitor'] = plain(_or_omit(ctx, net, 'vlan_netflow_monitor'))
+        item['route_target_both'] = plain(_value(net, 'route_target_both', defaults))
+        item['routing_tag'] = plain(_value(net, 'route_tag', defaults))
+        item['trm_enable'] = plain(_value(net, 'trm_enable', defaults))
+        if 'network_attach_group' in net:
+            attaches = []
+            for attach in _attach_groups(ctx, 'network_attach_groups_dict')[net['network_attach_group']]:
+                attach_item = {'ip_address': plain(attach['mgmt_ip_address'])}
+                if 'ports' in attach:
+                    attach_item['ports'] = plain(attach['ports'])
+                if attach.get('tors'):
+                    attach_item['tor_ports'] = []
+                    for tor in attach['tors']:
+                        tor_item = {'ip_address': plain(tor['mgmt_ip_address'])}
+                        if 'ports' in tor:
+                            tor_item['ports'] = plain(tor['ports'])
+                        attach_item['tor_ports'].append(tor_item)
+                attaches.append(attach_item)
+            item['attach'] = attaches or None
+        item['deploy'] = False
+        items.append(item)
+    return items
+
+
+_VRF_DEFAULTED = (
+    ('vrf_intf_desc', 'vrf_intf_desc'),
+    ('vrf_description', 'vrf_description'),
+    ('vrf_int_mtu', 'vrf_int_mtu'),
+    ('loopback_route_tag', 'loopback_route_tag'),
+    ('max_bgp_paths', 'max_bgp_paths'),
+    ('max_ibgp_paths', 'max_ibgp_paths'),
+    ('ipv6_linklocal_enable', 'ipv6_linklocal_enable'),
+    ('adv_host_routes', 'adv_host_routes'),
+    ('adv_default_routes', 'adv_default_routes'),
+    ('static_default_route', 'static_default_route'),
+)
+
+_VRF_ROUTE_TARGETS = (
+    'export_evpn_rt', 'export_mvpn_rt', 'export_vpn_rt',
+    'import_evpn_rt', 'import_mvpn_rt', 'import_vpn_rt',
+)
+
+
+@renderer('vrfs')
+def vrfs(ctx):
+    defaults = ctx.default('vxlan', 'overlay', 'vrfs')
+    v6_redistribute = version_compare(ctx.task_vars.get('ndfc_version'), '12.2.2', '>=')
+
+    items = []
+    for vrf in _dc_overlay(ctx, 'vrfs'):
+        if 'enable_l3_vni_no_vlan' in vrf:
+            l3vni_wo_vlan = vrf['enable_l3_vni_no_vlan']
+        else:
+            simplified_type = ctx.model['vxlan']['fabric']['simplified_type']
+            l3vni_wo_vlan = ctx.default('vxlan', 'global', simplified_type, 'enable_l3_vni_no_vlan')
+        item = {
+            'vrf_name': plain(vrf['name']),
+            'vrf_id': plain(_or_omit(ctx, vrf, 'vrf_id')),
+            'vlan_id': plain(_or_omit(ctx, vrf, 'vlan_id')),
+            'l3vni_wo_vlan': plain(l3vni_wo_vlan),
+            'vrf_vlan_name': plain(_or_omit(ctx, vrf, 'vrf_vlan_name')),
+        }
+        for key, default_key in _VRF_DEFAULTED:
+            item[key] = plain(_value(vrf, key, defaults, default_key))
+        item['bgp_password'] = plain(_or_omit(ctx, vrf, 'bgp_password'))
+        item['bgp_password_encryption_type'] = plain(_or_omit(ctx, vrf, 'bgp_password_encryption_type'))
+        item['disable_rt_auto'] = plain(_value(vrf, 'disable_rt_auto', defaults))
+        for key in _VRF_ROUTE_TARGETS:
+            item[key] = quoted(_or_omit(ctx, vrf, key))
+        item['netflow_enable'] = plain(_value(vrf, 'netflow_enable', defaults))
+        if 'netflow_enable' in vrf and to_bool(vrf['netflow_enable']):
+            item['nf_monitor'] = plain(vrf['netflow_monitor'])
+        item['no_rp'] = plain(_value(vrf, 'no_rp', defaults))
+        item['trm_enable'] = plain(_value(vrf, 'trm_enable', defaults))
+        if 'trm_enable' in vrf and to_bool(vrf['trm_enable']):
+            item['overlay_mcast_group'] = plain(_or_omit(ctx, vrf, 'overlay_multicast_group'))
+            item['rp_address'] = plain(_or_omit(ctx, vrf, 'rp_address'))
+            item['rp_external'] = plain(_or_omit(ctx, vrf, 'rp_external'))
+            item['rp_loopback_id'] = plain(_or_omit(ctx, vrf, 'rp_loopback_id'))
+            item['trm_bgw_msite'] = plain(_value(vrf, 'trm_bgw_msite', defaults))
+            item['underlay_mcast_ip'] = plain(_or_omit(ctx, vrf, 'underlay_mcast_ip'))
+        item['redist_direct_rmap'] = plain(_value(vrf, 'redist_direct_routemap', defaults))
+        if v6_redistribute:
+            item['v6_redist_direct_rmap'] = plain(_value(vrf, 'ipv6_redist_direct_routemap', defaults))
+        if 'vrf_attach_group' in vrf:
+            attaches = [
+                {'ip_address': plain(attach['mgmt_ip_address'])}
+                for attach in _attach_groups(ctx, 'vrf_attach_groups_dict')[vrf['vrf_attach_group']]
+            ]
+            item['attach'] = attaches or None
+        item['deploy'] = False
+        items.append(item)
+    return items
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Policies (ndfc_policy.j2)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _policy_var(key, value, template_name):
+    """Parsed policy_vars entry, rendered at the template's indentation (12)."""
+    key_line = ' ' * 12 + text(key) + ': '
+    if key in ('CONF', 'DOMAIN_CONF') and template_name != 'switch_freeform':
+        return mapping_lines(key_line + '|2-\n' + ' ' * 14 + do_indent(value, 14) + '\n')
+    if key == 'CONF':
+        return mapping_lines(key_line + '|-\n' + ' ' * 14 + do_indent(value, 14) + '\n')
+    if key == 'BANNER':
+        return mapping_lines(key_line + '|\n' + ' ' * 14 + do_indent(value, 14) + '\n')
+    if key == 'BANNERDELIMITER':
+        return mapping_lines(key_line + '"' + text(value) + '"\n')
+    if key in ('asn', 'BGP_AS', 'BGP_ASN', 'NEIGHBOR_ASN'):
+        return mapping_lines(key_line + '"' + do_indent(str(value), 12).strip() + '"\n')
+    try:
+        multiline = '\n' in value
+    except TypeError:
+        multiline = False
+    if multiline:
+        return mapping_lines(key_line + '|-\n' + ' ' * 14 + do_indent(value, 14) + '\n')
+    if match(value, _EMPTY_VALUE_PATTERN):
+        return mapping_lines(key_line + '""\n')
+    return mapping_lines(key_line + do_indent(str(value), 12).strip() + '\n')
+
+
+def _policy_body(ctx, policy_match):
+    """description, name and policy_vars of a policy, shared by all its attachments."""
+    body = {
+        'create_additional_policy': False,
+        'description': plain('nac_' + regex_replace(policy_match['name'], '\\s+', '_')),
+    }
+    template_name = policy_match.get('template_name', _MISSING)
+    filename = policy_match.get('filename') or ''
+    yaml_file = '.yaml' in filename or '.yml' in filename
+    if template_name is not _MISSING and template_name or filename and yaml_file:
+        if template_name is _MISSING:
+            template_name = ctx.default('vxlan', 'policy', 'template_name')
+        body['name'] = plain(template_name)
+    elif filename and '.cfg' in filename:
+        body['name'] = plain(ctx.default('vxlan', 'policy', 'template_name'))
+
+    template_vars = policy_match.get('template_vars')
+    if template_vars:
+        policy_vars = {}
+        for key, value in template_vars.items():
+            policy_vars.update(_policy_var(key, value, policy_match.get('template_name', _MISSING)))
+        body['policy_vars'] = policy_vars
+    elif filename and (yaml_file or '.cfg' in filename):
+        # Content read with the file lookup, resolved by the template
+        raise NativeRenderUnsupported(f"policy {policy_match['name']} loaded from {filename}")
+    else:
+        body['policy_vars'] = None
+    return body
+
+
+@renderer('policy')
+def policy(ctx):
+    model_policy = lookup(ctx.model, 'vxlan', 'policy')
+    policies = lookup(model_policy, 'policies')
+    switches = lookup(model_policy, 'switches')
+    if policies is _MISSING or switches is _MISSING or not len(policies) or not len(switches):
+        return []
+
+    groups = lookup(model_policy, 'groups')
+    policy_groups_by_name = items_by_name([] if groups is _MISSING else groups)
+    policies_by_name = items_by_name(policies)
+    default_priority = _MISSING
+
+    bodies = {}
+    switch_items = []
+    for switch in switches:
+        switch_policies = []
+        for group_entry in switch['groups']:
+            policy_group_match = policy_groups_by_name[group_entry]
+            for group_policy in policy_group_match['policies']:
+                policy_match = policies_by_name[group_policy['name']]
+                if id(policy_match) not in bodies:
+                    bodies[id(policy_match)] = _policy_body(ctx, policy_match)
+                item = copy.deepcopy(bodies[id(policy_match)])
+                if 'priority' in group_policy:
+                    priority = group_policy['priority']
+                elif 'priority' in policy_group_match:
+                    priority = policy_group_match['priority']
+                else:
+                    if default_priority is _MISSING:
+                        default_priority = ctx.default('vxlan', 'policy', 'priority')
+                    priority = default_priority
+                item['priority'] = plain(priority)
+                switch_policies.append(item)
+        switch_items.append({'ip': plain(switch['mgmt_ip_address']), 'policies': switch_policies or None})
+    return [{'switch': switch_items}]
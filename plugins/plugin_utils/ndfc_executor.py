@@ -26,6 +26,19 @@ Encapsulates all NDFC module execution logic including direct module calls,
 action plugin routing for modules with companion action plugins (dcnm_vrf,
 dcnm_network), REST API calls, and arbitrary plugin execution.
 
+REST calls use cisco.dcnm.dcnm_rest by default. Setting ndfc_rest_mode to
+'direct' sends them through the keep-alive NdfcRestClient instead. GET
+responses are read through the run-scoped ControllerResponseCache when
+ndfc_rest_cache_ttl is set; writes invalidate the affected fabric's entries.
+
+Module executions are not thread-safe: ActionBase._execute_module writes the
+AnsiballZ payload of each call into the connection's shared temporary
+directory, and action plugin routing rewrites the shared task. Every module
+execution (module calls, dcnm_rest and routed action plugins) is therefore
+serialized by the executor's module lock. Only REST calls sent through the
+direct client run concurrently; callers size their worker pools with
+max_concurrency().
+
 Used by both manage_resources (create pipeline) and remove_resources (remove
 pipeline) via constructor injection.
 """
@@ -34,10 +47,22 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import threading
+
 from ansible.utils.display import Display
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.controller_cache import (
+    ControllerResponseCache,
+)
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_rest_client import (
+    NdfcRestClient,
+)
+
 display = Display()
 
+# Guards creation of the per action plugin module lock
+_MODULE_LOCKS_GUARD = threading.Lock()
+
 
 class NdfcModuleExecutor:
     """
@@ -54,6 +79,9 @@ class NdfcModuleExecutor:
         'cisco.dcnm.dcnm_network',
     })
 
+    # Supported values for the ndfc_rest_mode variable
+    REST_MODES = ('module', 'direct')
+
     def __init__(self, action_module, task_vars, tmp=None):
         """
         Initialize the executor.
@@ -66,6 +94,25 @@ class NdfcModuleExecutor:
         self.action_module = action_module
         self.task_vars = task_vars
         self.tmp = tmp
+        # Serializes every module execution (see module docstring). Needed
+        # whenever callers run requests from several threads. Shared by all
+        # executors of the same action plugin.
+        with _MODULE_LOCKS_GUARD:
+            self._module_lock = getattr(action_module, '_ndfc_module_lock', None)
+            if self._module_lock is None:
+                self._module_lock = threading.RLock()
+                action_module._ndfc_module_lock = self._module_lock
+
+        self.rest_mode = task_vars.get('ndfc_rest_mode', 'module')
+        if self.rest_mode not in self.REST_MODES:
+            display.warning(
+                f"Unknown ndfc_rest_mode '{self.rest_mode}' — using 'module'"
+            )
+            self.rest_mode = 'module'
+        self._rest_client = None
+        self.cache = ControllerResponseCache.from_task_vars(
+            task_vars, templar=getattr(action_module, '_templar', None),
+        )
 
     def execute(self, module_name, state, config, fabric_name, save=None, deploy=None, fabric_param='fabric', skip_validation=None):
         """
@@ -113,36 +160,118 @@ class NdfcModuleExecutor:
             module_args['use_desc_as_key'] = True
 
         if module_name in self.MODULES_WITH_ACTION_PLUGINS:
-            return self._execute_via_action_plugin(module_name, module_args)
+            result = self._execute_via_action_plugin(module_name, module_args)
+        else:
+            with self._module_lock:
+                result = self.action_module._execute_module(
+                    module_name=module_name,
+                    module_args=module_args,
+                    task_vars=self.task_vars,
+                    tmp=self.tmp,
+                )
+
+        # Module writes change controller state behind any cached GETs.
+        # Invalidate once the write is done, so no GET sent meanwhile can
+        # cache the state from before it.
+        if self.cache is not None and state != 'query':
+            self.cache.invalidate_fabric(fabric_name)
+        return result
+
+    def execute_rest(self, method, path, json_data=None, use_cache=True):
+        """
+        Execute an NDFC REST API call.
 
-        return self.action_module._execute_module(
-            module_name=module_name,
-            module_args=module_args,
-            task_vars=self.task_vars,
-            tmp=self.tmp,
-        )
+        Uses cisco.dcnm.dcnm_rest, or NdfcRestClient when ndfc_rest_mode is
+        'direct'. Both return the same result shape.
 
-    def execute_rest(self, method, path, json_data=None):
-        """
-        Execute a dcnm_rest API call.
+        GET calls read through the controller response cache; POST/PUT/DELETE
+        calls invalidate the cached entries of the fabric they target.
 
         Args:
             method: HTTP method (GET, POST, etc.).
             path: NDFC API path.
             json_data: Optional JSON string for request body (POST/PUT).
+            use_cache: Set False to always query the controller (e.g. sync
+                       polling). The fresh response still refreshes the cache.
 
         Returns:
             Module result dict.
         """
+        method = method.upper()
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(method, path)
+            if cached is not None:
+                display.vvv(f"CACHE hit {method} {path}")
+                return cached
+
+        result = self._send_rest(method, path, json_data)
+
+        if self.cache is not None:
+            if method in ControllerResponseCache.WRITE_METHODS:
+                self.cache.invalidate_path(path)
+            else:
+                self.cache.put(method, path, result)
+        return result
+
+    def _send_rest(self, method, path, json_data):
+        """Send a REST call over the configured transport."""
+        if self.rest_mode == 'direct':
+            client = self._get_rest_client()
+            if client is not None:
+                return client.request(method, path, json_data=json_data)
+
         module_args = {"method": method, "path": path}
         if json_data is not None:
             module_args["json_data"] = json_data
-        return self.action_module._execute_module(
-            module_name="cisco.dcnm.dcnm_rest",
-            module_args=module_args,
-            task_vars=self.task_vars,
-            tmp=self.tmp,
+        with self._module_lock:
+            return self.action_module._execute_module(
+                module_name="cisco.dcnm.dcnm_rest",
+                module_args=module_args,
+                task_vars=self.task_vars,
+                tmp=self.tmp,
+            )
+
+    def max_concurrency(self, workers):
+        """
+        Number of workers that may send requests through this executor at once.
+
+        Module executions are serialized by the module lock, so concurrency
+        is only granted when REST calls use the direct client.
+
+        Args:
+            workers: Requested number of workers.
+
+        Returns:
+            workers in direct REST mode, otherwise 1.
+        """
+        if workers <= 1:
+            return workers
+        if self.rest_mode == 'direct' and self._get_rest_client() is not None:
+            return workers
+        display.vvv(
+            f"NDFC requests use cisco.dcnm.dcnm_rest (ndfc_rest_mode '{self.rest_mode}') "
+            f"— running serially instead of {workers} concurrent workers"
         )
+        return 1
+
+    def _get_rest_client(self):
+        """
+        Resolve the shared direct REST client from the connection variables.
+
+        Falls back to module mode (returns None) with a warning when the
+        controller host or credentials cannot be resolved.
+        """
+        if self._rest_client is None:
+            self._rest_client = NdfcRestClient.from_task_vars(
+                self.task_vars, templar=getattr(self.action_module, '_templar', None),
+            )
+            if self._rest_client is None:
+                display.warning(
+                    "ndfc_rest_mode is 'direct' but ansible_host/ansible_user/"
+                    "ansible_password are not available — using dcnm_rest"
+                )
+                self.rest_mode = 'module'
+        return self._rest_client
 
     def execute_plugin(self, module_name, module_args):
         """
@@ -190,6 +319,9 @@ class NdfcModuleExecutor:
         Ansible's task executor invokes these automatically for native tasks.
         This method replicates that routing for programmatic calls.
 
+        The shared task is mutated for the duration of the call, so routing
+        is serialized by self._module_lock.
+
         Args:
             module_name: Fully qualified module name (e.g. 'cisco.dcnm.dcnm_vrf').
             module_args: Dict of module arguments (fabric, state, config, etc.).
@@ -197,6 +329,11 @@ class NdfcModuleExecutor:
         Returns:
             Module result dict.
         """
+        with self._module_lock:
+            return self._run_action_plugin(module_name, module_args)
+
+    def _run_action_plugin(self, module_name, module_args):
+        """Load and run an action plugin with the task temporarily rewritten."""
         original_args = self.action_module._task.args
         original_action = self.action_module._task.action
 
@@ -0,0 +1,400 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+NDFC REST Client — Direct HTTP(S) client for Nexus Dashboard REST calls.
+
+Alternative transport for NdfcModuleExecutor.execute_rest. Instead of
+dispatching cisco.dcnm.dcnm_rest as a module per request, requests are sent
+straight to the Nexus Dashboard over a pool of keep-alive connections
+authenticated with a cached login token.
+
+Selected per run with the ndfc_rest_mode variable:
+  - 'module' (default): every call goes through cisco.dcnm.dcnm_rest
+  - 'direct':           calls use NdfcRestClient
+
+Results are shaped like dcnm_rest results so callers are transport agnostic:
+  - success: {'changed': False, 'response': {RETURN_CODE, METHOD,
+              REQUEST_PATH, MESSAGE, DATA}}
+  - failure: {'changed': False, 'failed': True, 'msg': <same response dict>}
+
+Clients are shared per controller/user within the controller process via
+NdfcRestClient.get_shared(), so nested plugins reuse both the connection pool
+and the login token.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import http.client
+import json
+import queue
+import ssl
+import threading
+import time
+
+from ansible.utils.display import Display
+
+display = Display()
+
+
+class NdfcRestClient:
+    """
+    Keep-alive REST client for Nexus Dashboard / NDFC.
+
+    Thread-safe: connections are checked out of a bounded pool per request,
+    and token refresh is serialized.
+    """
+
+    LOGIN_PATH = '/login'
+
+    # Tokens are reused for this many seconds before a fresh login. Nexus
+    # Dashboard tokens outlive this; a 401 also forces a re-login.
+    TOKEN_TTL = 600
+
+    # Connection errors that indicate a stale keep-alive socket. Requests
+    # with an idempotent method are retried on another connection.
+    RETRYABLE_ERRORS = (
+        http.client.RemoteDisconnected,
+        http.client.CannotSendRequest,
+        http.client.BadStatusLine,
+        BrokenPipeError,
+        ConnectionResetError,
+    )
+
+    # Methods safe to send again when the server may already have received
+    # the request. Other methods (controller writes) are only retried when
+    # the request was provably never sent (CannotSendRequest).
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD'})
+
+    _shared_clients = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, host, username, password, port=None, domain='local',
+                 use_ssl=True, validate_certs=True, timeout=30, pool_size=8):
+        """
+        Initialize the client. No connection is opened until the first request.
+
+        Args:
+            host: Nexus Dashboard host name or IP address.
+            username: Login user name.
+            password: Login password.
+            port: TCP port. Defaults to 443 for HTTPS and 80 for HTTP.
+            domain: Login domain.
+            use_ssl: Use HTTPS when True.
+            validate_certs: Verify the server certificate when using HTTPS.
+            timeout: Socket timeout in seconds.
+            pool_size: Maximum number of idle keep-alive connections retained.
+        """
+        self.host = host
+        self.port = int(port) if port else (443 if use_ssl else 80)
+        self.username = username
+        self.password = password
+        self.domain = domain
+        self.use_ssl = use_ssl
+        self.validate_certs = validate_certs
+        self.timeout = timeout
+
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._token = None
+        self._token_expiry = 0.0
+        self._token_lock = threading.Lock()
+        self._ssl_context = self._build_ssl_context() if use_ssl else None
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Construction
+    # ══════════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    def from_task_vars(cls, task_vars, templar=None):
+        """
+        Build connection settings from the httpapi inventory variables.
+
+        Uses the same variables, and defaults, as the cisco.dcnm httpapi
+        connection: ansible_host, ansible_user, ansible_password,
+        ansible_httpapi_port, ansible_httpapi_use_ssl,
+        ansible_httpapi_validate_certs and ansible_httpapi_login_domain.
+        The socket timeout is ndfc_rest_timeout, falling back to
+        ansible_command_timeout (30 seconds when neither is set).
+
+        Args:
+            task_vars: Ansible task variables.
+            templar: Optional Templar used to resolve templated values.
+
+        Returns:
+            Shared NdfcRestClient instance, or None if host or credentials
+            are not available.
+        """
+        def _var(name, default=None):
+            value = task_vars.get(name, default)
+            if templar is not None and isinstance(value, str):
+                value = templar.template(value)
+            return value
+
+        host = _var('ansible_host')
+        username = _var('ansible_user')
+        password = _var('ansible_password', _var('ansible_httpapi_password'))
+        if not host or not username or password is None:
+            return None
+
+        return cls.get_shared(
+            host=str(host),
+            username=str(username),
+            password=str(password),
+            port=_var('ansible_httpapi_port'),
+            domain=str(_var('ansible_httpapi_login_domain', 'local')),
+            use_ssl=_to_bool(_var('ansible_httpapi_use_ssl', True)),
+            validate_certs=_to_bool(_var('ansible_httpapi_validate_certs', True)),
+            timeout=int(_var('ndfc_rest_timeout', _var('ansible_command_timeout', 30))),
+        )
+
+    @classmethod
+    def get_shared(cls, host, username, password, **kwargs):
+        """
+        Return the process-wide client for a controller/user, creating it once.
+
+        Args:
+            host: Nexus Dashboard host name or IP address.
+            username: Login user name.
+            password: Login password.
+            **kwargs: Remaining NdfcRestClient constructor arguments.
+
+        Returns:
+            NdfcRestClient instance.
+        """
+        key = (
+            host, kwargs.get('port'), kwargs.get('use_ssl', True),
+            kwargs.get('validate_certs', True), kwargs.get('timeout', 30),
+            username, kwargs.get('domain', 'local'),
+        )
+        with cls._shared_lock:
+            client = cls._shared_clients.get(key)
+            if client is None or client.password != password:
+                client = cls(host, username, password, **kwargs)
+                cls._shared_clients[key] = client
+            return client
+
+    @classmethod
+    def close_shared(cls):
+        """Close and forget all shared clients."""
+        with cls._shared_lock:
+            for client in cls._shared_clients.values():
+                client.close()
+            cls._shared_clients.clear()
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Requests
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def request(self, method, path, json_data=None):
+        """
+        Send one REST request and return a dcnm_rest-shaped result.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: NDFC API path (e.g. '/appcenter/cisco/ndfc/api/v1/...').
+            json_data: Optional request body. Strings are sent as-is,
+                       other values are JSON encoded.
+
+        Returns:
+            Result dict (see module docstring).
+        """
+        method = method.upper()
+        body = None
+        if json_data is not None:
+            body = json_data if isinstance(json_data, str) else json.dumps(json_data)
+
+        try:
+            status, reason, payload = self._authenticated_request(method, path, body)
+        except (OSError, http.client.HTTPException) as e:
+            response = {
+                'RETURN_CODE': -1,
+                'METHOD': method,
+                'REQUEST_PATH': path,
+                'MESSAGE': str(e),
+                'DATA': {},
+            }
+            return {'changed': False, 'failed': True, 'msg': response}
+
+        response = {
+            'RETURN_CODE': status,
+            'METHOD': method,
+            'REQUEST_PATH': path,
+            'MESSAGE': reason,
+            'DATA': self._decode(payload),
+        }
+        if status >= 400:
+            return {'changed': False, 'failed': True, 'msg': response}
+        return {'changed': False, 'response': response}
+
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            conn.close()
+
+    def _authenticated_request(self, method, path, body):
+        """Send a request with the cached token, re-logging in once on 401."""
+        token = self._get_token()
+        status, reason, payload = self._send(method, path, body, token)
+        if status == 401:
+            display.vvv(f"NDFC REST: 401 for {method} {path} — refreshing token")
+            token = self._get_token(force=True)
+            status, reason, payload = self._send(method, path, body, token)
+        return status, reason, payload
+
+    def _send(self, method, path, body, token=None, retry=None):
+        """
+        Send a request over a pooled connection, retrying if it was stale.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            body: Request body string or None.
+            token: Login token, if authenticated.
+            retry: Resend on a stale pooled connection even if the request
+                may have reached the server (default: idempotent methods).
+        """
+        if retry is None:
+            retry = method in self.IDEMPOTENT_METHODS
+
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        }
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+            headers['Cookie'] = f'AuthCookie={token}'
+
+        while True:
+            conn, reused = self._acquire()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                payload = resp.read()
+            except self.RETRYABLE_ERRORS as e:
+                conn.close()
+                # Only a pooled socket may have been closed by the server
+                # while idle; a fresh connection failing is a real error.
+                # Writes are not sent twice unless they never left the client.
+                if not reused or not (retry or isinstance(e, http.client.CannotSendRequest)):
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp.status, resp.reason, payload
+
+    def _get_token(self, force=False):
+        """Return a cached login token, logging in when missing or expired."""
+        with self._token_lock:
+            if not force and self._token and time.monotonic() < self._token_expiry:
+                return self._token
+
+            body = json.dumps({
+                'userName': self.username,
+                'userPasswd': self.password,
+                'domain': self.domain,
+            })
+            status, reason, payload = self._send('POST', self.LOGIN_PATH, body, retry=True)
+            if status != 200:
+                raise http.client.HTTPException(
+                    f"Nexus Dashboard login failed: {status} {reason}"
+                )
+
+            data = self._decode(payload)
+            token = None
+            if isinstance(data, dict):
+                token = data.get('jwttoken') or data.get('token')
+            if not token:
+                raise http.client.HTTPException(
+                    "Nexus Dashboard login response did not include a token"
+                )
+
+            self._token = token
+            self._token_expiry = time.monotonic() + self.TOKEN_TTL
+            return token
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Connection Pool
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def _acquire(self):
+        """
+        Check out an idle connection or open a new one.
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for a
+            connection taken from the idle pool.
+        """
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            pass
+        if self.use_ssl:
+            conn = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self._ssl_context,
+            )
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn, False
+
+    def _release(self, conn):
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _build_ssl_context(self):
+        context = ssl.create_default_context()
+        if not self.validate_certs:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    @staticmethod
+    def _decode(payload):
+        """Decode a response body as JSON, falling back to text like dcnm_rest."""
+        if not payload:
+            return {}
+        text = payload.decode('utf-8', errors='replace')
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+
+def _to_bool(value):
+    """Interpret inventory booleans that may arrive as strings."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
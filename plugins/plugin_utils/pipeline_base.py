@@ -28,6 +28,7 @@ data resolution strategy and any additional guard logic.
 
 Shared infrastructure includes:
   - Pipeline lookup and tag filtering
+  - Serial or dependency-graph (depends_on/after) step scheduling
   - Change flag guard checking
   - Internal method dispatch (module names starting with '_')
   - NDFC module execution delegation to NdfcModuleExecutor
@@ -49,6 +50,7 @@ import json
 import os
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from ansible.utils.display import Display
 
@@ -59,6 +61,15 @@ from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.registry_loader
 display = Display()
 
 
+def _as_list(value):
+    """Normalize an optional string-or-list registry field to a list."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
 class PipelineRunnerBase(ABC):
     """
     Abstract base for data-driven NDFC pipeline execution.
@@ -91,6 +102,9 @@ class PipelineRunnerBase(ABC):
         self.change_flags = params['change_flags']
         self.run_map_diff_run = params.get('run_map_diff_run', True)
         self.force_run_all = params.get('force_run_all', False)
+        # Concurrency for steps that declare depends_on/after edges.
+        # 1 (the default) keeps strictly serial execution.
+        self.max_workers = max(1, int(params.get('pipeline_max_workers', 1) or 1))
         self.executor = executor
         self.task_vars = task_vars
 
@@ -110,9 +124,15 @@ class PipelineRunnerBase(ABC):
 
         Template method: filter → iterate → guard → dispatch → execute.
 
+        Steps run serially in declaration order unless pipeline_max_workers
+        is greater than 1 and the pipeline declares depends_on/after edges,
+        in which case independent steps run concurrently (see
+        _run_steps_concurrent).
+
         Returns:
             dict with:
-              - 'results': List of per-step result dicts
+              - 'results': List of per-step result dicts (each carries
+                           the step wall-clock time in 'elapsed')
               - 'failed': Boolean — True if any step failed
               - 'msg': Summary message
         """
@@ -136,238 +156,401 @@ class PipelineRunnerBase(ABC):
         # Hook: subclass pre-pipeline setup (e.g., pre-fetch switch list)
         context = self._pre_pipeline_setup()
 
-        step_results = []
         total_steps = len(pipeline)
         pipeline_start = time.monotonic()
 
+        # Module executions are serialized by the executor, so steps only
+        # overlap when REST calls use the direct client
+        workers = self.executor.max_concurrency(self.max_workers) if self.executor is not None else 1
+        if workers > 1 and self._pipeline_declares_edges(pipeline):
+            display.v(
+                f"{self.OPERATION.upper()} [{self.fabric_name}] Running pipeline "
+                f"as a dependency graph with up to {workers} concurrent steps"
+            )
+            step_results, failure_msg = self._run_steps_concurrent(pipeline, context, workers)
+        else:
+            step_results, failure_msg = self._run_steps_serial(pipeline, context)
+
+        if failure_msg is not None:
+            return {
+                'results': step_results,
+                'failed': True,
+                'msg': failure_msg,
+            }
+
+        pipeline_elapsed = time.monotonic() - pipeline_start
+        display.display(
+            f"\n{'═' * display.columns}\n"
+            f"{self.OPERATION.upper()} [{self.fabric_name}] "
+            f"Pipeline complete — {total_steps} steps in {pipeline_elapsed:.1f}s\n"
+            f"{'═' * display.columns}",
+            color='dark gray',
+        )
+
+        return {
+            'results': step_results,
+            'failed': False,
+            'msite_data': getattr(self, 'msite_data', None),
+            'msg': (
+                f"{self.OPERATION.title()} pipeline completed for "
+                f"{self.fabric_type} fabric '{self.fabric_name}'"
+            ),
+        }
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Step Scheduling
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def _run_steps_serial(self, pipeline, context):
+        """
+        Execute pipeline steps strictly in declaration order.
+
+        Stops at the first failed step.
+
+        Args:
+            pipeline: Filtered list of pipeline step dicts.
+            context: Dict returned by _pre_pipeline_setup.
+
+        Returns:
+            Tuple of (step_results, failure_msg). failure_msg is None when
+            every step succeeded or was skipped.
+        """
+        step_results = []
+        total_steps = len(pipeline)
+
         for step_index, step in enumerate(pipeline, 1):
-            resource_name = step['resource_name']
-            module = step['module']
-            flag_name = step.get('change_flag_guard')
-            step_start = time.monotonic()
-            op_label = self.OPERATION.upper()
+            entry, failure_msg = self._run_step(
+                step_index, total_steps, step, context, step_results,
+            )
+            step_results.append(entry)
+            if failure_msg is not None:
+                return (step_results, failure_msg)
+
+        return (step_results, None)
+
+    def _run_steps_concurrent(self, pipeline, context, workers):
+        """
+        Execute pipeline steps as a dependency graph on a bounded worker pool.
+
+        A step becomes ready once every step it depends on (see
+        _build_step_dependencies) has finished. Ready steps are submitted to
+        a thread pool of workers threads. On the first failure no
+        further steps are started; steps already running are allowed to
+        finish so their results are still reported.
+
+        step_results are returned in pipeline declaration order regardless
+        of completion order. Steps never started because of an earlier
+        failure are omitted, matching the serial runner.
+
+        Args:
+            pipeline: Filtered list of pipeline step dicts.
+            context: Dict returned by _pre_pipeline_setup.
+            workers: Maximum number of steps running at once.
+
+        Returns:
+            Tuple of (step_results, failure_msg).
+        """
+        dependencies = self._build_step_dependencies(pipeline)
+        total_steps = len(pipeline)
+        results = [None] * total_steps
+        completed = set()
+        pending = list(range(total_steps))
+        running = {}
+        failure_msg = None
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while pending or running:
+                if failure_msg is None:
+                    ready = [idx for idx in pending if dependencies[idx] <= completed]
+                    for idx in ready:
+                        pending.remove(idx)
+                        # Snapshot of finished steps for runtime_change_refs.
+                        # Dependencies guarantee referenced steps are included.
+                        prior_results = [results[i] for i in sorted(completed)]
+                        future = pool.submit(
+                            self._run_step, idx + 1, total_steps,
+                            pipeline[idx], context, prior_results,
+                        )
+                        running[future] = idx
+
+                if not running:
+                    break
+
+                finished, _not_done = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    idx = running.pop(future)
+                    entry, step_failure = future.result()
+                    results[idx] = entry
+                    completed.add(idx)
+                    if step_failure is not None and failure_msg is None:
+                        failure_msg = step_failure
+
+        step_results = [entry for entry in results if entry is not None]
+        return (step_results, failure_msg)
+
+    @staticmethod
+    def _pipeline_declares_edges(pipeline):
+        """Return True if any step declares depends_on or after."""
+        return any('depends_on' in step or 'after' in step for step in pipeline)
+
+    @staticmethod
+    def _build_step_dependencies(pipeline):
+        """
+        Resolve the set of prerequisite step indices for every step.
+
+        Rules:
+          - A step that declares neither depends_on nor after is a barrier:
+            it waits for every earlier step. Undeclared pipelines therefore
+            keep their serial semantics.
+          - A step that declares depends_on and/or after (an empty list is a
+            valid declaration) waits only for earlier steps whose
+            resource_name is referenced, plus earlier steps sharing its own
+            resource_name (e.g. _fabric_links_query_and_filter → dcnm_links)
+            and any runtime_change_refs.
+          - Only earlier steps are considered, so the graph is always acyclic
+            and declaration order remains a valid topological order.
 
+        Args:
+            pipeline: Filtered list of pipeline step dicts.
+
+        Returns:
+            List of sets; element i holds the indices step i waits for.
+        """
+        dependencies = []
+        for idx, step in enumerate(pipeline):
+            if 'depends_on' not in step and 'after' not in step:
+                dependencies.append(set(range(idx)))
+                continue
+
+            refs = set(_as_list(step.get('depends_on')))
+            refs.update(_as_list(step.get('after')))
+            refs.update(_as_list(step.get('runtime_change_refs')))
+            refs.add(step.get('resource_name'))
+
+            dependencies.append({
+                prior_idx for prior_idx in range(idx)
+                if pipeline[prior_idx].get('resource_name') in refs
+            })
+        return dependencies
+
+    def _run_step(self, step_index, total_steps, step, context, prior_results):
+        """
+        Evaluate guards for one pipeline step and execute it.
+
+        Args:
+            step_index: 1-based position of the step (for logging).
+            total_steps: Number of steps in the filtered pipeline.
+            step: Pipeline step dict.
+            context: Dict returned by _pre_pipeline_setup.
+            prior_results: Results of steps that finished before this one,
+                           consulted by runtime_change_refs.
+
+        Returns:
+            Tuple of (step_result, failure_msg). failure_msg is None unless
+            the step failed. step_result carries the step wall-clock time
+            in 'elapsed' (seconds).
+        """
+        step_start = time.monotonic()
+        result, failure_msg = self._execute_step(
+            step_index, total_steps, step, context, prior_results, step_start,
+        )
+        result['elapsed'] = round(time.monotonic() - step_start, 3)
+        return (result, failure_msg)
+
+    def _execute_step(self, step_index, total_steps, step, context, prior_results, step_start):
+        """Guard → dispatch → execute body for a single step (see _run_step)."""
+        resource_name = step['resource_name']
+        module = step['module']
+        flag_name = step.get('change_flag_guard')
+        op_label = self.OPERATION.upper()
+
+        display.display(
+            f"\n{'─' * display.columns}\n"
+            f"{op_label} [{self.fabric_name}] "
+            f"Step {step_index}/{total_steps}: {resource_name} ({module})\n"
+            f"{'─' * display.columns}",
+            color='dark gray',
+        )
+
+        # ── Hook: subclass-specific additional guards ─────────────────
+        guard_result = self._check_additional_guards(step, context)
+        if guard_result is not None:
+            elapsed = time.monotonic() - step_start
+            reason = guard_result.get('reason', 'guard')
             display.display(
-                f"\n{'─' * display.columns}\n"
                 f"{op_label} [{self.fabric_name}] "
-                f"Step {step_index}/{total_steps}: {resource_name} ({module})\n"
-                f"{'─' * display.columns}",
-                color='dark gray',
+                f"{resource_name} → skipped ({reason}) [{elapsed:.1f}s]",
+                color='cyan',
             )
-
-            # ── Hook: subclass-specific additional guards ─────────────────
-            guard_result = self._check_additional_guards(step, context)
-            if guard_result is not None:
-                step_results.append(guard_result)
+            return (guard_result, None)
+
+        # ── Guard: data_model_guard ───────────────────────────────────
+        dm_guard = step.get('data_model_guard')
+        if dm_guard:
+            guards = dm_guard if isinstance(dm_guard, list) else [dm_guard]
+            failed = next(
+                (g for g in guards if not self._evaluate_data_model_guard(g)),
+                None,
+            )
+            if failed is not None:
                 elapsed = time.monotonic() - step_start
-                reason = guard_result.get('reason', 'guard')
                 display.display(
                     f"{op_label} [{self.fabric_name}] "
-                    f"{resource_name} → skipped ({reason}) [{elapsed:.1f}s]",
+                    f"{resource_name} → skipped (data_model_guard) [{elapsed:.1f}s]",
                     color='cyan',
                 )
-                continue
-
-            # ── Guard: data_model_guard ───────────────────────────────────
-            dm_guard = step.get('data_model_guard')
-            if dm_guard:
-                guards = dm_guard if isinstance(dm_guard, list) else [dm_guard]
-                failed = next(
-                    (g for g in guards if not self._evaluate_data_model_guard(g)),
-                    None,
-                )
-                if failed is not None:
-                    step_results.append({
-                        'resource_name': resource_name,
-                        'module': module,
-                        'status': 'skipped',
-                        'reason': f"data_model_guard '{failed}' resolved to falsy",
-                    })
-                    elapsed = time.monotonic() - step_start
-                    display.display(
-                        f"{op_label} [{self.fabric_name}] "
-                        f"{resource_name} → skipped (data_model_guard) [{elapsed:.1f}s]",
-                        color='cyan',
-                    )
-                    continue
-
-            # ── Guard: change_flag_guard ──────────────────────────────────
-            # Bypass change_flag_guard for controller_diff steps in full-run
-            # mode — the controller query itself determines if work is needed.
-            has_controller_diff = step.get('full_run_strategy') == 'controller_diff'
-            in_full_run = not self.run_map_diff_run or self.force_run_all
-            bypass_change_flag = has_controller_diff and in_full_run
-
-            if flag_name and not bypass_change_flag and not self.change_flags.get(flag_name, False):
-                step_results.append({
+                return ({
                     'resource_name': resource_name,
                     'module': module,
                     'status': 'skipped',
-                    'reason': f"change flag '{flag_name}' is False",
-                })
-                elapsed = time.monotonic() - step_start
-                display.display(
-                    f"{op_label} [{self.fabric_name}] "
-                    f"{resource_name} → skipped (no changes) [{elapsed:.1f}s]",
-                    color='cyan',
-                )
-                continue
+                    'reason': f"data_model_guard '{failed}' resolved to falsy",
+                }, None)
 
-            # ── Guard: runtime_change_refs ────────────────────────────────
-            # Skip this step if none of the referenced prior steps actually
-            # changed anything at runtime (i.e., NDFC module returned
-            # changed=true).  This avoids unnecessary operations like
-            # config-save when prior modules were idempotent.
-            runtime_refs = step.get('runtime_change_refs')
-            if runtime_refs:
-                prior_changed = any(
-                    sr.get('changed', False)
-                    for sr in step_results
-                    if sr.get('resource_name') in runtime_refs
-                )
-                if not prior_changed:
-                    step_results.append({
-                        'resource_name': resource_name,
-                        'module': module,
-                        'status': 'skipped',
-                        'reason': (
-                            f"runtime_change_refs {runtime_refs} — "
-                            f"no prior steps changed"
-                        ),
-                    })
-                    elapsed = time.monotonic() - step_start
-                    display.display(
-                        f"{op_label} [{self.fabric_name}] "
-                        f"{resource_name} → skipped (no runtime changes) "
-                        f"[{elapsed:.1f}s]",
-                        color='cyan',
-                    )
-                    continue
-
-            # ── Internal method dispatch ──────────────────────────────────
-            if isinstance(module, str) and module.startswith('_'):
-                result = self._dispatch_internal_method(resource_name, module, step)
-                step_results.append(result)
+        # ── Guard: change_flag_guard ──────────────────────────────────
+        # Bypass change_flag_guard for controller_diff steps in full-run
+        # mode — the controller query itself determines if work is needed.
+        has_controller_diff = step.get('full_run_strategy') == 'controller_diff'
+        in_full_run = not self.run_map_diff_run or self.force_run_all
+        bypass_change_flag = has_controller_diff and in_full_run
+
+        if flag_name and not bypass_change_flag and not self.change_flags.get(flag_name, False):
+            elapsed = time.monotonic() - step_start
+            display.display(
+                f"{op_label} [{self.fabric_name}] "
+                f"{resource_name} → skipped (no changes) [{elapsed:.1f}s]",
+                color='cyan',
+            )
+            return ({
+                'resource_name': resource_name,
+                'module': module,
+                'status': 'skipped',
+                'reason': f"change flag '{flag_name}' is False",
+            }, None)
+
+        # ── Guard: runtime_change_refs ────────────────────────────────
+        # Skip this step if none of the referenced prior steps actually
+        # changed anything at runtime (i.e., NDFC module returned
+        # changed=true).  This avoids unnecessary operations like
+        # config-save when prior modules were idempotent.
+        runtime_refs = step.get('runtime_change_refs')
+        if runtime_refs:
+            prior_changed = any(
+                sr.get('changed', False)
+                for sr in prior_results
+                if sr.get('resource_name') in runtime_refs
+            )
+            if not prior_changed:
                 elapsed = time.monotonic() - step_start
-                status = result.get('status', 'ok')
-                changed = result.get('changed', False)
                 display.display(
                     f"{op_label} [{self.fabric_name}] "
-                    f"{resource_name} → {status} (changed={changed}) [{elapsed:.1f}s]",
-                    color='yellow' if changed else ('green' if status != 'failed' else 'red'),
+                    f"{resource_name} → skipped (no runtime changes) "
+                    f"[{elapsed:.1f}s]",
+                    color='cyan',
                 )
-                if status == 'failed':
-                    return {
-                        'results': step_results,
-                        'failed': True,
-                        'msg': result.get('reason', f"Internal method '{module}' failed"),
-                    }
-                continue
-
-            # ── Hook: subclass data resolution ────────────────────────────
-            data, resolved_state = self._resolve_step_data(resource_name, step)
-
-            if not data and resolved_state == 'overridden':
-                # If the data set is empty we still want to send it to the module
-                # for state overridden
-                pass
-            elif not data:
-                step_results.append({
+                return ({
                     'resource_name': resource_name,
                     'module': module,
                     'status': 'skipped',
-                    'reason': 'no data available',
-                })
-                elapsed = time.monotonic() - step_start
-                display.display(
-                    f"{op_label} [{self.fabric_name}] "
-                    f"{resource_name} → skipped (no diff) [{elapsed:.1f}s]",
-                    color='cyan',
-                )
-                continue
+                    'reason': (
+                        f"runtime_change_refs {runtime_refs} — "
+                        f"no prior steps changed"
+                    ),
+                }, None)
 
-            # ── Fabric parameter resolution ───────────────────────────────
-            fabric_param = step.get('fabric_param', 'fabric')
+        # ── Internal method dispatch ──────────────────────────────────
+        if isinstance(module, str) and module.startswith('_'):
+            result = self._dispatch_internal_method(resource_name, module, step)
+            elapsed = time.monotonic() - step_start
+            status = result.get('status', 'ok')
+            changed = result.get('changed', False)
+            display.display(
+                f"{op_label} [{self.fabric_name}] "
+                f"{resource_name} → {status} (changed={changed}) [{elapsed:.1f}s]",
+                color='yellow' if changed else ('green' if status != 'failed' else 'red'),
+            )
+            if status == 'failed':
+                return (result, result.get('reason', f"Internal method '{module}' failed"))
+            return (result, None)
+
+        # ── Hook: subclass data resolution ────────────────────────────
+        data, resolved_state = self._resolve_step_data(resource_name, step)
+
+        if not data and resolved_state == 'overridden':
+            # If the data set is empty we still want to send it to the module
+            # for state overridden
+            pass
+        elif not data:
+            elapsed = time.monotonic() - step_start
+            display.display(
+                f"{op_label} [{self.fabric_name}] "
+                f"{resource_name} → skipped (no diff) [{elapsed:.1f}s]",
+                color='cyan',
+            )
+            return ({
+                'resource_name': resource_name,
+                'module': module,
+                'status': 'skipped',
+                'reason': 'no data available',
+            }, None)
 
-            # ── Execute NDFC module ───────────────────────────────────────
-            save = step.get('save')
-            deploy = step.get('deploy')
-            skip_validation = step.get('skip_validation')
+        # ── Fabric parameter resolution ───────────────────────────────
+        fabric_param = step.get('fabric_param', 'fabric')
 
-            display.v(
-                f"{op_label} [{self.fabric_name}] Executing {module} for "
-                f"{resource_name} with state={resolved_state}, save={save}, deploy={deploy}, "
-                f"items={len(data) if isinstance(data, list) else '?'}"
-            )
+        # ── Execute NDFC module ───────────────────────────────────────
+        save = step.get('save')
+        deploy = step.get('deploy')
+        skip_validation = step.get('skip_validation')
 
-            result = self.executor.execute(
-                module_name=f"cisco.dcnm.{module}",
-                state=resolved_state,
-                config=data,
-                fabric_name=self.fabric_name,
-                save=save,
-                deploy=deploy,
-                fabric_param=fabric_param,
-                skip_validation=skip_validation,
-            )
+        display.v(
+            f"{op_label} [{self.fabric_name}] Executing {module} for "
+            f"{resource_name} with state={resolved_state}, save={save}, deploy={deploy}, "
+            f"items={len(data) if isinstance(data, list) else '?'}"
+        )
 
-            elapsed = time.monotonic() - step_start
+        result = self.executor.execute(
+            module_name=f"cisco.dcnm.{module}",
+            state=resolved_state,
+            config=data,
+            fabric_name=self.fabric_name,
+            save=save,
+            deploy=deploy,
+            fabric_param=fabric_param,
+            skip_validation=skip_validation,
+        )
 
-            if result.get('failed'):
-                display.display(
-                    f"{op_label} [{self.fabric_name}] "
-                    f"{resource_name} → failed [{elapsed:.1f}s]",
-                    color='red',
-                )
-                step_results.append({
-                    'resource_name': resource_name,
-                    'module': module,
-                    'status': 'failed',
-                    'result': result,
-                })
-                return {
-                    'results': step_results,
-                    'failed': True,
-                    'msg': (
-                        f"{self.OPERATION.title()} pipeline failed at step "
-                        f"'{resource_name}' ({module}): "
-                        f"{result.get('msg', 'unknown error')}"
-                    ),
-                }
+        elapsed = time.monotonic() - step_start
 
-            changed = result.get('changed', False)
+        if result.get('failed'):
             display.display(
                 f"{op_label} [{self.fabric_name}] "
-                f"{resource_name} → ok (changed={changed}) [{elapsed:.1f}s]",
-                color='yellow' if changed else 'green',
+                f"{resource_name} → failed [{elapsed:.1f}s]",
+                color='red',
             )
-
-            step_results.append({
+            return ({
                 'resource_name': resource_name,
                 'module': module,
-                'status': 'ok',
-                'changed': changed,
+                'status': 'failed',
                 'result': result,
-            })
+            }, (
+                f"{self.OPERATION.title()} pipeline failed at step "
+                f"'{resource_name}' ({module}): "
+                f"{result.get('msg', 'unknown error')}"
+            ))
 
-        pipeline_elapsed = time.monotonic() - pipeline_start
+        changed = result.get('changed', False)
         display.display(
-            f"\n{'═' * display.columns}\n"
-            f"{self.OPERATION.upper()} [{self.fabric_name}] "
-            f"Pipeline complete — {total_steps} steps in {pipeline_elapsed:.1f}s\n"
-            f"{'═' * display.columns}",
-            color='dark gray',
+            f"{op_label} [{self.fabric_name}] "
+            f"{resource_name} → ok (changed={changed}) [{elapsed:.1f}s]",
+            color='yellow' if changed else 'green',
         )
 
-        return {
-            'results': step_results,
-            'failed': False,
-            'msite_data': getattr(self, 'msite_data', None),
-            'msg': (
-                f"{self.OPERATION.title()} pipeline completed for "
-                f"{self.fabric_type} fabric '{self.fabric_name}'"
-            ),
-        }
+        return ({
+            'resource_name': resource_name,
+            'module': module,
+            'status': 'ok',
+            'changed': changed,
+            'result': result,
+        }, None)
 
     # ══════════════════════════════════════════════════════════════════════════
     # Subclass Hooks
@@ -823,8 +1006,9 @@ class PipelineRunnerBase(ABC):
 
         Diff run active:  Passes pre-computed diff items via 'pairings' param
                           (direct mode).
-        Diff run disabled: Passes leaf_serial_number + current_pairings and lets
-                          the plugin discover, diff, and execute (discovery mode).
+        Diff run disabled: Passes the serial numbers of all leaf switches +
+                          current_pairings and lets the plugin discover, diff,
+                          and execute (discovery mode).
         """
         # diff_compare returns 'updated' (new/changed) and 'removed' keys
         diff_key = 'updated' if self.OPERATION == 'create' else 'removed'
@@ -885,7 +1069,7 @@ class PipelineRunnerBase(ABC):
                 module_args={
                     "operation": self.OPERATION,
                     "fabric_name": self.fabric_name,
-                    "leaf_serial_number": leaf_switches[0].get('serial_number', ''),
+                    "leaf_serial_numbers": [s.get('serial_number', '') for s in leaf_switches],
                     "current_pairings": tor_pairing_data if tor_pairing_data else [],
                 },
             )
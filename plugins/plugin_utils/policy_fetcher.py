@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Policy Fetcher — Chunked, concurrent retrieval of switch policies from NDFC.
+
+Shared by the policy controller diff (manage_resources), unmanaged_policy and
+update_switch_hostname_policy. Serial numbers are split into chunks of
+policy_fetch_chunk_size (default 20, bounded by URL length) and each chunk is
+queried with
+
+    GET /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/switches?serialNumber=<csv>
+
+Up to policy_fetch_workers chunks (default 1) are in flight at once when
+ndfc_rest_mode is 'direct'; over dcnm_rest the chunks are fetched one after
+the other, as module executions cannot run concurrently. Results
+are merged in chunk order into a PolicyIndex keyed by
+(serialNumber, description), so callers look policies up instead of scanning
+the flat response.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.utils.display import Display
+
+display = Display()
+
+
+class PolicyIndex:
+    """
+    Controller policies indexed by serial number and description.
+
+    Attributes:
+        policies: All policies in fetch order.
+        by_key: {(serialNumber, description): policy}; the last policy wins
+            when a switch has several with the same description.
+        by_serial: {serialNumber: [policies]}.
+    """
+
+    def __init__(self, policies=None):
+        self.policies = []
+        self.by_key = {}
+        self.by_serial = {}
+        self.extend(policies or [])
+
+    def extend(self, policies):
+        for policy in policies:
+            if not isinstance(policy, dict):
+                continue
+            serial = policy.get('serialNumber', '')
+            self.policies.append(policy)
+            self.by_key[(serial, policy.get('description', ''))] = policy
+            self.by_serial.setdefault(serial, []).append(policy)
+
+    def get(self, serial, description):
+        """Policy of a switch with the given description, or None."""
+        return self.by_key.get((serial, description))
+
+    def for_serial(self, serial):
+        """All policies of a switch."""
+        return self.by_serial.get(serial, [])
+
+    def __len__(self):
+        return len(self.policies)
+
+
+class PolicyFetcher:
+    """
+    Fetch switch policies by serial number through an NdfcModuleExecutor.
+
+    Args:
+        executor: NdfcModuleExecutor used for the REST calls.
+        fabric_name: Fabric name, for log messages.
+        label: Log prefix (e.g. 'CREATE', 'REMOVE').
+        chunk_size: Serial numbers per request (default: policy_fetch_chunk_size).
+        workers: Concurrent requests (default: policy_fetch_workers).
+    """
+
+    POLICIES_BY_SERIALS_PATH = (
+        "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control"
+        "/policies/switches?serialNumber={serials}"
+    )
+
+    DEFAULT_CHUNK_SIZE = 20
+    DEFAULT_WORKERS = 1
+
+    def __init__(self, executor, fabric_name, label='POLICY', chunk_size=None, workers=None):
+        task_vars = executor.task_vars or {}
+        self.executor = executor
+        self.fabric_name = fabric_name
+        self.label = label
+        self.chunk_size = max(1, int(
+            chunk_size or task_vars.get('policy_fetch_chunk_size') or self.DEFAULT_CHUNK_SIZE
+        ))
+        self.workers = max(1, int(
+            workers or task_vars.get('policy_fetch_workers') or self.DEFAULT_WORKERS
+        ))
+
+    def fetch(self, serial_numbers, predicate=None):
+        """
+        Fetch the policies of the given switches.
+
+        Chunks whose request fails are logged and skipped.
+
+        Args:
+            serial_numbers: Switch serial number strings.
+            predicate: Optional policy filter applied before indexing.
+
+        Returns:
+            PolicyIndex of the fetched policies.
+        """
+        serial_numbers = list(dict.fromkeys(s for s in serial_numbers if s))
+        chunks = [
+            serial_numbers[i:i + self.chunk_size]
+            for i in range(0, len(serial_numbers), self.chunk_size)
+        ]
+        index = PolicyIndex()
+        if not chunks:
+            return index
+
+        workers = self.executor.max_concurrency(min(self.workers, len(chunks)))
+        display.vvv(
+            f"{self.label} [{self.fabric_name}] fetching policies for "
+            f"{len(serial_numbers)} switches in {len(chunks)} chunks "
+            f"({workers} concurrent)"
+        )
+        if workers == 1:
+            for number, chunk in enumerate(chunks, 1):
+                index.extend(self._select(self._fetch_chunk(number, chunk), predicate))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for policies in pool.map(lambda args: self._fetch_chunk(*args), enumerate(chunks, 1)):
+                    index.extend(self._select(policies, predicate))
+
+        display.vvv(
+            f"{self.label} [{self.fabric_name}] fetched {len(index)} "
+            f"policies for {len(serial_numbers)} switches"
+        )
+        return index
+
+    @staticmethod
+    def _select(policies, predicate):
+        if predicate is None:
+            return policies
+        return [policy for policy in policies if isinstance(policy, dict) and predicate(policy)]
+
+    def _fetch_chunk(self, number, chunk):
+        api_path = self.POLICIES_BY_SERIALS_PATH.format(serials=",".join(chunk))
+        display.vvv(
+            f"{self.label} [{self.fabric_name}] fetching policies for "
+            f"{len(chunk)} switches (chunk {number})"
+        )
+        result = self.executor.execute_rest("GET", api_path)
+        if result.get("failed"):
+            display.warning(
+                f"Per-switch policy query failed for chunk: "
+                f"{result.get('msg', 'unknown')}"
+            )
+            return []
+        return self.parse_response(result)
+
+    @staticmethod
+    def parse_response(query_result):
+        """
+        Parse REST response into a list of policy dicts.
+
+        Handles string, dict (with DATA key), and list response formats.
+
+        Args:
+            query_result: Raw result from execute_rest.
+
+        Returns:
+            List of policy dicts.
+        """
+        response_data = query_result.get("response", {})
+        if isinstance(response_data, str):
+            try:
+                response_data = json.loads(response_data)
+            except (json.JSONDecodeError, TypeError):
+                return []
+
+        if isinstance(response_data, dict):
+            return response_data.get("DATA", []) or []
+        elif isinstance(response_data, list):
+            return response_data
+        return []
@@ -0,0 +1,240 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Prepare Cache — Reuse prepare plugin results whose model inputs are unchanged.
+
+A PreparePlugin declares the data model subtrees it reads and writes in its
+self.keys list, either as one key path (['vxlan', 'topology', 'tor_peers'])
+or as a list of key paths. Plugins with an empty list are always run.
+
+Before a declared plugin runs, prepare_service_model hashes its subtrees as
+they are at that point of the plugin chain, together with the default values
+and the file stamps (name, size, mtime) of the prepare plugins, plugin_utils
+and the dtc/common templates. When the hash matches the
+one recorded by the previous run, the subtrees the plugin changed in that run
+are restored from the cache and the plugin is skipped; otherwise it runs and
+its changes are recorded.
+
+The cache is kept next to the service model files of the validate role as
+
+    <fabric>_service_model_prepare_cache.json
+
+and is only written when every plugin succeeded. Plugins whose changes do not
+survive a JSON round trip (for example integer dict keys) are not cached.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import hashlib
+import json
+import os
+
+from ansible.utils.display import Display
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.cow_model import to_plain
+
+display = Display()
+
+PLUGIN_UTILS_PATH = os.path.dirname(os.path.abspath(__file__))
+PREPARE_PLUGINS_PATH = os.path.join(os.path.dirname(PLUGIN_UTILS_PATH), 'action', 'common', 'prepare_plugins')
+
+CACHE_VERSION = 1
+_ABSENT = object()
+
+
+def key_paths(keys):
+    """Normalize a PreparePlugin keys list into a list of key path tuples."""
+    if not keys:
+        return []
+    if all(isinstance(key, str) for key in keys):
+        return [tuple(keys)]
+    return [tuple(path) for path in keys]
+
+
+def _dumps(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+
+def _lookup(data_model, path):
+    node = data_model
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return _ABSENT
+        node = node[key]
+    return node
+
+
+class PrepareCache:
+    """
+    Cache of prepare plugin changes keyed by a hash of their input subtrees.
+
+    Args:
+        files_path: Directory of the service model files (validate role files).
+        default_values: Default values handed to the prepare plugins.
+        templates_path: dtc/common templates directory.
+        reuse: Whether recorded results may be reused (False only records).
+    """
+
+    def __init__(self, files_path, default_values=None, templates_path=None, reuse=True):
+        self.files_path = files_path
+        self.reuse = reuse
+        self.path = None
+        self.previous = None
+        self.current = {}
+        self.reused = []
+        self._inputs = {}
+        self._common = hashlib.sha256()
+        self._common.update(str(CACHE_VERSION).encode())
+        try:
+            self._common.update(_dumps(to_plain(default_values)).encode())
+        except (TypeError, ValueError):
+            self._common.update(repr(default_values).encode())
+        for path in (PREPARE_PLUGINS_PATH, PLUGIN_UTILS_PATH, templates_path):
+            self._common.update(self._tree_stamp(path).encode())
+
+    @staticmethod
+    def _tree_stamp(tree_path):
+        """Names, sizes and modification times of the files below a directory."""
+        if not tree_path or not os.path.isdir(tree_path):
+            return ''
+        stamps = []
+        for root, dirs, files in os.walk(tree_path):
+            dirs[:] = [name for name in dirs if name != '__pycache__']
+            for name in files:
+                file_path = os.path.join(root, name)
+                stat = os.stat(file_path)
+                stamps.append(f"{os.path.relpath(file_path, tree_path)}:{stat.st_size}:{stat.st_mtime_ns}")
+        return '\n'.join(sorted(stamps))
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Cache File
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def _load(self, data_model):
+        """Resolve the cache file from the fabric name and read it once."""
+        if self.previous is not None:
+            return
+        self.previous = {}
+        fabric_name = _lookup(data_model, ('vxlan', 'fabric', 'name'))
+        if not isinstance(fabric_name, str) or not fabric_name:
+            return
+        self.path = os.path.join(self.files_path, f"{fabric_name}_service_model_prepare_cache.json")
+        if not self.reuse or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError) as error:
+            display.warning(f"Ignoring prepare cache {self.path}: {error}")
+            return
+        if isinstance(cached, dict) and cached.get('version') == CACHE_VERSION:
+            self.previous = cached.get('plugins') or {}
+
+    def save(self):
+        """Write the results recorded (or reused) in this run."""
+        if self.path is None:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({'version': CACHE_VERSION, 'plugins': self.current}, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            display.warning(f"Unable to write prepare cache {self.path}: {error}")
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Plugins
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def _snapshot(self, plugin_name, plugin, data_model):
+        """JSON of each declared subtree (None when absent) and their combined hash."""
+        digest = self._common.copy()
+        digest.update(plugin_name.encode())
+        inputs = []
+        for path in key_paths(plugin.keys):
+            value = _lookup(data_model, path)
+            encoded = None if value is _ABSENT else _dumps(to_plain(value))
+            inputs.append((path, encoded))
+            digest.update(_dumps([list(path), encoded]).encode())
+        return inputs, digest.hexdigest()
+
+    def restore(self, plugin_name, plugin, data_model):
+        """
+        Restore a plugin's recorded changes when its inputs are unchanged.
+
+        Returns:
+            bool: True when the plugin can be skipped.
+        """
+        if not key_paths(plugin.keys):
+            return False
+        self._load(data_model)
+        try:
+            inputs, input_hash = self._snapshot(plugin_name, plugin, data_model)
+        except (TypeError, ValueError):
+            return False
+
+        entry = self.previous.get(plugin_name) if self.reuse else None
+        if not entry or entry.get('inputs') != input_hash:
+            self._inputs[plugin_name] = (inputs, input_hash)
+            return False
+
+        for change in entry.get('changes', []):
+            path = tuple(change['path'])
+            parent = data_model
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            if change.get('absent'):
+                parent.pop(path[-1], None)
+            else:
+                parent[path[-1]] = copy.deepcopy(change['value'])
+        self.current[plugin_name] = entry
+        self.reused.append(plugin_name)
+        display.vvv(f"PREPARE [{plugin_name}] inputs unchanged, reusing previous results")
+        return True
+
+    def record(self, plugin_name, data_model):
+        """Record the subtrees a plugin changed, after it ran successfully."""
+        if plugin_name not in self._inputs:
+            return
+        inputs, input_hash = self._inputs.pop(plugin_name)
+        changes = []
+        try:
+            for path, before in inputs:
+                value = _lookup(data_model, path)
+                if value is _ABSENT:
+                    if before is not None:
+                        changes.append({'path': list(path), 'absent': True})
+                    continue
+                plain = to_plain(value)
+                after = _dumps(plain)
+                if after == before:
+                    continue
+                decoded = json.loads(after)
+                if decoded != plain:
+                    return
+                changes.append({'path': list(path), 'value': decoded})
+        except (TypeError, ValueError):
+            return
+        self.current[plugin_name] = {'inputs': input_hash, 'changes': changes}
@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Prepare Templates — Shared Jinja2 environment for prepare plugin renders.
+
+prep_108_vrf_lites and prep_109_route_control render dtc/common templates
+(ndfc_vrf_lite.j2, ndfc_route_control.j2) into switch freeform policies.
+PrepareTemplates hands them one process-wide environment per templates
+directory, with the ipaddr/ipv4/ipv6/hwaddr filters registered once, so each
+template and its includes are compiled once per process. With
+template_bytecode_cache (default true) the compiled bytecode is also kept in
+the on-disk TemplateBytecodeCache, so later runs skip compilation entirely.
+
+render_many() renders one template for a batch of items, merging each item's
+variables over the variables the batch shares.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import threading
+
+from jinja2 import ChainableUndefined, Environment, FileSystemLoader
+
+from ansible_collections.ansible.utils.plugins.filter import hwaddr, ipaddr, ipv4, ipv6
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.registry_loader import RegistryLoader
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.template_cache import TemplateBytecodeCache
+
+
+class PrepareTemplates:
+    """
+    Shared template environment of a templates directory.
+
+    Args:
+        templates_path: Templates directory (dtc/common/templates).
+        bytecode_cache: Keep compiled templates in the on-disk bytecode cache.
+    """
+
+    _environments = {}
+    _environments_lock = threading.Lock()
+
+    def __init__(self, templates_path, bytecode_cache=True):
+        self.templates_path = os.path.abspath(templates_path)
+        self.bytecode_cache = bool(bytecode_cache)
+
+    @property
+    def environment(self):
+        """Jinja2 environment shared by every PrepareTemplates of the directory."""
+        key = (self.templates_path, self.bytecode_cache)
+        with self._environments_lock:
+            env = self._environments.get(key)
+            if env is None:
+                env = Environment(
+                    loader=FileSystemLoader(self.templates_path),
+                    undefined=ChainableUndefined,
+                    lstrip_blocks=True,
+                    trim_blocks=True,
+                )
+                env.filters["ipaddr"] = ipaddr.ipaddr
+                env.filters["ipv4"] = ipv4.ipv4
+                env.filters["ipv6"] = ipv6.ipv6
+                env.filters["hwaddr"] = hwaddr.hwaddr
+                if self.bytecode_cache:
+                    env.bytecode_cache = TemplateBytecodeCache.for_environment(
+                        env, RegistryLoader.get_collection_path(),
+                    )
+                self._environments[key] = env
+        return env
+
+    def get(self, template_name):
+        """Compiled template (cached by the environment)."""
+        return self.environment.get_template(template_name)
+
+    def render_many(self, template_name, items, **shared):
+        """
+        Render a template once per item.
+
+        Args:
+            template_name: Template file name relative to the templates directory.
+            items: Dicts of per-render variables.
+            **shared: Variables common to every render.
+
+        Returns:
+            List of rendered strings, in item order.
+        """
+        template = self.get(template_name)
+        return [template.render({**shared, **item}) for item in items]
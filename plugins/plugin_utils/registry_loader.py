@@ -25,10 +25,11 @@ Registry Loader — Shared YAML registry loader with LRU cache and validation.
 Provides a single entry point for all DTC action plugins to load their
 data-driven configuration from external YAML registry files under resources/.
 
-Includes three validation capabilities:
+Includes four validation capabilities:
   1. Cross-reference validation — pipeline resource_names vs resource_types keys
   2. Pipeline symmetry validation — create/remove step correspondence
   3. Schema validation — required fields check to catch YAML typos
+  4. Dependency validation — depends_on/after edges reference earlier steps
 
 Usage:
     from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.registry_loader import RegistryLoader
@@ -75,6 +76,9 @@ REQUIRED_PIPELINE_FIELDS = {
 }
 
 
+# Structural diff layouts (see plugin_utils/diff_engine.py)
+DIFF_LAYOUTS = ('items', 'switch_policies')
+
 REQUIRED_FABRIC_TYPE_FIELDS = {
     'namespace',
     'file_subdir',
@@ -97,6 +101,8 @@ KNOWN_PIPELINE_FIELDS = {
     'deploy',
     'save',
     'tag',
+    'depends_on',
+    'after',
 }
 
 
@@ -214,7 +220,7 @@ class RegistryLoader:
     @staticmethod
     def validate_all(collection_path):
         """
-        Run all three validation checks and return combined results.
+        Run all four validation checks and return combined results.
 
         This is the primary entry point for registry validation. Call it
         at plugin startup (with -vvv) or as part of CI.
@@ -262,6 +268,13 @@ class RegistryLoader:
         )
         warnings.extend(symmetry_warnings)
 
+        # 4. Pipeline dependency validation
+        dep_errors, dep_warnings = RegistryLoader.validate_pipeline_dependencies(
+            create_resources, remove_resources,
+        )
+        errors.extend(dep_errors)
+        warnings.extend(dep_warnings)
+
         return {
             'errors': errors,
             'warnings': warnings,
@@ -409,6 +422,75 @@ class RegistryLoader:
 
         return warnings
 
+    @staticmethod
+    def validate_pipeline_dependencies(create_resources, remove_resources):
+        """
+        Verify depends_on/after edges between pipeline steps.
+
+        Edges may only point at steps declared earlier in the same fabric
+        pipeline. This keeps every pipeline acyclic and guarantees that the
+        declaration order is a valid execution order when steps run serially.
+
+        Checks:
+          - depends_on references must name an earlier step (error)
+          - after references that do not name an earlier step are ignored
+            at runtime (warning)
+
+        Args:
+            create_resources:  Parsed create_resources.yml content
+            remove_resources:  Parsed remove_resources.yml content
+
+        Returns:
+            Tuple of (errors, warnings) lists.
+        """
+        errors = []
+        warnings = []
+
+        for pipeline_name, pipelines_data in [
+            ('create', create_resources),
+            ('remove', remove_resources),
+        ]:
+            pipeline_key = f'{pipeline_name}_resources'
+            pipeline_dict = pipelines_data.get(pipeline_key, {})
+
+            for fabric_type, steps in pipeline_dict.items():
+                if fabric_type == 'role_tag' or not isinstance(steps, list):
+                    continue
+
+                earlier = set()
+                for idx, step in enumerate(steps):
+                    if not isinstance(step, dict):
+                        continue
+                    label = (
+                        f"{pipeline_name} pipeline [{fabric_type}] step {idx} "
+                        f"({step.get('resource_name', '?')})"
+                    )
+                    for field in ('depends_on', 'after'):
+                        refs = step.get(field)
+                        if refs is None:
+                            continue
+                        if isinstance(refs, str):
+                            refs = [refs]
+                        if not isinstance(refs, list):
+                            errors.append(f"{label}: {field} must be a string or list")
+                            continue
+                        unknown = [r for r in refs if r not in earlier]
+                        if not unknown:
+                            continue
+                        if field == 'depends_on':
+                            errors.append(
+                                f"{label}: depends_on references no earlier "
+                                f"step: {sorted(unknown)}"
+                            )
+                        else:
+                            warnings.append(
+                                f"{label}: after references no earlier "
+                                f"step (ignored): {sorted(unknown)}"
+                            )
+                    earlier.add(step.get('resource_name'))
+
+        return (errors, warnings)
+
     @staticmethod
     def validate_schema(resource_types, create_resources, remove_resources, fabric_types):
         """
@@ -439,6 +521,24 @@ class RegistryLoader:
                 errors.append(
                     f"resource_types '{name}': missing required fields: {sorted(missing)}"
                 )
+            inputs = cfg.get('inputs')
+            if inputs is not None:
+                if not isinstance(inputs, list) or not all(isinstance(i, str) and i for i in inputs):
+                    errors.append(f"resource_types '{name}': inputs must be a list of dotted paths")
+                elif cfg.get('template') is None or cfg.get('pre_hooks'):
+                    errors.append(
+                        f"resource_types '{name}': inputs require a template and no pre_hooks"
+                    )
+            for field in ('diff_key', 'diff_fields'):
+                value = cfg.get(field)
+                if value is not None and (
+                    not isinstance(value, list) or not all(isinstance(v, str) and v for v in value)
+                ):
+                    errors.append(f"resource_types '{name}': {field} must be a list of field names")
+            if cfg.get('diff_layout', 'items') not in DIFF_LAYOUTS:
+                errors.append(
+                    f"resource_types '{name}': diff_layout must be one of {list(DIFF_LAYOUTS)}"
+                )
 
         # Validate fabric_types entries
         for name, cfg in fabric_types.get('fabric_types', {}).items():
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Rule Support — Shared lookups for the validate role rules.
+
+Rules under roles/validate/files/rules used to keep names in lists and test
+membership per interface, attach group or network, and normalized every
+interface name with four re.sub() calls. The helpers below build the lookups
+once per rule run so each check is a set or dict lookup:
+
+  - normalize_interface_name(): memoized Ethernet/Port-channel/Loopback
+    name normalization, shared by every rule.
+  - names(): set of the names of a list of model items (VRFs, networks,
+    policies, policy groups, ...).
+  - SwitchIndex: topology switches by name and management IPv4/IPv6 address.
+  - VpcPeerIndex: vPC pairs of vxlan.topology.vpc_peers by switch.
+
+Indexes are built from the data model handed to the rule, so the reads the
+rule engine records for a rule still cover everything the rule depends on.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import functools
+import re
+
+_ETHERNET = re.compile(r"^(?:e|eth(?:ernet)?)(\d(?:\/\d+){1,2})$", re.IGNORECASE)
+_PORT_CHANNEL = re.compile(
+    r"^(po|port-channel)([1-9]|[1-9][0-9]{1,3}|[1-3][0-9]{3}|40([0-8][0-9]|9[0-6]))$", re.IGNORECASE
+)
+_ETHERNET_SUB = re.compile(r"^(?:e|eth(?:ernet)?)(\d(?:\/\d+){1,2}\.\d{1,4})$", re.IGNORECASE)
+_LOOPBACK = re.compile(r"^(lo|loopback)([0-9]|[1-9][0-9]{1,2}|10[0-1][0-9]|102[0-3])$", re.IGNORECASE)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Interface Names
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+@functools.lru_cache(maxsize=16384)
+def normalize_interface_name(interface_name):
+    """
+    Normalize an interface name (e1/1 -> Ethernet1/1, po10 -> Port-channel10, lo0 -> Loopback0).
+
+    Args:
+        interface_name: Interface name as written in the data model.
+
+    Returns:
+        str: Normalized interface name.
+    """
+    # Replace 'eth' or 'e' followed by digits with 'Ethernet' followed by the same digits
+    interface_name = _ETHERNET.sub(r"Ethernet\1", interface_name)
+    # Replace 'Po' followed by digits with 'Port-channel' followed by the same digits
+    interface_name = _PORT_CHANNEL.sub(r"Port-channel\2", interface_name)
+    # Replace 'eth' or 'e' followed by digits with 'Ethernet' followed by the same digits (for sub interface)
+    interface_name = _ETHERNET_SUB.sub(r"Ethernet\1", interface_name)
+    # Replace 'Lo' or 'Loopback' followed by digits with 'Loopback' followed by the same digits
+    interface_name = _LOOPBACK.sub(r"Loopback\2", interface_name)
+    return interface_name
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Name Sets
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+def names(items, key="name"):
+    """
+    Names of a list of data model items.
+
+    Args:
+        items: List of dicts (VRFs, networks, policies, ...), or None.
+        key: Key holding the name.
+
+    Returns:
+        set: Values of 'key' across the items.
+    """
+    return {item.get(key) for item in items or []}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Topology Indexes
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class SwitchIndex:
+    """
+    Topology switches by name and management address.
+
+    Args:
+        switches: vxlan.topology.switches, or None.
+    """
+
+    def __init__(self, switches):
+        self.by_name = {}
+        self.ipv4_addresses = set()
+        self.ipv6_addresses = set()
+        for switch in switches or []:
+            self.by_name.setdefault(switch.get("name"), switch)
+            management = switch.get("management") or {}
+            self.ipv4_addresses.add(management.get("management_ipv4_address"))
+            self.ipv6_addresses.add(management.get("management_ipv6_address"))
+
+    def has_name(self, name):
+        """Whether a switch of that name is defined."""
+        return name in self.by_name
+
+    def __contains__(self, hostname):
+        """Whether hostname is the name or a management address of a switch."""
+        return hostname in self.by_name or hostname in self.ipv4_addresses or hostname in self.ipv6_addresses
+
+
+class VpcPeerIndex:
+    """
+    vPC pairs of vxlan.topology.vpc_peers.
+
+    Args:
+        vpc_peers: vxlan.topology.vpc_peers, or None.
+
+    Attributes:
+        pairs: (peer1, peer2) of each entry, in model order.
+        pairs_by_switch: Switch name to the positions in 'pairs' of its pairs.
+        peer_of: Switch name to its vPC peer, for entries with both peers set.
+    """
+
+    def __init__(self, vpc_peers):
+        self.pairs = []
+        self.pairs_by_switch = {}
+        self.peer_of = {}
+        for vpc_pair in vpc_peers or []:
+            peer1 = vpc_pair.get("peer1")
+            peer2 = vpc_pair.get("peer2")
+            position = len(self.pairs)
+            self.pairs.append((peer1, peer2))
+            for switch_name in {peer1, peer2}:
+                self.pairs_by_switch.setdefault(switch_name, []).append(position)
+            if peer1 and peer2:
+                self.peer_of[peer1] = peer2
+                self.peer_of[peer2] = peer1
+
+    def __contains__(self, switch_name):
+        """Whether the switch is part of a vPC pair."""
+        return switch_name in self.pairs_by_switch
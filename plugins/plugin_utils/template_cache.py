@@ -0,0 +1,144 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Template Bytecode Cache — On-disk Jinja2 bytecode cache for role templates.
+
+Jinja2 parses and compiles every template (including {% include %} and
+{% import %} targets) on each run. TemplateBytecodeCache persists the
+compiled bytecode so repeat runs load it instead of recompiling.
+
+Invalidation is automatic:
+  - each entry stores the SHA1 of the template source and is recompiled
+    when the template content changes
+  - entries live in a directory keyed by the collection version, the
+    Jinja2/ansible-core/Python versions and the environment's compile
+    options, so upgrades never reuse stale bytecode
+
+Only templates loaded through the environment's loader are cached. Callers
+that render a template source string should render an include of it instead.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import yaml
+
+from ansible.release import __version__ as ansible_version
+from ansible.utils.display import Display
+
+display = Display()
+
+try:
+    from jinja2 import FileSystemBytecodeCache
+    from jinja2 import __version__ as jinja2_version
+except ImportError:
+    FileSystemBytecodeCache = object
+    jinja2_version = None
+
+
+# Default cache root, next to ansible's own caches (e.g. ~/.ansible/galaxy_cache)
+DEFAULT_CACHE_ROOT = os.path.join('~', '.ansible', 'nac_dc_vxlan', 'template_cache')
+
+# Environment options that change the generated code
+_COMPILE_OPTIONS = (
+    'block_start_string', 'block_end_string',
+    'variable_start_string', 'variable_end_string',
+    'comment_start_string', 'comment_end_string',
+    'line_statement_prefix', 'line_comment_prefix',
+    'trim_blocks', 'lstrip_blocks', 'newline_sequence',
+    'keep_trailing_newline', 'optimized', 'is_async',
+)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache rooted in a version/options keyed directory."""
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_environment(cls, environment, collection_path, cache_root=None):
+        """
+        Return the shared cache for an environment, or None if unavailable.
+
+        Args:
+            environment: Jinja2 environment the bytecode is compiled for.
+            collection_path: Collection root, used to resolve its version.
+            cache_root: Cache root directory (defaults to DEFAULT_CACHE_ROOT).
+        """
+        if jinja2_version is None:
+            return None
+
+        key_material = {
+            'collection': collection_version(collection_path),
+            'jinja2': jinja2_version,
+            'ansible': ansible_version,
+            'python': list(sys.version_info[:2]),
+            'options': {opt: repr(getattr(environment, opt, None)) for opt in _COMPILE_OPTIONS},
+        }
+        key = hashlib.sha1(json.dumps(key_material, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        directory = os.path.join(os.path.expanduser(cache_root or DEFAULT_CACHE_ROOT), key)
+
+        with cls._instances_lock:
+            cache = cls._instances.get(directory)
+            if cache is None:
+                try:
+                    os.makedirs(directory, mode=0o700, exist_ok=True)
+                except OSError as e:
+                    display.warning(f"Template bytecode cache disabled, cannot create {directory}: {e}")
+                    return None
+                cache = cls(directory)
+                cls._instances[directory] = cache
+        return cache
+
+    def dump_bytecode(self, bucket):
+        # A cache that cannot be written must never fail a render
+        try:
+            super(TemplateBytecodeCache, self).dump_bytecode(bucket)
+        except OSError as e:
+            display.vvv(f"Template bytecode cache write failed for {bucket.key}: {e}")
+
+
+def collection_version(collection_path):
+    """
+    Return the collection version from MANIFEST.json (installed) or galaxy.yml (source).
+
+    Returns:
+        Version string, or 'unknown' when neither file can be read.
+    """
+    manifest = os.path.join(collection_path, 'MANIFEST.json')
+    galaxy = os.path.join(collection_path, 'galaxy.yml')
+    try:
+        if os.path.exists(manifest):
+            with open(manifest) as f:
+                return json.load(f)['collection_info']['version']
+        with open(galaxy) as f:
+            return yaml.safe_load(f)['version']
+    except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError):
+        return 'unknown'
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Topology Index — Constant-time switch lookups for the prepare plugins.
+
+Built once by prepare_service_model and handed to every PreparePlugin as the
+'topology_index' keyword argument, so resolving a switch name, serial number
+or management IP no longer scans vxlan.topology.switches (or
+vxlan.policy.switches) once per reference.
+
+Lookups follow the semantics of the scans they replace: when several
+switches share a name or serial number the first one wins, and the
+management IP is the IPv4 address, falling back to the IPv6 address.
+
+The index references the switch dicts of the data model rather than copying
+them, so values changed in place by earlier plugins are always current. The
+switch lists are re-indexed when a plugin replaces them, and entries
+appended to vxlan.policy.switches are picked up on the next lookup.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+def mgmt_ip(switch):
+    """Management IPv4 address of a topology switch, else its IPv6 address, else None."""
+    management = (switch or {}).get('management') or {}
+    return management.get('management_ipv4_address') or management.get('management_ipv6_address') or None
+
+
+class TopologyIndex:
+    """
+    Name, serial number and management IP index of a data model's switches.
+
+    Args:
+        data_model: Extended data model (results['model_extended']).
+    """
+
+    def __init__(self, data_model):
+        self.data_model = data_model
+        self._topology = _ListIndex(('vxlan', 'topology', 'switches'), ('name', 'serial_number'))
+        self._policy = _ListIndex(('vxlan', 'policy', 'switches'), ('name',))
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Topology Switches
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def switch(self, name):
+        """Topology switch with the given name, or None."""
+        return self._topology.get(self.data_model, 'name', name)
+
+    def switch_by_serial(self, serial_number):
+        """Topology switch with the given serial number, or None."""
+        return self._topology.get(self.data_model, 'serial_number', serial_number)
+
+    def mgmt_ip(self, name):
+        """Management IP (IPv4, else IPv6) of the named topology switch, or None."""
+        return mgmt_ip(self.switch(name))
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Policy Switches
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def policy_switch_position(self, name):
+        """Position of the named switch in vxlan.policy.switches, or None."""
+        return self._policy.position(self.data_model, 'name', name)
+
+    def policy_switch(self, name):
+        """Entry of the named switch in vxlan.policy.switches, or None."""
+        return self._policy.get(self.data_model, 'name', name)
+
+
+class _ListIndex:
+    """First-occurrence position index of a list of dicts inside the data model."""
+
+    def __init__(self, path, fields):
+        self.path = path
+        self.fields = fields
+        self._items = None
+        self._count = 0
+        self._positions = {field: {} for field in fields}
+
+    def _resolve(self, data_model):
+        node = data_model
+        for key in self.path:
+            if not isinstance(node, dict):
+                return []
+            node = node.get(key)
+        return node if isinstance(node, list) else []
+
+    def _sync(self, data_model):
+        items = self._resolve(data_model)
+        if items is not self._items or len(items) < self._count:
+            self._items = items
+            self._count = 0
+            self._positions = {field: {} for field in self.fields}
+        for position in range(self._count, len(items)):
+            item = items[position]
+            if not isinstance(item, dict):
+                continue
+            for field in self.fields:
+                value = item.get(field)
+                if value is not None and value.__hash__ is not None:
+                    self._positions[field].setdefault(value, position)
+        self._count = len(items)
+        return items
+
+    def position(self, data_model, field, value):
+        self._sync(data_model)
+        if value is None or value.__hash__ is None:
+            return None
+        return self._positions[field].get(value)
+
+    def get(self, data_model, field, value):
+        position = self.position(data_model, field, value)
+        return self._items[position] if position is not None else None
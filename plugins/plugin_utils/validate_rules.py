@@ -0,0 +1,469 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Validate Rules — Semantic rule engine for the nac_dc_validate action.
+
+nac_dc_validate used to build one nac_validate Validator per rules directory
+(common, ibgp_vxlan/, common_vxlan, ...), loading the schema again each time
+and running every rule against the whole model. RuleEngine loads the rule
+classes of each directory once and runs them against the model loaded once
+by the action:
+
+  - Up to validate_workers rules (default 1) run at once on forked worker
+    processes; results are reported in rule order.
+  - Each rule runs against a read-tracking view of the model that records
+    which subtrees (down to three levels, e.g. vxlan.topology.switches) the
+    rule looked at, and how: presence, length or full content.
+  - With validate_incremental (default true) the result of each rule is
+    cached with the digests of what it read, in
+
+        <fabric>_validate_cache.json
+
+    next to the service model files. A rule whose rule file (and schema, for
+    rules that receive it) is unchanged and whose recorded reads digest to
+    the same values is not run again; its previous result is reported.
+    Changes to the rule_support helpers invalidate every cached result.
+
+Rules that depend on anything besides the model (for example files on disk)
+set 'cacheable = False' on their Rule class and are always run.
+
+Rule modules are loaded the same way nac_validate loads them: in directory
+listing order, keyed by Rule.id within a directory.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from inspect import signature
+
+from ansible.utils.display import Display
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils import rule_support
+
+display = Display()
+
+CACHE_VERSION = 1
+
+# Dicts above this depth are tracked key by key; deeper subtrees are read whole
+TRACK_DEPTH = 3
+
+_ABSENT = object()
+
+# Engine whose rules are run by the forked workers. Set just before the pool
+# starts so workers inherit the rules and the model instead of pickling them.
+_WORKER_ENGINE = None
+
+
+def _run_in_worker(rule_key):
+    """
+    Run one rule in a worker.
+
+    Returns:
+        (rule_key, result, reads, error) tuple.
+    """
+    try:
+        result, reads = _WORKER_ENGINE.run_rule(_WORKER_ENGINE.rules_by_key[rule_key])
+        return rule_key, result, reads, None
+    except Exception as e:
+        return rule_key, None, None, f"{type(e).__name__}: {e}"
+
+
+def _file_digest(file_path):
+    if not file_path or not os.path.isfile(file_path):
+        return ''
+    with open(file_path, 'rb') as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Read Tracking
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class TrackedDict(dict):
+    """
+    Dict view of a data model node that records what a rule reads from it.
+
+    Reads are recorded into the shared 'reads' dict as (kind, path) keys:
+      - 'has':   whether a key is present ('key in d')
+      - 'dict':  that a key holds a dict (returned as a tracked child)
+      - 'len':   the number of keys (len(d), truthiness)
+      - 'value': the full content of the node
+    """
+
+    __slots__ = ('_path', '_reads', '_children')
+
+    def __init__(self, node, path, reads):
+        dict.__init__(self, node)
+        self._path = path
+        self._reads = reads
+        self._children = {}
+
+    def _record(self, kind, path):
+        self._reads[(kind, path)] = None
+
+    def _read_all(self):
+        self._record('value', self._path)
+
+    def _child(self, key, value):
+        path = self._path + (key,)
+        if isinstance(value, dict) and len(path) < TRACK_DEPTH:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = TrackedDict(value, path, self._reads)
+            self._record('dict', path)
+            return child
+        self._record('value', path)
+        return value
+
+    def __getitem__(self, key):
+        try:
+            value = dict.__getitem__(self, key)
+        except KeyError:
+            self._record('has', self._path + (key,))
+            raise
+        return self._child(key, value)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self._child(key, dict.__getitem__(self, key))
+        self._record('has', self._path + (key,))
+        return default
+
+    def __contains__(self, key):
+        self._record('has', self._path + (key,))
+        return dict.__contains__(self, key)
+
+    def __len__(self):
+        self._record('len', self._path)
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self._read_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._read_all()
+        return dict.keys(self)
+
+    def items(self):
+        self._read_all()
+        return dict.items(self)
+
+    def values(self):
+        self._read_all()
+        return dict.values(self)
+
+    def __eq__(self, other):
+        self._read_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._read_all()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._read_all()
+        return dict.__repr__(self)
+
+    def copy(self):
+        self._read_all()
+        return dict(dict.items(self))
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (self.copy(),))
+
+    def setdefault(self, key, default=None):
+        self._read_all()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        self._read_all()
+        return dict.pop(self, key, *default)
+
+
+def _read_digest(data_model, kind, path):
+    """Digest of what a recorded read observed in the data model."""
+    node = data_model
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            node = _ABSENT
+            break
+        node = node[key]
+
+    if node is _ABSENT:
+        observed = 'absent'
+    elif kind == 'has':
+        observed = 'present'
+    elif kind == 'dict':
+        observed = 'dict' if isinstance(node, dict) else 'other'
+    elif kind == 'len':
+        observed = str(len(node)) if hasattr(node, '__len__') else 'unsized'
+    else:
+        try:
+            observed = json.dumps(node, default=repr)
+        except (TypeError, ValueError):
+            observed = repr(node)
+    return hashlib.sha256(observed.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Rule Engine
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class RuleEngine:
+    """
+    Run the rules of one or more rules directories against a data model.
+
+    Args:
+        data_model: Data model loaded from the fabric host_vars.
+        schema: Loaded yamale schema handed to two-argument rules (or None).
+        schema_path: Schema file, part of the cache key of two-argument rules.
+        cache_path: Rule result cache file, or None to disable caching.
+        reuse: Whether cached results may be reused (False only records).
+        workers: Rules run at once on forked worker processes.
+    """
+
+    _rule_dirs = {}
+
+    def __init__(self, data_model, schema=None, schema_path=None, cache_path=None, reuse=True, workers=1):
+        self.data_model = data_model
+        self.schema = schema
+        self.schema_digest = _file_digest(schema_path)
+        # Rules build their lookups with rule_support, so it is part of every rule's key
+        self.support_digest = _file_digest(rule_support.__file__)
+        self.cache_path = cache_path
+        self.reuse = reuse
+        self.workers = max(1, int(workers or 1))
+        self.rules_by_key = {}
+        self.reused = []
+        self.previous = self._load_cache()
+        self.current = {}
+        self._digests = {}
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Rules
+    # ══════════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    def load_rules(cls, rules_dir):
+        """
+        Load the Rule classes of a directory, once per process.
+
+        Returns:
+            List of (rule_key, Rule, source_digest) tuples in rule order.
+        """
+        rules_dir = os.path.abspath(rules_dir)
+        file_names = [name for name in os.listdir(rules_dir) if os.path.splitext(name)[1] == '.py']
+        stamp = []
+        for name in file_names:
+            stat = os.stat(os.path.join(rules_dir, name))
+            stamp.append((name, stat.st_size, stat.st_mtime_ns))
+        cached = cls._rule_dirs.get(rules_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        rules = {}
+        for name in file_names:
+            file_path = os.path.join(rules_dir, name)
+            try:
+                spec = importlib.util.spec_from_file_location("nac_validate.rules", file_path)
+                if spec is None or spec.loader is None:
+                    continue
+                module = importlib.util.module_from_spec(spec)
+                sys.modules["nac_validate.rules"] = module
+                spec.loader.exec_module(module)
+                rules[module.Rule.id] = (file_path, module.Rule, _file_digest(file_path))
+            except Exception:
+                display.warning(f"Failed loading rule: {name}")
+
+        loaded = [(f"{file_path}:{rule.id}", rule, digest) for file_path, rule, digest in rules.values()]
+        cls._rule_dirs[rules_dir] = (stamp, loaded)
+        return loaded
+
+    def run_rule(self, rule):
+        """
+        Run a rule against a read-tracking view of the model.
+
+        Returns:
+            (result, reads) tuple; reads lists the (kind, path) reads made.
+        """
+        reads = {}
+        data_model = TrackedDict(self.data_model, (), reads) if isinstance(self.data_model, dict) else self.data_model
+        if len(signature(rule.match).parameters) == 2:
+            result = rule.match(data_model, self.schema)
+        else:
+            result = rule.match(data_model)
+        return result, list(reads)
+
+    def validate(self, rules_dir):
+        """
+        Run the rules of a directory.
+
+        Returns:
+            List of error messages (empty when every rule passed).
+        """
+        loaded = self.load_rules(rules_dir)
+        results = {}
+        pending = []
+        for rule_key, rule, source_digest in loaded:
+            self.rules_by_key[rule_key] = rule
+            cached = self._restore(rule_key, rule, source_digest)
+            if cached is not None:
+                results[rule_key] = cached
+            else:
+                pending.append((rule_key, rule, source_digest))
+
+        source_digests = {rule_key: source_digest for rule_key, _rule, source_digest in pending}
+        for rule_key, result, reads in self._run(pending):
+            results[rule_key] = result
+            self._record(rule_key, source_digests[rule_key], result, reads)
+
+        errors = []
+        for rule_key, rule, _source_digest in loaded:
+            paths = results[rule_key]
+            if len(paths) > 0:
+                errors.append("Semantic error, rule {}: {} ({})".format(rule.id, rule.description, paths))
+        return errors
+
+    def _run(self, pending):
+        """Run rules serially, or on forked workers when configured."""
+        global _WORKER_ENGINE
+
+        workers = min(self.workers, len(pending))
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            display.warning("validate_workers requires the 'fork' start method — running rules serially")
+            workers = 1
+
+        if workers > 1:
+            _WORKER_ENGINE = self
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('fork'),
+                ) as pool:
+                    outcomes = list(pool.map(_run_in_worker, [rule_key for rule_key, _rule, _digest in pending]))
+            except (BrokenProcessPool, OSError) as e:
+                display.warning(f"Parallel rule validation unavailable ({e}) — running rules serially")
+                outcomes = None
+            finally:
+                _WORKER_ENGINE = None
+
+            if outcomes is not None:
+                display.vvv(f"VALIDATE Ran {len(pending)} rules with {workers} workers")
+                for rule_key, result, reads, error in outcomes:
+                    if error is not None:
+                        raise RuntimeError(f"Rule {self.rules_by_key[rule_key].id} failed: {error}")
+                    yield rule_key, result, [(kind, tuple(path)) for kind, path in reads]
+                return
+
+        for rule_key, rule, _source_digest in pending:
+            result, reads = self.run_rule(rule)
+            yield rule_key, result, reads
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Cache
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.isfile(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError) as error:
+            display.warning(f"Ignoring rule cache {self.cache_path}: {error}")
+            return {}
+        if isinstance(cached, dict) and cached.get('version') == CACHE_VERSION:
+            return cached.get('rules') or {}
+        return {}
+
+    def _digest(self, kind, path):
+        key = (kind, path)
+        if key not in self._digests:
+            self._digests[key] = _read_digest(self.data_model, kind, path)
+        return self._digests[key]
+
+    def _source_key(self, rule, source_digest):
+        if len(signature(rule.match).parameters) == 2:
+            return f"{source_digest}:{self.support_digest}:{self.schema_digest}"
+        return f"{source_digest}:{self.support_digest}"
+
+    def _restore(self, rule_key, rule, source_digest):
+        """Cached result of a rule whose reads are unchanged, else None."""
+        if not self.cache_path or not getattr(rule, 'cacheable', True):
+            return None
+        entry = self.previous.get(rule_key) if self.reuse else None
+        if not entry or entry.get('source') != self._source_key(rule, source_digest):
+            return None
+        for kind, path, digest in entry.get('reads', []):
+            if self._digest(kind, tuple(path)) != digest:
+                return None
+        self.current[rule_key] = entry
+        self.reused.append(rule_key)
+        return entry['result']
+
+    def _record(self, rule_key, source_digest, result, reads):
+        """Record the result of a rule that ran, with the digests of its reads."""
+        rule = self.rules_by_key[rule_key]
+        if not self.cache_path or not getattr(rule, 'cacheable', True):
+            return
+        try:
+            encoded = json.dumps(result)
+        except (TypeError, ValueError):
+            return
+        if repr(json.loads(encoded)) != repr(result):
+            return
+        self.current[rule_key] = {
+            'source': self._source_key(rule, source_digest),
+            'reads': [[kind, list(path), self._digest(kind, path)] for kind, path in reads],
+            'result': result,
+        }
+
+    def save(self):
+        """Write the recorded results, keeping entries of rules still on disk."""
+        if not self.cache_path:
+            return
+        entries = {
+            rule_key: entry for rule_key, entry in self.previous.items()
+            if rule_key not in self.current and os.path.isfile(rule_key.rsplit(':', 1)[0])
+        }
+        entries.update(self.current)
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({'version': CACHE_VERSION, 'rules': entries}, cache_file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as error:
+            display.warning(f"Unable to write rule cache {self.cache_path}: {error}")
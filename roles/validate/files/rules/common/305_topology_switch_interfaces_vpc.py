@@ -1,5 +1,7 @@
 import re
 
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.rule_support import VpcPeerIndex, normalize_interface_name
+
 
 class Rule:
     id = "305"
@@ -9,7 +11,7 @@ class Rule:
     # Check if vPC interfaces are compliant with vPC configuration requirements
     @classmethod
     def match(cls, data_model):
-        # initialize results list, vpc_interfaces_dict and vpc_interfaces_dict_parameters dictionaries, vpc_params_to_match list and vpc_peers_list
+        # initialize results list, vpc_interfaces_dict and vpc_interfaces_dict_parameters dictionaries, vpc_params_to_match list and vpc_peers index
         results = []
         vpc_interfaces_dict = {}
         vpc_interfaces_dict_parameters = {}
@@ -20,7 +22,7 @@ class Rule:
             "spanning_tree_portfast",
             "pc_mode",
         ]
-        vpc_peers_list = cls.get_vpc_peers(data_model)
+        vpc_peers = VpcPeerIndex(cls.get_vpc_peers(data_model))
         # Check if fabric topology switches are defined
         switches = []
         if data_model.get("vxlan", None):
@@ -31,22 +33,17 @@ class Rule:
             switch_name = switch["name"]
             # Check if interfaces are defined
             if switch.get("interfaces"):
-                vpc_ids = []
+                vpc_ids = set()
                 # Iterate through interfaces
                 for interface in switch.get("interfaces"):
                     # Normalize interface name
-                    interface_name = cls.normalize_interface_name(interface.get("name"))
+                    interface_name = normalize_interface_name(interface.get("name"))
                     # Check if vPC id is defined
                     if interface.get("vpc_id"):
                         vpc_id = interface.get("vpc_id")
 
                         # Check if switch is part of a vPC peer group
-                        is_peer = False
-                        for pairs in vpc_peers_list:
-                            if switch_name in pairs:
-                                is_peer = True
-                                break
-                        if not is_peer:
+                        if switch_name not in vpc_peers:
                             results.append(
                                 f"Switch {switch_name} is not part of a vPC peer group but "
                                 f"has vPC id {vpc_id} defined on interface {interface_name}."
@@ -72,7 +69,7 @@ class Rule:
                                 f"vpc_id : {vpc_id} is referenced by more than 1 Port-channel on switch {switch_name}"
                             )
                         else:
-                            vpc_ids.append(vpc_id)
+                            vpc_ids.add(vpc_id)
                         # create vpc_interfaces_dict in below format
                         #   {
                         #   "45": {
@@ -146,7 +143,12 @@ class Rule:
 
         for vpc_id, switch_interfaces in vpc_interfaces_dict.items():
             # Check if vPC id is referenced by more than 2 switches
-            for pairs in vpc_peers_list:
+            # Only the vPC pairs of the switches referencing the vPC id can match, visited in vpc_peers order
+            positions = set()
+            for switch in switch_interfaces:
+                positions.update(vpc_peers.pairs_by_switch.get(switch, []))
+            for position in sorted(positions):
+                pairs = vpc_peers.pairs[position]
                 switch_interfaces_pair = {}
                 for pair in pairs:
                     if pair in switch_interfaces:
@@ -176,54 +178,11 @@ class Rule:
                         )
         return results
 
-    # Normalize interface name
-    @classmethod
-    def normalize_interface_name(cls, interface_name):
-        # Replace 'eth' or 'e' followed by digits with 'Ethernet' followed by the same digits
-        interface_name = re.sub(
-            r"(?i)^(?:e|eth(?:ernet)?)(\d(?:\/\d+){1,2})$",
-            r"Ethernet\1",
-            interface_name,
-            flags=re.IGNORECASE,
-        )
-
-        # Replace 'Po' followed by digits with 'Port-channel' followed by the same digits
-        interface_name = re.sub(
-            r"(?i)^(po|port-channel)([1-9]|[1-9][0-9]{1,3}|[1-3][0-9]{3}|40([0-8][0-9]|9[0-6]))$",
-            r"Port-channel\2",
-            interface_name,
-            flags=re.IGNORECASE,
-        )
-
-        # Replace 'eth' or 'e' followed by digits with 'Ethernet' followed by the same digits (for sub interface)
-        interface_name = re.sub(
-            r"(?i)^(?:e|eth(?:ernet)?)(\d(?:\/\d+){1,2}\.\d{1,4})$",
-            r"Ethernet\1",
-            interface_name,
-            flags=re.IGNORECASE,
-        )
-
-        # Replace 'Lo' or 'Loopback' followed by digits with 'Loopback' followed by the same digits
-        interface_name = re.sub(
-            r"(?i)^(lo|loopback)([0-9]|[1-9][0-9]{1,2}|10[0-1][0-9]|102[0-3])$",
-            r"Loopback\2",
-            interface_name,
-            flags=re.IGNORECASE,
-        )
-
-        return interface_name
-
-    # Get vpc pairs from fabric topology vpc_peers
+    # Get vpc_peers entries from fabric topology
     @classmethod
     def get_vpc_peers(cls, data_model):
-        vpc_peers_list = []
         if data_model.get("vxlan", None):
             if data_model["vxlan"].get("topology", None):
                 if data_model.get("vxlan").get("topology").get("vpc_peers", None):
-                    for vpc_peers in (
-                        data_model.get("vxlan").get("topology").get("vpc_peers")
-                    ):
-                        vpc_peers_list.append(
-                            sorted([vpc_peers.get("peer1"), vpc_peers.get("peer2")])
-                        )
-        return vpc_peers_list
+                    return data_model.get("vxlan").get("topology").get("vpc_peers")
+        return []
@@ -1,3 +1,6 @@
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.rule_support import names
+
+
 class Rule:
     id = "306"
     description = "Verify a vPC peer exists in the topology switches inventory"
@@ -22,20 +25,21 @@ class Rule:
         else:
             vpc_range = "1-1000"
         vpc_range_split = vpc_range.split("-")
-        vpc_domain_list = []
+        vpc_domain_list = set()
 
         vpc_peers_keys = ['vxlan', 'topology', 'vpc_peers']
         dm_check = cls.data_model_key_check(data_model, vpc_peers_keys)
         if 'vpc_peers' in dm_check['keys_found'] and 'vpc_peers' in dm_check['keys_data']:
             vpc_peers_pairs = data_model['vxlan']['topology']['vpc_peers']
+            switch_names = names(switches)
             for vpc_peers_pair in vpc_peers_pairs:
-                if any(sw['name'] == vpc_peers_pair['peer1'] for sw in switches):
+                if vpc_peers_pair['peer1'] in switch_names:
                     pass
                 else:
                     results.append(
                         f"vxlan.topology.vpc_peers switch {vpc_peers_pair['peer1']} not found in the topology inventory."
                     )
-                if any(sw['name'] == vpc_peers_pair['peer2'] for sw in switches):
+                if vpc_peers_pair['peer2'] in switch_names:
                     pass
                 else:
                     results.append(
@@ -51,7 +55,7 @@ class Rule:
                         )
 
                     if vpc_peers_pair['domain_id'] not in vpc_domain_list:
-                        vpc_domain_list.append(vpc_peers_pair['domain_id'])
+                        vpc_domain_list.add(vpc_peers_pair['domain_id'])
                     else:
                         results.append(
                             f"vxlan.topology.vpc_peers Domain ID {vpc_peers_pair['domain_id']} is duplicated.")
@@ -1,3 +1,6 @@
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.rule_support import names
+
+
 class Rule:
     id = "311"
     description = "Verify edge connections have valid source devices and interfaces"
@@ -23,8 +26,8 @@ class Rule:
         else:
             return results
 
-        # Build a list of valid switch names
-        valid_switch_names = [switch.get("name") for switch in switches if switch.get("name")]
+        # Build a set of valid switch names
+        valid_switch_names = names(switches)
 
         for edge_connection in edge_connections:
             source_device = edge_connection.get("source_device", "")
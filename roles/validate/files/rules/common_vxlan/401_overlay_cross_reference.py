@@ -1,3 +1,6 @@
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.rule_support import SwitchIndex, VpcPeerIndex, names
+
+
 class Rule:
     id = "401"
     description = "Verify VRFs and Networks cross reference items"
@@ -104,11 +107,9 @@ class Rule:
         if not sm_vrfs or not sm_networks:
             return results
 
-        vrf_names = []
-        for vrf in sm_vrfs:
-            vrf_names.append(vrf.get("name"))
-        # Compare the two lists and generate an error message if a network is found
-        # in network_vrf_names that is not in vrf_names
+        vrf_names = names(sm_vrfs)
+        # Generate an error message if a network is found referencing a VRF
+        # that is not in vrf_names
         for net in sm_networks:
             if net.get("vrf_name") is not None:
                 if net.get("vrf_name") not in vrf_names:
@@ -123,15 +124,15 @@ class Rule:
     @classmethod
     def cross_reference_switches(cls, attach_groups, switches, target, results):
         # target is either vrf or network
+        # hostname may be the switch name or its management IPv4/IPv6 address
+        switch_index = SwitchIndex(switches)
         for attach_group in attach_groups:
             for switch in attach_group.get("switches"):
                 if switch.get("hostname"):
-                    if not any(s.get("name") == switch.get("hostname") for s in switches):
-                        if not any(s.get('management').get('management_ipv4_address') == switch.get("hostname") for s in switches):
-                            if not any(s.get('management').get('management_ipv6_address') == switch.get("hostname") for s in switches):
-                                ag = attach_group.get("name")
-                                hn = switch.get("hostname")
-                                results.append(f"{target} attach group {ag} hostname {hn} does not match any switch in the topology.")
+                    if switch.get("hostname") not in switch_index:
+                        ag = attach_group.get("name")
+                        hn = switch.get("hostname")
+                        results.append(f"{target} attach group {ag} hostname {hn} does not match any switch in the topology.")
 
         return results
 
@@ -146,14 +147,8 @@ class Rule:
         if not attach_groups or not vpc_peers:
             return results
 
-        # Build a mapping of vPC peers: hostname -> peer_hostname
-        vpc_peer_mapping = {}
-        for vpc_pair in vpc_peers:
-            peer1 = vpc_pair.get('peer1')
-            peer2 = vpc_pair.get('peer2')
-            if peer1 and peer2:
-                vpc_peer_mapping[peer1] = peer2
-                vpc_peer_mapping[peer2] = peer1
+        # Mapping of vPC peers: hostname -> peer_hostname
+        vpc_peer_mapping = VpcPeerIndex(vpc_peers).peer_of
 
         # Check each attach group
         for attach_group in attach_groups:
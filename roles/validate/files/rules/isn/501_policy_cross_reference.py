@@ -1,3 +1,6 @@
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.rule_support import SwitchIndex, names
+
+
 class Rule:
     id = "501"
     description = "Verify policy cross reference between policies, groups, and switches"
@@ -40,10 +43,11 @@ class Rule:
 
                 if data_model["vxlan"].get("policy").get("groups", None):
                     groups = data_model["vxlan"]["policy"]["groups"]
+                    policy_names = names(policies)
                     for group in groups:
                         group_policies = group.get("policies", [])
                         for group_policy in group_policies:
-                            if not any(policy['name'] == group_policy['name'] for policy in policies):
+                            if group_policy['name'] not in policy_names:
                                 results.append(
                                     f"Policy name {group_policy['name']} is defined in a group and must be defined in the policies section."
                                 )
@@ -56,12 +60,11 @@ class Rule:
                         if data_model["vxlan"].get("topology"):
                             if data_model.get("vxlan").get("topology").get("switches"):
                                 topology_switches = data_model.get("vxlan").get("topology").get("switches")
+                    # Switches may be referenced by name or management IPv4/IPv6 address
+                    switch_index = SwitchIndex(topology_switches)
+                    group_names = names(groups)
                     for switch in switches:
-                        if not ((any(topology_switch['name'] == switch['name'] for topology_switch in topology_switches)) or
-                                (any(topology_switch['management'].get('management_ipv4_address', None) == switch['name']
-                                     for topology_switch in topology_switches)) or
-                                (any(topology_switch['management'].get('management_ipv6_address', None) == switch['name']
-                                     for topology_switch in topology_switches))):
+                        if switch['name'] not in switch_index:
                             results.append(
                                 f"Switch name {switch['name']} is defined and must be defined in the topology switches section."
                             )
@@ -69,12 +72,10 @@ class Rule:
 
                         switch_groups = switch.get("groups", [])
                         for switch_group in switch_groups:
-                            for group in groups:
-                                if not (any(group['name'] == switch_group for group in groups)):
-                                    results.append(
-                                        f"Policy group name {switch_group} is defined for switch {switch['name']} and "
-                                        "must be defined in the policy groups section."
-                                    )
-                                    break
+                            if groups and switch_group not in group_names:
+                                results.append(
+                                    f"Policy group name {switch_group} is defined for switch {switch['name']} and "
+                                    "must be defined in the policy groups section."
+                                )
 
         return results
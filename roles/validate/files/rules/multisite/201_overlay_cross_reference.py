@@ -1,3 +1,6 @@
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.rule_support import names
+
+
 class Rule:
     id = "201"
     description = "Verify VRFs and Networks cross reference items"
@@ -61,11 +64,9 @@ class Rule:
         if not sm_vrfs or not sm_networks:
             return results
 
-        vrf_names = []
-        for vrf in sm_vrfs:
-            vrf_names.append(vrf.get("name"))
-        # Compare the two lists and generate an error message if a network is found
-        # in network_vrf_names that is not in vrf_names
+        vrf_names = names(sm_vrfs)
+        # Generate an error message if a network is found referencing a VRF
+        # that is not in vrf_names
         for net in sm_networks:
             if net.get("vrf_name") is not None:
                 if net.get("vrf_name") not in vrf_names:
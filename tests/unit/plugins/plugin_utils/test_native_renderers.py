@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+
+"""
+Unit tests comparing the native renderers with their dtc/common templates.
+
+Each integration example is filled in the way test_update_data_model.yml
+does and prepared with the prepare_service_model plugins as a fabric of every
+type that has native renderers. Every resource with a native renderer for
+that fabric type is then rendered through its template and natively; the
+parsed template output and the native data must be equal.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+import types
+from unittest import mock
+
+import pytest
+import yaml
+
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.action import ActionBase
+from ansible.template import Templar
+from nac_yaml.yaml import load_yaml_files
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.action.common.prepare_plugins import prep_002_global
+from ansible_collections.cisco.nac_dc_vxlan.plugins.action.common.prepare_service_model import ActionModule as PrepareServiceModel
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils import native_renderers
+
+COLLECTION_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+EXAMPLES_PATH = os.path.join(COLLECTION_PATH, 'tests', 'integration', 'host_vars', 'examples')
+TEMPLATES_PATH = os.path.join(COLLECTION_PATH, 'roles', 'dtc', 'common', 'templates')
+
+# Values of the << placeholders >> of the examples (see fabric_vars_example.yml)
+SWITCHES = ('spine1', 'spine2', 'leaf1', 'leaf2', 'leaf3', 'leaf4', 'border', 'border_gateway', 'border_spine')
+FABRIC_VARS = {'default_gateway_v4': '10.10.0.1'}
+for number, switch in enumerate(SWITCHES, 1):
+    FABRIC_VARS[f'{switch}_hostname'] = f'netascode-{switch.replace("_", "-")}'
+    FABRIC_VARS[f'{switch}_serial'] = f'SN{number:08d}'
+    FABRIC_VARS[f'{switch}_ip'] = f'10.10.0.{number + 10}'
+PLACEHOLDER_PATTERN = re.compile(r'<< (\w+) >>')
+# Attach groups of the examples still name switches by IP; the data model expects their hostname
+ATTACH_HOSTNAME_PATTERN = re.compile(r'hostname: << (\w+)_ip >>')
+
+EXAMPLES = sorted(os.listdir(EXAMPLES_PATH))
+
+# (fabric_type, name, template, renderer) of every resource built natively for a fabric type
+with open(os.path.join(COLLECTION_PATH, 'resources', 'resource_types.yml')) as resource_types_file:
+    RESOURCES = [
+        (fabric_type, name, resource['template'], resource['renderer'])
+        for name, resource in yaml.safe_load(resource_types_file)['resource_types'].items()
+        if resource.get('renderer')
+        for fabric_type in resource.get('fabric_types', [])
+        if fabric_type not in resource.get('template_overrides', {})
+    ]
+
+with open(os.path.join(COLLECTION_PATH, 'roles', 'validate', 'files', 'defaults.yml')) as defaults_file:
+    DEFAULTS = yaml.safe_load(defaults_file)['factory_defaults']
+
+_prepared = {}
+
+
+def _load_example(example, fabric_type, directory):
+    """Load an example with its placeholders replaced, like test_update_data_model.yml."""
+    fabric_vars = dict(FABRIC_VARS, fabric_name=example)
+    for file_name in os.listdir(os.path.join(EXAMPLES_PATH, example)):
+        with open(os.path.join(EXAMPLES_PATH, example, file_name)) as source:
+            content = ATTACH_HOSTNAME_PATTERN.sub(r'hostname: << \1_hostname >>', source.read())
+            content = PLACEHOLDER_PATTERN.sub(lambda match: fabric_vars[match.group(1)], content)
+        with open(os.path.join(directory, file_name), 'w') as target:
+            target.write(content)
+    data_model = load_yaml_files([str(directory)])
+    # The examples predate vxlan.fabric and leave the fabric type to the inventory
+    data_model['vxlan']['fabric'] = {'name': example, 'type': fabric_type}
+    return data_model
+
+
+@pytest.fixture(scope='module')
+def example_path(tmp_path_factory):
+    return lambda example: tmp_path_factory.mktemp(example)
+
+
+def _task_vars(example, fabric_type, example_path):
+    """Prepare the data model of an example once per fabric type, like the validate role does."""
+    if (example, fabric_type) not in _prepared:
+        data_model = _load_example(example, fabric_type, example_path(example))
+
+        action = PrepareServiceModel.__new__(PrepareServiceModel)
+        action._task = types.SimpleNamespace(args={
+            'inventory_hostname': example,
+            'hostvars': {example: {}},
+            'data_model': data_model,
+            'default_values': DEFAULTS,
+            'templates_path': TEMPLATES_PATH + '/',
+        })
+        # prep_002_global extends its module level parent keys on every run; a
+        # worker process prepares a single fabric, this one prepares several
+        with mock.patch.object(ActionBase, 'run', return_value={}), \
+                mock.patch.object(prep_002_global, 'PARENT_KEYS', list(prep_002_global.PARENT_KEYS)), \
+                mock.patch.object(prep_002_global, 'ISN_PARENT_KEYS', list(prep_002_global.ISN_PARENT_KEYS)):
+            results = action.run(task_vars={'template_bytecode_cache': False})
+        assert not results['failed'], results['msg']
+
+        _prepared[example, fabric_type] = {
+            'data_model_extended': results['model_extended'],
+            'defaults': DEFAULTS,
+            'omit': '__omit_place_holder__test',
+            'ndfc_version': '12.2.2',
+        }
+    return _prepared[example, fabric_type]
+
+
+def _render_template(template, task_vars):
+    templar = Templar(loader=DataLoader(), variables=task_vars)
+    templar.environment.loader.searchpath = [TEMPLATES_PATH]
+    with open(os.path.join(TEMPLATES_PATH, template)) as template_file:
+        rendered = templar.template(template_file.read(), preserve_trailing_newlines=True, convert_data=False)
+    return yaml.safe_load(rendered) or []
+
+
+@pytest.mark.parametrize('example', EXAMPLES)
+@pytest.mark.parametrize(
+    'fabric_type, name, template, renderer', RESOURCES,
+    ids=[f'{resource[0]}-{resource[1]}' for resource in RESOURCES],
+)
+def test_native_render_matches_template(example_path, example, fabric_type, name, template, renderer):
+    task_vars = _task_vars(example, fabric_type, example_path)
+    try:
+        expected = _render_template(template, task_vars)
+    except Exception:
+        # The template reports the error: the renderer must fall back to it
+        with pytest.raises(Exception):
+            native_renderers.render(renderer, task_vars)
+        return
+
+    try:
+        actual = native_renderers.render(renderer, task_vars)
+    except native_renderers.NativeRenderUnsupported as unsupported:
+        pytest.skip(f"{name} falls back to {template}: {unsupported}")
+
+    assert native_renderers.first_difference(expected, actual) is None
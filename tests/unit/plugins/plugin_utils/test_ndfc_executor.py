@@ -0,0 +1,131 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+
+"""
+Unit tests for NdfcModuleExecutor module serialization and cache invalidation.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import tempfile
+import threading
+import time
+
+import pytest
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.controller_cache import ControllerResponseCache
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+
+FABRIC_PATH = '/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/fabric1'
+
+
+class FakeActionModule:
+    """Stands in for an ActionModule; records module calls and their overlap."""
+
+    def __init__(self, on_execute=None):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.on_execute = on_execute
+        self._lock = threading.Lock()
+
+    def _execute_module(self, module_name, module_args, task_vars, tmp):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append((module_name, module_args))
+        time.sleep(0.01)
+        if self.on_execute is not None:
+            self.on_execute()
+        with self._lock:
+            self.active -= 1
+        return {'changed': False, 'response': {'RETURN_CODE': 200, 'DATA': {'calls': len(self.calls)}}}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    ControllerResponseCache.clear()
+    yield
+    ControllerResponseCache.clear()
+
+
+def test_module_executions_are_serialized_across_executors():
+    action = FakeActionModule()
+    executors = [NdfcModuleExecutor(action, {}) for _index in range(2)]
+    threads = [
+        threading.Thread(target=executors[index % 2].execute_rest, args=('GET', f'/path/{index}'))
+        for index in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(action.calls) == 6
+    assert action.max_active == 1
+    assert executors[0].max_concurrency(4) == 1
+
+
+def test_write_invalidates_cache_after_the_module_completes():
+    task_vars = {'ndfc_rest_cache_ttl': 60}
+    reader = NdfcModuleExecutor(FakeActionModule(), task_vars)
+    before = reader.execute_rest('GET', FABRIC_PATH)
+
+    # A GET that lands while the write is running must not survive the write
+    action = FakeActionModule(on_execute=lambda: reader.execute_rest('GET', FABRIC_PATH, use_cache=False))
+    NdfcModuleExecutor(action, task_vars).execute('cisco.dcnm.dcnm_links', 'merged', [], 'fabric1')
+
+    assert reader.cache.get('GET', FABRIC_PATH) is None
+    after = reader.execute_rest('GET', FABRIC_PATH)
+    assert after is not before
+    assert len(reader.action_module.calls) == 3
+
+
+def test_query_does_not_invalidate_cache():
+    task_vars = {'ndfc_rest_cache_ttl': 60}
+    executor = NdfcModuleExecutor(FakeActionModule(), task_vars)
+    executor.execute_rest('GET', FABRIC_PATH)
+    executor.execute('cisco.dcnm.dcnm_links', 'query', [], 'fabric1')
+
+    assert executor.cache.get('GET', FABRIC_PATH) is not None
+
+
+@pytest.mark.parametrize('scope', ['task', 'run'])
+def test_cache_entries_are_kept_per_controller(scope, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    task_vars = {'ndfc_rest_cache_ttl': 60, 'ndfc_rest_cache_scope': scope}
+    first = NdfcModuleExecutor(FakeActionModule(), dict(task_vars, ansible_host='nd1', ansible_user='admin'))
+    second = NdfcModuleExecutor(FakeActionModule(), dict(task_vars, ansible_host='nd2', ansible_user='admin'))
+    first.execute_rest('GET', FABRIC_PATH)
+
+    if scope == 'run':
+        # Entries persisted by another task are found in the run directory
+        ControllerResponseCache.clear()
+    assert first.cache.get('GET', FABRIC_PATH) is not None
+    assert second.cache.get('GET', FABRIC_PATH) is None
+
+    second.execute_rest('GET', FABRIC_PATH)
+    second.execute('cisco.dcnm.dcnm_links', 'merged', [], 'fabric1')
+    assert second.cache.get('GET', FABRIC_PATH) is None
+    assert first.cache.get('GET', FABRIC_PATH) is not None
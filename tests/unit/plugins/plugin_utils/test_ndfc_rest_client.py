@@ -0,0 +1,244 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for NdfcRestClient against a stub Nexus Dashboard HTTP server.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_rest_client import NdfcRestClient
+
+
+class StubController(ThreadingHTTPServer):
+    """Records logins, requests and the client port of every connection."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super(StubController, self).__init__(('127.0.0.1', 0), StubHandler)
+        self.logins = 0
+        self.requests = []
+        self.connections = set()
+        self.valid_tokens = set()
+        self.lock = threading.Lock()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, data, close=False):
+        body = json.dumps(data).encode() if data is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if close:
+            # Drop the connection without announcing it, like an idle
+            # keep-alive timeout on the controller
+            self.close_connection = True
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        with server.lock:
+            server.connections.add(self.client_address[1])
+            server.requests.append((self.command, self.path))
+
+        if self.path == '/login':
+            with server.lock:
+                server.logins += 1
+                token = f'token-{server.logins}'
+                server.valid_tokens.add(token)
+            credentials = json.loads(body)
+            if credentials.get('userPasswd') != 'secret':
+                return self._reply(401, {'error': 'bad credentials'})
+            return self._reply(200, {'jwttoken': token})
+
+        token = (self.headers.get('Authorization') or '').replace('Bearer ', '')
+        if token not in server.valid_tokens:
+            return self._reply(401, {'error': 'unauthorized'})
+
+        if self.path.startswith('/error'):
+            return self._reply(500, {'message': 'internal error'})
+        if self.path.startswith('/missing'):
+            return self._reply(404, {'message': 'not found'})
+        if self.path.startswith('/text'):
+            body = b'plain text'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return None
+        return self._reply(200, {'path': self.path, 'method': self.command},
+                           close=self.path.startswith('/drop'))
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+@pytest.fixture
+def controller():
+    server = StubController()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, password='secret'):
+    return NdfcRestClient(
+        '127.0.0.1', 'admin', password, port=server.server_address[1], use_ssl=False, timeout=5,
+    )
+
+
+def _requests(server, method, path):
+    return [request for request in server.requests if request == (method, path)]
+
+
+def test_keep_alive_connection_is_reused(controller):
+    client = _client(controller)
+    for index in range(5):
+        result = client.request('GET', f'/fabrics/{index}')
+        assert result['response']['DATA'] == {'path': f'/fabrics/{index}', 'method': 'GET'}
+    client.close()
+
+    assert len(controller.connections) == 1
+    assert len(controller.requests) == 6  # one login and five GETs
+
+
+def test_token_is_cached_and_refreshed_on_401(controller):
+    client = _client(controller)
+    client.request('GET', '/a')
+    client.request('GET', '/b')
+    assert controller.logins == 1
+
+    # The controller forgets the token: the next request logs in once more
+    controller.valid_tokens.clear()
+    result = client.request('GET', '/c')
+    client.close()
+
+    assert result['response']['RETURN_CODE'] == 200
+    assert controller.logins == 2
+    assert len(_requests(controller, 'GET', '/c')) == 2
+
+
+def test_error_statuses_map_to_dcnm_rest_failures(controller):
+    client = _client(controller)
+    result = client.request('POST', '/error', json_data={'key': 'value'})
+    missing = client.request('DELETE', '/missing')
+    text = client.request('GET', '/text')
+    client.close()
+
+    assert result == {
+        'changed': False,
+        'failed': True,
+        'msg': {
+            'RETURN_CODE': 500,
+            'METHOD': 'POST',
+            'REQUEST_PATH': '/error',
+            'MESSAGE': 'Internal Server Error',
+            'DATA': {'message': 'internal error'},
+        },
+    }
+    assert missing['failed'] and missing['msg']['RETURN_CODE'] == 404
+    assert text['response']['DATA'] == 'plain text'
+
+
+def test_login_failure_and_unreachable_controller_map_to_failures(controller):
+    result = _client(controller, password='wrong').request('GET', '/a')
+    assert result['failed']
+    assert result['msg']['RETURN_CODE'] == -1
+    assert 'login failed' in result['msg']['MESSAGE']
+
+    # Nothing listens on a port that was just released
+    probe = socket.socket()
+    probe.bind(('127.0.0.1', 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    unreachable = NdfcRestClient('127.0.0.1', 'admin', 'secret', port=port, use_ssl=False, timeout=2)
+    result = unreachable.request('GET', '/a')
+    assert result['failed'] and result['msg']['RETURN_CODE'] == -1
+
+
+def test_get_is_retried_on_stale_keep_alive_connection(controller):
+    client = _client(controller)
+    client.request('GET', '/drop')
+    result = client.request('GET', '/after')
+    client.close()
+
+    assert result['response']['RETURN_CODE'] == 200
+    assert len(_requests(controller, 'GET', '/after')) == 1
+    assert len(controller.connections) == 2
+
+
+def test_write_is_not_resent_on_stale_keep_alive_connection(controller):
+    client = _client(controller)
+    client.request('GET', '/drop')
+    result = client.request('POST', '/after', json_data={'key': 'value'})
+    client.close()
+
+    assert result['failed']
+    assert result['msg']['RETURN_CODE'] == -1
+    assert not _requests(controller, 'POST', '/after')
+
+
+def test_shared_client_is_reused_per_controller_user():
+    try:
+        first = NdfcRestClient.get_shared('10.0.0.1', 'admin', 'secret', use_ssl=False)
+        assert NdfcRestClient.get_shared('10.0.0.1', 'admin', 'secret', use_ssl=False) is first
+        assert NdfcRestClient.get_shared('10.0.0.1', 'other', 'secret', use_ssl=False) is not first
+        assert NdfcRestClient.get_shared('10.0.0.1', 'admin', 'changed', use_ssl=False) is not first
+    finally:
+        NdfcRestClient.close_shared()
+
+
+def test_connection_settings_default_like_httpapi():
+    task_vars = {'ansible_host': '10.0.0.1', 'ansible_user': 'admin', 'ansible_password': 'secret'}
+    try:
+        client = NdfcRestClient.from_task_vars(task_vars)
+        assert client.use_ssl and client.validate_certs
+        assert client.timeout == 30
+
+        client = NdfcRestClient.from_task_vars(dict(task_vars, ansible_command_timeout=1000))
+        assert client.timeout == 1000
+
+        client = NdfcRestClient.from_task_vars(dict(
+            task_vars, ansible_command_timeout=1000, ndfc_rest_timeout=60, ansible_httpapi_validate_certs='false',
+        ))
+        assert client.timeout == 60
+        assert not client.validate_certs
+    finally:
+        NdfcRestClient.close_shared()
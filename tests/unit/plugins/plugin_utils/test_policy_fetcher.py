@@ -0,0 +1,80 @@
+# Copyright (c) 2026 Cisco Systems, Inc. and its affiliates
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+
+"""
+Unit tests for PolicyFetcher chunking and worker sizing.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import time
+
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.ndfc_executor import NdfcModuleExecutor
+from ansible_collections.cisco.nac_dc_vxlan.plugins.plugin_utils.policy_fetcher import PolicyFetcher
+
+
+class PolicyActionModule:
+    """Answers dcnm_rest policy queries with one policy per serial number."""
+
+    def __init__(self):
+        self.paths = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _execute_module(self, module_name, module_args, task_vars, tmp):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.paths.append(module_args['path'])
+        time.sleep(0.01)
+        serials = module_args['path'].split('serialNumber=')[1].split(',')
+        with self._lock:
+            self.active -= 1
+        return {'response': {'RETURN_CODE': 200, 'DATA': [
+            {'serialNumber': serial, 'description': f'policy {serial}'} for serial in serials
+        ]}}
+
+
+def test_chunks_are_fetched_serially_over_dcnm_rest():
+    action = PolicyActionModule()
+    executor = NdfcModuleExecutor(action, {'policy_fetch_chunk_size': 2, 'policy_fetch_workers': 4})
+    serials = [f'SN{index}' for index in range(7)] + ['SN0', '']
+
+    index = PolicyFetcher(executor, 'fabric1').fetch(serials)
+
+    assert len(action.paths) == 4
+    assert action.max_active == 1
+    assert len(index) == 7
+    assert [policy['serialNumber'] for policy in index.policies] == [f'SN{index}' for index in range(7)]
+
+
+def test_predicate_filters_policies():
+    executor = NdfcModuleExecutor(PolicyActionModule(), {})
+    index = PolicyFetcher(executor, 'fabric1').fetch(
+        ['SN1', 'SN2'], predicate=lambda policy: policy['serialNumber'] == 'SN2'
+    )
+
+    assert [policy['serialNumber'] for policy in index.policies] == ['SN2']